@@ -0,0 +1,84 @@
+from copy import copy
+
+from openpyxl.formula.translate import Translator
+from openpyxl.utils import get_column_letter
+
+# 보고서 템플릿에는 시스템 1대분 영역만 있으므로, 점검 시스템 수만큼 영역을 복제하여 시트 크기를 맞춤
+# (기존 Excel 매크로 Module1.C_P, Module2.C_P2 를 대체하며 Excel 없이 openpyxl 만으로 동작)
+# 각 영역의 위치는 make_excel_report 가 시스템별로 값을 기록하는 위치에서 정함
+# (매크로 원본(VBA)과 .xlsm 템플릿은 저장소에 없어 매크로 코드와 대조하지 못함,
+#  매크로 결과와의 비교는 tests/test_expand_template.py 의 test_matches_macro_golden 참고.
+#  그 비교가 통과하기 전까지 매크로 경로(runMecro.py, CCE_REPORT_MACRO=1)를 함께 유지)
+
+# 시트 이름: (첫 행, 시스템당 행 수, 시작 열, 끝 열) - 열이 None 이면 행 전체
+ROW_REGIONS = {
+    '보안 수준 통계': (9, 5, None, None),
+    '점검 대상(자산정보)': (5, 1, None, None),
+    '요약 통계': (28, 1, 16, 17),
+}
+
+# 시트 이름: (첫 열, 시작 행, 끝 행) - 항목별 통계는 시스템마다 한 열씩 사용
+COLUMN_REGIONS = {
+    '항목별 통계': (12, 4, 40),
+}
+
+
+def copy_cell(source, target):
+    # 값과 서식을 복사하며, 수식은 복사 위치에 맞게 상대 참조를 이동
+    value = source.value
+    if isinstance(value, str) and value.startswith('='):
+        value = Translator(value, origin=source.coordinate).translate_formula(target.coordinate)
+    target.value = value
+    if source.has_style:
+        target._style = copy(source._style)
+
+
+def copy_rows(sheet, first_row, rows, target_row, min_col=None, max_col=None):
+    min_col = min_col or 1
+    max_col = max_col or sheet.max_column
+    offset = target_row - first_row
+
+    for row in range(first_row, first_row + rows):
+        for col in range(min_col, max_col + 1):
+            copy_cell(sheet.cell(row=row, column=col), sheet.cell(row=row + offset, column=col))
+        height = sheet.row_dimensions[row].height
+        if height is not None:
+            sheet.row_dimensions[row + offset].height = height
+
+    # 영역 안에 완전히 포함된 병합 셀도 같은 모양으로 병합
+    for merged in list(sheet.merged_cells.ranges):
+        if (merged.min_row >= first_row and merged.max_row < first_row + rows
+                and merged.min_col >= min_col and merged.max_col <= max_col):
+            sheet.merge_cells(start_row=merged.min_row + offset, start_column=merged.min_col,
+                              end_row=merged.max_row + offset, end_column=merged.max_col)
+
+
+def copy_column(sheet, first_col, min_row, max_row, target_col):
+    for row in range(min_row, max_row + 1):
+        copy_cell(sheet.cell(row=row, column=first_col), sheet.cell(row=row, column=target_col))
+
+    source = sheet.column_dimensions[get_column_letter(first_col)]
+    if source.width is not None:
+        sheet.column_dimensions[get_column_letter(target_col)].width = source.width
+
+
+def expand_template(excel, extra_systems):
+    """
+    Size the report template for 1 + extra_systems systems.
+
+    The per-system regions of the first system are copied (values, styles,
+    formulas, row heights, merged cells) once for every additional system.
+    """
+    for name, (first_row, rows, min_col, max_col) in ROW_REGIONS.items():
+        if name not in excel.sheetnames:
+            continue
+        sheet = excel[name]
+        for n in range(1, extra_systems + 1):
+            copy_rows(sheet, first_row, rows, first_row + n * rows, min_col, max_col)
+
+    for name, (first_col, min_row, max_row) in COLUMN_REGIONS.items():
+        if name not in excel.sheetnames:
+            continue
+        sheet = excel[name]
+        for n in range(1, extra_systems + 1):
+            copy_column(sheet, first_col, min_row, max_row, first_col + n)
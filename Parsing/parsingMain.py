@@ -1,6 +1,11 @@
 import sys
 import os  # os 모듈 임포트
+import io
 import glob
+import json
+import pickle
+import tempfile
+import threading
 import chardet
 import pandas as pd
 from openpyxl import load_workbook
@@ -9,23 +14,125 @@ from openpyxl import load_workbook
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from .csvParsing import make_excel_report
 from .makechart import create_chart, make_col_chart
-from .runMecro import run_macro
+from .expandTemplate import expand_template
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE = os.path.join(script_dir, "취약점 진단 상세 보고서_0603.xlsm")
+
+# CCE_REPORT_MACRO=1 이면 expand_template 대신 기존 Excel 매크로로 템플릿 확장 (xlwings, Excel 필요)
+USE_MACRO_ENV = 'CCE_REPORT_MACRO'
+
+# JSON 점검 결과 코드 → 보고서 표기
+# 결과값이 없는 항목(status "N/A" 또는 result 2)과 알 수 없는 코드는 None 으로 둠
+# (CSV 경로에서 pandas 가 "N/A" 를 NaN 으로 읽는 것과 같이 make_excel_report 에서 "N/A" 로 표기)
+RESULT_TEXT = {0: "양호", 1: "취약", 3: "타임아웃"}
+NA_STATUS = "N/A"
+
+
+def json_result_status(item):
+    status = item.get('status') or RESULT_TEXT.get(item.get('result'))
+    return None if status == NA_STATUS else status
+
+# 보고서 템플릿 캐시 (템플릿 경로: (수정 시각, 파싱된 워크북 pickle, 파일 내용))
+_template_cache = {}
+_template_lock = threading.Lock()
+
+
+def load_template(excel_file):
+    """
+    Return a private in-memory copy of the report template workbook.
+
+    The template is parsed once per process (and again only when the file
+    changes) and kept as a pickle; each report unpickles its own copy, so
+    concurrent reports never touch the template file or re-parse it.
+    """
+    mtime = os.path.getmtime(excel_file)
+    with _template_lock:
+        cached = _template_cache.get(excel_file)
+        if cached is None or cached[0] != mtime:
+            with open(excel_file, 'rb') as f:
+                data = f.read()
+            try:
+                pickled = pickle.dumps(load_workbook(io.BytesIO(data)))
+            except (pickle.PicklingError, TypeError, AttributeError):
+                # pickle 할 수 없는 개체가 있으면 메모리의 파일 내용에서 다시 로드
+                pickled = None
+            cached = (mtime, pickled, data)
+            _template_cache[excel_file] = cached
+
+    if cached[1] is not None:
+        return pickle.loads(cached[1])
+    return load_workbook(io.BytesIO(cached[2]))
+
 
 def process_csv_files():
     # result 폴더 내의 모든 csv 파일 경로를 찾음
     csv_files = glob.glob('result/*.csv')
     print(csv_files)
 
-    print("점검 시스템 개수: " + str(len(csv_files)))
+    systems = []
+    for csv_file in csv_files:
+        with open(csv_file, 'rb') as f:
+            result = chardet.detect(f.read())
+            encoding = result['encoding']
+
+        # 두 번째 헤더를 사용하여 CSV 파일 읽기
+        csv_data = pd.read_csv(csv_file, encoding=encoding, header=0, quotechar='"', on_bad_lines='skip')
+
+        # csv 파일_구분 항목 추출
+        category = csv_data['구분']
+        code = csv_data['진단코드']
+        explanation = csv_data['진단항목']
+
+        systems.append({
+            'inspection_result': csv_data['점검결과'],
+            'detail': csv_data['시스템 실제 결과값'],
+            'solution': csv_data['상세설명 및 조치방안'],
+            'ip': category.iloc[-1],
+            'os_info': code.iloc[-1],
+            'name': explanation.iloc[-1],
+        })
+
+    return build_report(systems)
+
+
+def process_json_files():
+    # result 폴더 내의 모든 json 파일 경로를 찾음 (linux.sh 가 작성하는 대시보드 스키마)
+    json_files = glob.glob('result/*.json')
+    print(json_files)
+
+    systems = []
+    for json_file in json_files:
+        with open(json_file, encoding='utf-8') as f:
+            data = json.load(f)
+
+        items = data.get('result', [])
+        systems.append({
+            'inspection_result': pd.Series(
+                [json_result_status(item) for item in items],
+                dtype=object),
+            'detail': pd.Series([item.get('evidence', '') for item in items], dtype=object),
+            'solution': pd.Series([item.get('resultdetail', '') for item in items], dtype=object),
+            'ip': data.get('targetip', ''),
+            'os_info': data.get('osinfo', ''),
+            'name': os.path.splitext(os.path.basename(json_file))[0],
+        })
+
+    return build_report(systems)
+
+
+def build_report(systems):
+    print("점검 시스템 개수: " + str(len(systems)))
 
-    excel_file = os.path.join(script_dir, "취약점 진단 상세 보고서_0603.xlsm")
     result_file = '취약점 진단 상세 보고서_result.xlsx'
 
-    run_macro(excel_file, len(csv_files) - 1)
-    # 엑셀 로드
-    excel = load_workbook(excel_file)
+    # 메모리의 템플릿 복사본을 시스템 수에 맞게 확장 (템플릿 파일은 변경하지 않음)
+    if os.environ.get(USE_MACRO_ENV) == '1':
+        from .runMecro import load_macro_template
+        excel = load_macro_template(TEMPLATE_FILE, len(systems) - 1)
+    else:
+        excel = load_template(TEMPLATE_FILE)
+        expand_template(excel, len(systems) - 1)
 
 
     # 시스템별 점검 결과_시스템 번호(시트 번호)
@@ -40,25 +147,14 @@ def process_csv_files():
         else:
             return column[:-1] + chr(ord(column[-1]) + 1)  # 마지막 문자 다음 알파벳으로 업데이트
 
-    for csv_file in csv_files:
-        with open(csv_file, 'rb') as f:
-            result = chardet.detect(f.read())
-            encoding = result['encoding']
+    for system in systems:
+        inspection_result = system['inspection_result']
+        detail = system['detail']
+        solution = system['solution']
 
-        # 두 번째 헤더를 사용하여 CSV 파일 읽기
-        csv_data = pd.read_csv(csv_file, encoding=encoding, header=0, quotechar='"', on_bad_lines='skip')
-
-        # csv 파일_구분 항목 추출
-        category = csv_data['구분']
-        code = csv_data['진단코드']
-        explanation = csv_data['진단항목']
-        inspection_result = csv_data['점검결과']
-        detail = csv_data['시스템 실제 결과값']
-        solution = csv_data['상세설명 및 조치방안']
-
-        ip = category.iloc[-1]
-        os_info = code.iloc[-1]  # os라는 이름 대신 os_info로 변경
-        name = explanation.iloc[-1]
+        ip = system['ip']
+        os_info = system['os_info']  # os라는 이름 대신 os_info로 변경
+        name = system['name']
 
         # 엑셀 시트 지정
         system_result = excel['시스템 별 점검 결과']
@@ -67,15 +163,19 @@ def process_csv_files():
 
         create_chart(system_copied)
         make_excel_report(sheet_num, excel, result_file, system_copied, inspection_result, detail, solution,
-                          stats_column, ip, os_info, name, len(csv_files))  # os 대신 os_info 사용
+                          stats_column, ip, os_info, name)  # os 대신 os_info 사용
 
         print(f"{sheet_num}_번 시스템 결과 생성 완료")
         stats_column = next_column(stats_column)  # 다음 열로 업데이트
         sheet_num += 1
-    make_col_chart(len(csv_files), excel["요약 통계"], "V6", excel["보안 수준 통계"])
-    make_col_chart(len(csv_files), excel["요약 통계"], "H27", excel["요약 통계"])
-
-    excel.save(result_file)
+    make_col_chart(len(systems), excel["요약 통계"], "V6", excel["보안 수준 통계"])
+    make_col_chart(len(systems), excel["요약 통계"], "H27", excel["요약 통계"])
+
+    # 동시에 생성 중인 다른 보고서와 섞이지 않도록 임시 파일에 저장한 뒤 교체
+    fd, tmp_file = tempfile.mkstemp(suffix='.xlsx', dir=os.path.dirname(os.path.abspath(result_file)))
+    os.close(fd)
+    excel.save(tmp_file)
+    os.replace(tmp_file, result_file)
 
     print("모든 시스템 결과 생성 완료")
     return result_file
@@ -1,4 +1,14 @@
+import os
+import shutil
+import tempfile
+
 import xlwings as xw
+from openpyxl import load_workbook
+
+# 기존 Excel 매크로(Module1.C_P, Module2.C_P2)로 템플릿을 확장하는 경로
+# expand_template 이 매크로 결과(tests/golden/macro_*_systems.xlsm)와 일치하기 전까지
+# CCE_REPORT_MACRO=1 로 선택해서 사용 (xlwings 와 Excel 필요)
+
 
 def run_macro(excel_file,system_num):
 
@@ -11,3 +21,17 @@ def run_macro(excel_file,system_num):
         macro2(sheet_count_value)
         book.save()
         book.close()
+
+
+def load_macro_template(excel_file, system_num):
+    """
+    Return the report template sized for 1 + system_num systems by the macros.
+
+    The macros run on a temporary copy, so the template file itself is left
+    unchanged and concurrent reports do not share it.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        copied = os.path.join(temp_dir, os.path.basename(excel_file))
+        shutil.copyfile(excel_file, copied)
+        run_macro(copied, system_num)
+        return load_workbook(copied)
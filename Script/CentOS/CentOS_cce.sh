@@ -0,0 +1,952 @@
+#!/bin/bash
+# CentOS_cce.sh - CentOS/RHEL 취약점 점검 엔진 (U-01 ~ U-36)
+#
+# 점검에 필요한 설정 파일 내용, 파일 소유자/권한, 프로세스/서비스 목록, 파일시스템 정보를
+# 시작 시 한 번만 수집한 뒤 모든 점검을 같은 프로세스 안에서 스냅샷으로 판정하고,
+# 결과를 대시보드 JSON 스키마로 바로 출력한다 (Script/linux 의 linux_report_$USER.json 과 동일한 형식).
+#   {targetip, testedtime, osinfo, result: [{itemcode, title, importance, result, resultdetail, ...}]}
+#
+# 사용법
+#   CentOS_cce.sh           : /tmp/CentOS_<IP>.json 작성
+#   CentOS_cce.sh --stdout  : JSON 을 표준 출력으로 출력 (streamlined playbook)
+#                             become 의 pty 에서는 표준 오류가 섞이므로 JSON 앞뒤에
+#                             @@CCE_JSON_BEGIN@@ / @@CCE_JSON_END@@ 줄을 출력하고, 제어 노드는 그 사이만 읽음
+#
+# 환경 변수
+#   CCE_EVIDENCE_BUDGET : 항목별 결과값 최대 바이트 (기본값 4096, 0 이면 제한 없음)
+#                         잘린 결과값의 원본은 /tmp/CentOS_<IP>.evidence.tar.gz 에 <sha256>.txt 로 보관
+#   CCE_EVIDENCE_ARCHIVE: 원본 압축 파일 경로 (기본값 /tmp/CentOS_<IP>.evidence.tar.gz, 제어 노드가 회수 후 삭제)
+#
+# 결과 파일과 원본 압축 파일에는 설정 내용이 들어 있으므로 umask 077 로 소유자만 읽을 수 있게 생성한다.
+#   CCE_LOW_IMPACT      : 1 이면 저부하 모드 (CPU/IO 우선순위를 낮추고 파일시스템 순회 속도를 제한)
+#   CCE_WALK_RATE       : 초당 최대 순회 항목 수 (기본값 0: 제한 없음, 저부하 모드 기본값 5000)
+#   CCE_CHECK_TIMEOUT   : 점검별 제한 시간(초) (기본값 300, 0 이면 제한 없음)
+#   CCE_FS_INDEX_TIMEOUT: 파일시스템 순회 제한 시간(초) (기본값 CCE_CHECK_TIMEOUT)
+#
+# 제한 시간을 넘긴 점검은 하위 프로세스까지 중단하고 점검결과 "타임아웃"(result 3)으로 기록한다.
+# 파일시스템 순회가 제한 시간을 넘기면 그때까지 찾은 목록만 남기고, 이를 쓰는 U-07, U-14, U-16 을 타임아웃으로 기록한다.
+
+export LC_ALL=C
+umask 077
+
+HOST_IP=$(hostname -I 2>/dev/null | awk '{print $1}')
+JSON_FILE="/tmp/CentOS_${HOST_IP}.json"
+EVIDENCE_ARCHIVE=${CCE_EVIDENCE_ARCHIVE:-/tmp/CentOS_${HOST_IP}.evidence.tar.gz}
+EVIDENCE_BUDGET=${CCE_EVIDENCE_BUDGET:-4096}
+CHECK_TIMEOUT=${CCE_CHECK_TIMEOUT:-300}
+FS_INDEX_TIMEOUT=${CCE_FS_INDEX_TIMEOUT:-$CHECK_TIMEOUT}
+
+# --stdout: print the JSON between markers instead of writing it (streamlined playbook)
+STDOUT_MODE=0
+[ "$1" = "--stdout" ] && STDOUT_MODE=1
+
+# 저부하 모드: 운영 중인 서버를 업무 시간에 점검할 때 사용 (이후 실행되는 모든 명령에 적용)
+# IO 는 idle 클래스 대신 best-effort 최저 순위를 사용 (부하가 계속되는 DB 서버에서도 점검이 끝나도록)
+WALK_RATE=${CCE_WALK_RATE:-0}
+if [ "$CCE_LOW_IMPACT" = 1 ]; then
+    renice -n 19 -p $$ >/dev/null 2>&1
+    ionice -c 2 -n 7 -p $$ >/dev/null 2>&1
+    WALK_RATE=${CCE_WALK_RATE:-5000}
+fi
+
+WORK_DIR=$(mktemp -d /tmp/CentOS_cce.XXXXXX) || exit 1
+trap 'rm -rf "$WORK_DIR"' EXIT
+mkdir -p "$WORK_DIR/evidence"
+# 표준 출력 모드에서는 결과를 작업 디렉터리에 모은 뒤 마지막에 한 번에 출력 (점검 중 출력과 섞이지 않도록)
+[ $STDOUT_MODE = 1 ] && JSON_FILE="$WORK_DIR/result.json"
+
+# ---------------------------------------------------------------------------
+# 스냅샷 수집
+# ---------------------------------------------------------------------------
+
+# 설정 파일 내용 (점검 전체에서 공유, 파일마다 한 번만 읽음)
+declare -A CONF
+for f in /etc/passwd /etc/securetty /etc/ssh/sshd_config /etc/pam.d/system-auth /etc/pam.d/password-auth \
+         /etc/security/pwquality.conf /etc/security/faillock.conf /etc/login.defs \
+         /etc/hosts.allow /etc/hosts.deny /etc/hosts.equiv /etc/exports /etc/inetd.conf /etc/xinetd.conf \
+         /etc/mail/sendmail.cf /etc/named.conf /etc/vsftpd/vsftpd.conf /etc/vsftpd.conf \
+         /etc/proftpd/proftpd.conf /etc/proftpd.conf /etc/xinetd.d/*; do
+    [ -f "$f" ] && [ -r "$f" ] && CONF[$f]=$(<"$f")
+done
+
+# 로그인 가능한 계정의 홈 디렉터리 (passwd 스냅샷 기준)
+declare -A HOME_OF
+while IFS=: read -r user _ _ _ _ home shell; do
+    case $shell in
+        */nologin|*/false|*/sync|*/shutdown|*/halt) continue ;;
+    esac
+    [ -n "$home" ] && [ -d "$home" ] && HOME_OF[$user]=$home
+done <<< "${CONF[/etc/passwd]}"
+
+START_FILES=(.profile .cshrc .login .kshrc .bash_profile .bashrc .bash_login .exrc .netrc)
+CRON_FILES=(/etc/crontab /etc/cron.allow /etc/cron.deny /etc/at.allow /etc/at.deny /etc/cron.d
+            /etc/cron.hourly /etc/cron.daily /etc/cron.weekly /etc/cron.monthly /var/spool/cron)
+
+# 파일 소유자/권한 (stat 한 번으로 수집)
+declare -A MODE OWNER
+stat_targets=(/etc/passwd /etc/shadow /etc/hosts /etc/inetd.conf /etc/xinetd.conf /etc/rsyslog.conf
+              /etc/syslog.conf /etc/services /etc/hosts.equiv "${CRON_FILES[@]}")
+for user in "${!HOME_OF[@]}"; do
+    for f in "${START_FILES[@]}" .rhosts; do
+        stat_targets+=("${HOME_OF[$user]}/$f")
+    done
+done
+while read -r mode owner path; do
+    MODE[$path]=$mode
+    OWNER[$path]=$owner
+done < <(stat -c '%a %U %n' -- "${stat_targets[@]}" 2>/dev/null)
+
+# 실행 중인 프로세스 이름과 활성화된 서비스/소켓 (한 번만 조회)
+PROCS=$'\n'"$(ps -eo comm= 2>/dev/null)"$'\n'
+ENABLED_UNITS=$'\n'"$(systemctl list-unit-files --state=enabled --no-legend --no-pager 2>/dev/null | awk '{print $1}')"$'\n'
+
+# 하위 프로세스까지 중단 (중단하는 동안 새 자식 프로세스가 생기지 않도록 먼저 멈춤)
+kill_tree() {
+    local pid=$1 sig=$2 child
+    kill -STOP "$pid" 2>/dev/null
+    for child in $(ps -o pid= --ppid "$pid" 2>/dev/null); do
+        kill_tree "$child" "$sig"
+    done
+    kill -"$sig" "$pid" 2>/dev/null
+    kill -CONT "$pid" 2>/dev/null
+}
+
+# 명령을 서브셸에서 제한 시간 안에 실행 (인자: 제한시간 명령...)
+# 제한 시간을 넘기면 하위 프로세스까지 중단하고(TERM, 5초 후 KILL) 1 반환
+bounded() {
+    local limit=$1 pid watchdog=""
+    shift
+    rm -f "$WORK_DIR/timeout"
+    "$@" &
+    pid=$!
+    if [ "$limit" -gt 0 ] 2>/dev/null; then
+        (
+            sleep "$limit"
+            : > "$WORK_DIR/timeout"
+            kill_tree "$pid" TERM
+            sleep 5
+            kill_tree "$pid" KILL
+        ) &
+        watchdog=$!
+    fi
+    wait "$pid"
+    if [ -n "$watchdog" ]; then
+        kill_tree "$watchdog" KILL
+        wait "$watchdog" 2>/dev/null
+    fi
+    [ ! -f "$WORK_DIR/timeout" ]
+}
+
+# 파일시스템 1회 순회: 소유자 없는 파일, root 소유 SUID/SGID 파일, world writable 파일
+walk_fs() {
+    local fs_roots=() walk_throttle=()
+    mapfile -t fs_roots < <({ echo /; df -lP -x tmpfs -x devtmpfs -x squashfs 2>/dev/null | awk 'NR > 1 {print $6}'; } | sort -u)
+    # 순회 속도 제한: find 가 항목마다 출력하는 줄을 초당 WALK_RATE 개까지만 읽음 (파이프가 차면 find 가 멈춤)
+    [ "$WALK_RATE" -gt 0 ] 2>/dev/null && walk_throttle=(-printf '\n' ,)
+    find "${fs_roots[@]}" -xdev \( -path /proc -o -path /sys -o -path /dev -o -path /run \) -prune -o \
+        \( "${walk_throttle[@]}" \( \( -nouser -o -nogroup \) -fprint "$WORK_DIR/nouser" \) , \
+           \( -type f -user root \( -perm -4000 -o -perm -2000 \) -fprint "$WORK_DIR/suid" \) , \
+           \( -type f -perm -2 ! -path '/usr/local/*' -fprint "$WORK_DIR/world_writable" \) \) \
+        2>/dev/null |
+        if [ ${#walk_throttle[@]} -gt 0 ]; then
+            awk -v rate="$WALK_RATE" '
+                BEGIN { step = rate >= 10 ? int(rate / 10) : 1; pause = step / rate }
+                NR % step == 0 { system("sleep " pause) }'
+        else
+            cat > /dev/null
+        fi
+}
+
+# 순회가 제한 시간을 넘기면 부분 목록으로 판정하지 않도록 표시 (진단코드 → 해당 목록 파일)
+declare -A FS_LISTS=([U-07]=nouser [U-14]=suid [U-16]=world_writable)
+FS_PARTIAL=0
+bounded "$FS_INDEX_TIMEOUT" walk_fs || FS_PARTIAL=1
+touch "$WORK_DIR/nouser" "$WORK_DIR/suid" "$WORK_DIR/world_writable"
+
+# ---------------------------------------------------------------------------
+# 공통 함수
+# ---------------------------------------------------------------------------
+
+# 설정 파일 스냅샷에서 주석이 아닌 줄 중 정규식과 일치하는 줄 검색 (결과는 REPLY, 일치하면 0 반환)
+conf_match() {
+    local file=$1 re=$2 line
+    REPLY=""
+    [ -n "${CONF[$file]+x}" ] || return 1
+    while IFS= read -r line; do
+        [[ $line =~ ^[[:space:]]*# ]] && continue
+        [[ $line =~ $re ]] && REPLY+="${REPLY:+$'\n'}$line"
+    done <<< "${CONF[$file]}"
+    [ -n "$REPLY" ]
+}
+
+# 주석 줄을 포함하여 정규식과 일치하는 줄 검색 (grep 과 같은 기준, 결과는 REPLY, 일치하면 0 반환)
+conf_grep() {
+    local file=$1 re=$2 line
+    REPLY=""
+    [ -n "${CONF[$file]+x}" ] || return 1
+    while IFS= read -r line; do
+        [[ $line =~ $re ]] && REPLY+="${REPLY:+$'\n'}$line"
+    done <<< "${CONF[$file]}"
+    [ -n "$REPLY" ]
+}
+
+# xinetd 서비스가 활성화되어 있는지 확인 (disable = yes 가 아니면 활성)
+xinetd_enabled() {
+    local name=$1 f
+    for f in "${!CONF[@]}"; do
+        [[ $f == /etc/xinetd.d/$name || $f == /etc/xinetd.d/$name-* ]] || continue
+        conf_match "$f" 'disable[[:space:]]*=[[:space:]]*yes' || return 0
+    done
+    return 1
+}
+
+proc_running() {
+    local name
+    for name; do
+        [[ $PROCS == *$'\n'"$name"$'\n'* ]] && return 0
+    done
+    return 1
+}
+
+unit_enabled() {
+    local name
+    for name; do
+        [[ $ENABLED_UNITS == *$'\n'"$name"$'\n'* ]] && return 0
+    done
+    return 1
+}
+
+# 파일 권한이 기준 권한 이하인지 확인 (기준에 없는 권한 비트가 없으면 0 반환)
+perm_within() {
+    local path=$1 max=$2
+    [ -n "${MODE[$path]}" ] && (( (8#${MODE[$path]} & ~8#$max & 8#7777) == 0 ))
+}
+
+stat_text() {
+    if [ -n "${MODE[$1]}" ]; then
+        REPLY="$1 (소유자: ${OWNER[$1]}, 권한: ${MODE[$1]})"
+    else
+        REPLY="$1 (파일 없음)"
+    fi
+}
+
+# 소유자/권한 점검 공통 처리 (인자: 파일 기준권한 [허용 소유자...])
+check_owner_perm() {
+    local path=$1 max=$2 owner
+    shift 2
+    stat_text "$path"
+    EVIDENCE=$REPLY
+    if [ -z "${MODE[$path]}" ]; then
+        STATUS="N/A"
+        DETAIL="$path 파일이 존재하지 않습니다. 수동 점검이 필요한 항목입니다."
+        return
+    fi
+    for owner in "${@:-root}"; do
+        if [ "${OWNER[$path]}" = "$owner" ] && perm_within "$path" "$max"; then
+            STATUS="양호"
+            DETAIL="$path 파일의 소유자가 ${OWNER[$path]}이고 권한이 $max 이하인 상태입니다."
+            return
+        fi
+    done
+    STATUS="취약"
+    DETAIL="$path 파일의 소유자가 root가 아니거나 권한이 $max 초과인 상태입니다. 클라우드 취약점 점검 가이드를 참고하시어 소유자를 root로, 권한을 $max 이하로 변경하여 주시기 바랍니다."
+}
+
+# 현재 시각 (마이크로초)
+now_us() {
+    if [ -n "$EPOCHREALTIME" ]; then
+        REPLY=${EPOCHREALTIME/[.,]/}
+    else
+        REPLY=$(( $(date +%s%N) / 1000 ))
+    fi
+}
+
+# 이 프로세스와 자식 프로세스의 누적 CPU 시간 (밀리초, times 출력을 셸에서 직접 계산)
+cpu_ms() {
+    local line field m s total=0
+    times > "$WORK_DIR/times"
+    while read -r -a line; do
+        for field in "${line[@]}"; do
+            m=${field%%m*}
+            s=${field#*m}
+            s=${s%s}
+            total=$(( total + m * 60000 + 10#${s%.*} * 1000 + 10#${s#*.} ))
+        done
+    done < "$WORK_DIR/times"
+    REPLY=$total
+}
+
+json_escape() {
+    REPLY=$1
+    REPLY=${REPLY//\\/\\\\}
+    REPLY=${REPLY//\"/\\\"}
+    REPLY=${REPLY//$'\n'/\\n}
+    REPLY=${REPLY//$'\r'/\\r}
+    REPLY=${REPLY//$'\t'/\\t}
+    REPLY=${REPLY//[[:cntrl:]]/}
+}
+
+# 결과값 예산 적용 (결과는 REPLY, 잘린 경우 EVIDENCE_EXTRA 에 표시 필드 설정)
+evidence_cap() {
+    local text=$1 bytes=${#1} sha head
+    EVIDENCE_EXTRA=""
+    REPLY=$text
+    if [ "$EVIDENCE_BUDGET" -gt 0 ] && [ "$bytes" -gt "$EVIDENCE_BUDGET" ]; then
+        sha=$(printf '%s' "$text" | sha256sum | cut -d ' ' -f 1)
+        printf '%s' "$text" > "$WORK_DIR/evidence/$sha.txt"
+        head=${text:0:$EVIDENCE_BUDGET}
+        # 마지막 UTF-8 문자가 잘렸으면 남은 바이트 제거
+        if [[ $head == *[$'\x80'-$'\xff'] ]]; then
+            while [[ $head == *[$'\x80'-$'\xbf'] ]]; do
+                head=${head%?}
+            done
+            [[ $head == *[$'\xc0'-$'\xff'] ]] && head=${head%?}
+        fi
+        REPLY="$head"$'\n'"...[truncated: ${EVIDENCE_BUDGET}/${bytes} bytes, sha256=${sha}]"
+        EVIDENCE_EXTRA=", \"evidencetruncated\": true, \"evidencesha256\": \"$sha\""
+    fi
+}
+
+# 점검 함수를 서브셸에서 실행하고 결과 변수를 파일로 전달 (bounded 로 실행)
+run_isolated() {
+    "$1"
+    printf 'STATUS=%q EVIDENCE=%q DETAIL=%q\n' "$STATUS" "$EVIDENCE" "$DETAIL" > "$WORK_DIR/check.out"
+}
+
+TIMEOUT_DETAIL="점검 명령이 응답하지 않아 결과를 확인하지 못했습니다. 네트워크 파일시스템 등 응답이 느린 자원을 확인한 후 다시 점검하거나 담당자와 인터뷰를 통해 확인하십시오."
+
+FIRST_ITEM=1
+
+# 점검 1건 실행 후 결과 항목을 바로 출력
+# 인자: 진단코드 구분 진단항목 취약도(상/중/하) 점검함수
+run_check() {
+    local code=$1 category=$2 title=$3 importance=$4 func=$5
+    local start_us end_us start_cpu end_cpu importance_code result_code bytes found
+    local j_title j_detail j_category j_status j_evidence
+
+    STATUS="인터뷰" EVIDENCE="" DETAIL=""
+    now_us; start_us=$REPLY
+    cpu_ms; start_cpu=$REPLY
+    rm -f "$WORK_DIR/check.out"
+    if [ $FS_PARTIAL = 1 ] && [ -n "${FS_LISTS[$code]}" ]; then
+        STATUS="타임아웃" DETAIL=$TIMEOUT_DETAIL
+        found=$(<"$WORK_DIR/${FS_LISTS[$code]}")
+        EVIDENCE="파일시스템 순회가 제한 시간(${FS_INDEX_TIMEOUT}초) 안에 끝나지 않아 중단되었습니다."$'\n'"중단 전까지 찾은 항목:"$'\n'"${found:-없음}"
+    elif bounded "$CHECK_TIMEOUT" run_isolated "$func"; then
+        [ -f "$WORK_DIR/check.out" ] && source "$WORK_DIR/check.out"
+    else
+        STATUS="타임아웃" DETAIL=$TIMEOUT_DETAIL
+        EVIDENCE="점검이 제한 시간(${CHECK_TIMEOUT}초) 안에 끝나지 않아 중단되었습니다."
+    fi
+    cpu_ms; end_cpu=$REPLY
+    now_us; end_us=$REPLY
+
+    case $importance in
+        상) importance_code=3 ;;
+        중) importance_code=2 ;;
+        *) importance_code=1 ;;
+    esac
+    case $STATUS in
+        양호) result_code=0 ;;
+        취약) result_code=1 ;;
+        타임아웃) result_code=3 ;;
+        *) result_code=2 ;;
+    esac
+
+    bytes=${#EVIDENCE}
+    evidence_cap "$EVIDENCE"
+    json_escape "$REPLY"; j_evidence=$REPLY
+    json_escape "$title"; j_title=$REPLY
+    json_escape "$DETAIL"; j_detail=$REPLY
+    json_escape "$category"; j_category=$REPLY
+    json_escape "$STATUS"; j_status=$REPLY
+
+    [ $FIRST_ITEM = 1 ] || printf ',' >&3
+    FIRST_ITEM=0
+    printf '\n  {"itemcode": "%s", "title": "%s", "importance": %d, "result": %d, "resultdetail": "%s", "category": "%s", "status": "%s", "evidence": "%s", "evidencebytes": %d%s, "walltime": %d.%03d, "cputime": %d.%03d}' \
+        "$code" "$j_title" "$importance_code" "$result_code" "$j_detail" "$j_category" "$j_status" \
+        "$j_evidence" "$bytes" "$EVIDENCE_EXTRA" \
+        $(( (end_us - start_us) / 1000000 )) $(( (end_us - start_us) / 1000 % 1000 )) \
+        $(( (end_cpu - start_cpu) / 1000 )) $(( (end_cpu - start_cpu) % 1000 )) >&3
+}
+
+# ---------------------------------------------------------------------------
+# 계정관리
+# ---------------------------------------------------------------------------
+
+check_U_01() {
+    local securetty_ok=1 ssh_ok=0
+    if [ -n "${CONF[/etc/securetty]+x}" ]; then
+        conf_match /etc/securetty '^[[:space:]]*pts/' && securetty_ok=0
+        EVIDENCE="/etc/securetty pts 설정: ${REPLY:-없음}"
+    else
+        EVIDENCE="/etc/securetty 파일이 존재하지 않습니다. (telnet 비활성 간주)"
+    fi
+    if conf_match /etc/ssh/sshd_config '^[[:space:]]*[Pp]ermit[Rr]oot[Ll]ogin[[:space:]]'; then
+        EVIDENCE+=$'\n'"sshd_config: $REPLY"
+        [[ ${REPLY,,} =~ ^[[:space:]]*permitrootlogin[[:space:]]+no[[:space:]]*$ ]] && ssh_ok=1
+    else
+        EVIDENCE+=$'\n'"sshd_config: PermitRootLogin 설정이 없습니다. (기본값 허용)"
+    fi
+    if [ $securetty_ok = 1 ] && [ $ssh_ok = 1 ]; then
+        STATUS="양호"
+        DETAIL="원격 터미널 서비스에서 root 직접 접속이 차단되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="root 계정의 원격 직접 접속이 허용되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 /etc/ssh/sshd_config 파일에 PermitRootLogin no 를 설정하고 /etc/securetty 의 pts 설정을 제거하여 주시기 바랍니다."
+    fi
+}
+
+# U-02, U-03 은 Script/linux/U-02.sh, U-03.sh 와 같은 기준으로 판정 (Script/rules/linux.yaml 규칙도 동일)
+# U-02: system-auth 에 있는 credit 옵션(주석 포함) 종류가 2개이면 minlen 10 이상, 3~4개이면 minlen 8 이상일 때 양호
+check_U_02() {
+    local credit credits=0 found="" minlen=""
+    for credit in lcredit dcredit ucredit ocredit; do
+        if [[ ${CONF[/etc/pam.d/system-auth]} == *$credit* ]]; then
+            credits=$((credits + 1))
+            found+="${found:+, }$credit"
+        fi
+    done
+    EVIDENCE="/etc/pam.d/system-auth credit 옵션: ${found:-없음}"
+    # pwquality.conf 의 minlen=N 이 한 줄에만 있을 때 그 값을 사용 (여러 줄이면 비교할 수 없으므로 취약)
+    if conf_grep /etc/security/pwquality.conf 'minlen=[0-9]+'; then
+        EVIDENCE+=$'\n'"/etc/security/pwquality.conf: $REPLY"
+        [[ $REPLY != *$'\n'* && $REPLY =~ .*minlen=([0-9]+) ]] && minlen=${BASH_REMATCH[1]}
+    else
+        EVIDENCE+=$'\n'"/etc/security/pwquality.conf: minlen 설정이 없습니다."
+    fi
+    if [ -n "$minlen" ] && { { [ $credits -eq 2 ] && [ "$minlen" -ge 10 ]; } || { [ $credits -ge 3 ] && [ "$minlen" -ge 8 ]; }; }; then
+        STATUS="양호"
+        DETAIL="옵션이 $credits 개이고 minlen이 $minlen 입니다."
+    else
+        STATUS="취약"
+        DETAIL="패스워드 복잡성 또는 패스워드 최소길이를 만족하지 않습니다. 클라우드 취약점 점검 가이드를 참고하시어 패스워드 복잡도 설정 값(최소 자리수 영문 대/소문자 특수문자 숫자)을 사내 내부 규정에 맞게 복잡도를 설정하여 주시기 바랍니다."
+    fi
+}
+
+# U-03: system-auth, password-auth 모두 pam_faillock 의 preauth, authfail 줄의 deny 값이 5 이하일 때 양호
+check_U_03() {
+    local f kind deny ok=1
+    EVIDENCE=""
+    for f in /etc/pam.d/system-auth /etc/pam.d/password-auth; do
+        for kind in preauth authfail; do
+            deny=""
+            conf_grep "$f" "^[^#]*pam_faillock.so.*$kind.*deny=[0-9]+" &&
+                [[ $REPLY != *$'\n'* && $REPLY =~ .*deny=([0-9]+) ]] && deny=${BASH_REMATCH[1]}
+            EVIDENCE+="${EVIDENCE:+$'\n'}$f $kind deny: ${deny:-${REPLY:-없음}}"
+            [ -n "$deny" ] && (( 10#$deny <= 5 )) || ok=0
+        done
+    done
+    if [ $ok = 1 ]; then
+        STATUS="양호"
+        DETAIL="계정 잠금 임계값이 5회 이하로 설정되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="계정 잠금 임계값이 설정되어 있지 않거나 5 이하의 값으로 설정되어 있지 않은 상태입니다. 클라우드 취약점 점검 가이드를 참고하시어 /etc/pam.d/system-auth, /etc/pam.d/password-auth 파일 내 auth 설정 값에 deny 부분을 5 이하의 값으로 설정하여 주시기 바랍니다."
+    fi
+}
+
+check_U_04() {
+    local days=""
+    if conf_match /etc/login.defs '^[[:space:]]*PASS_MAX_DAYS[[:space:]]+[0-9]+'; then
+        EVIDENCE="/etc/login.defs: $REPLY"
+        [[ $REPLY =~ PASS_MAX_DAYS[[:space:]]+([0-9]+) ]] && days=${BASH_REMATCH[1]}
+    else
+        EVIDENCE="/etc/login.defs 에 PASS_MAX_DAYS 설정이 없습니다."
+    fi
+    if [ -n "$days" ] && [ "$days" -le 90 ]; then
+        STATUS="양호"
+        DETAIL="패스워드의 최대 사용기간이 90일 이내로 설정되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="패스워드의 최대 사용기간이 90일 이내로 설정되어 있지 않습니다. 클라우드 취약점 점검 가이드를 참고하시어 /etc/login.defs 파일의 PASS_MAX_DAYS 를 90 이하로 설정하여 주시기 바랍니다."
+    fi
+}
+
+check_U_05() {
+    local user pass plain=""
+    while IFS=: read -r user pass _; do
+        [ -z "$user" ] && continue
+        [[ $pass == x || $pass == '!'* || $pass == '*' ]] || plain+="${plain:+, }$user"
+    done <<< "${CONF[/etc/passwd]}"
+    stat_text /etc/shadow
+    EVIDENCE="$REPLY"$'\n'"패스워드 필드가 x 가 아닌 계정: ${plain:-없음}"
+    if [ -n "${MODE[/etc/shadow]}" ] && [ -z "$plain" ]; then
+        STATUS="양호"
+        DETAIL="쉐도우 패스워드를 사용하고 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="쉐도우 패스워드를 사용하지 않는 계정이 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 pwconv 명령으로 쉐도우 패스워드 정책을 적용하여 주시기 바랍니다."
+    fi
+}
+
+# ---------------------------------------------------------------------------
+# 파일 및 디렉토리 관리
+# ---------------------------------------------------------------------------
+
+check_U_06() {
+    # 마지막 항목을 제외한 위치에 "." 또는 빈 경로가 있으면 취약
+    local front=":${PATH%:*}:"
+    EVIDENCE="PATH=$PATH"
+    if [[ $front == *:.:* || $front == *::* ]]; then
+        STATUS="취약"
+        DETAIL="PATH 환경변수에 \".\" 또는 빈 경로가 포함되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 PATH 에서 \".\" 을 제거하거나 맨 뒤로 이동하여 주시기 바랍니다."
+    else
+        STATUS="양호"
+        DETAIL="PATH 환경변수에 \".\" 이 맨 앞이나 중간에 포함되어 있지 않습니다."
+    fi
+}
+
+check_U_07() {
+    EVIDENCE=$(<"$WORK_DIR/nouser")
+    if [ -z "$EVIDENCE" ]; then
+        STATUS="양호"
+        EVIDENCE="소유자나 그룹이 없는 파일 및 디렉터리: 없음"
+        DETAIL="소유자나 그룹이 존재하지 않는 파일 및 디렉터리가 없습니다."
+    else
+        STATUS="취약"
+        DETAIL="소유자나 그룹이 존재하지 않는 파일 및 디렉터리가 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 불필요한 경우 삭제하고 필요한 경우 chown 으로 소유자를 변경하여 주시기 바랍니다."
+    fi
+}
+
+check_U_08() { check_owner_perm /etc/passwd 644; }
+check_U_09() { check_owner_perm /etc/shadow 400; }
+check_U_10() { check_owner_perm /etc/hosts 644; }
+
+check_U_11() {
+    if [ -n "${MODE[/etc/xinetd.conf]}" ]; then
+        check_owner_perm /etc/xinetd.conf 644
+    else
+        check_owner_perm /etc/inetd.conf 644
+    fi
+}
+
+check_U_12() {
+    if [ -n "${MODE[/etc/rsyslog.conf]}" ]; then
+        check_owner_perm /etc/rsyslog.conf 644 root bin sys
+    else
+        check_owner_perm /etc/syslog.conf 644 root bin sys
+    fi
+}
+
+check_U_13() { check_owner_perm /etc/services 644 root bin sys; }
+
+check_U_14() {
+    local list
+    list=$(<"$WORK_DIR/suid")
+    EVIDENCE="root 소유 SUID/SGID 파일 목록:"$'\n'"${list:-없음}"
+    STATUS="인터뷰"
+    DETAIL="클라우드 취약점 점검 가이드를 참고하시어 SUID, SGID 파일의 접근권한이 적절하게 설정되어 있는지 점검하여 주시기 바랍니다."
+}
+
+check_U_15() {
+    local user path bad=""
+    for user in "${!HOME_OF[@]}"; do
+        for path in "${START_FILES[@]/#/${HOME_OF[$user]}/}"; do
+            [ -n "${MODE[$path]}" ] || continue
+            stat_text "$path"
+            EVIDENCE+="${EVIDENCE:+$'\n'}$REPLY"
+            if [[ ${OWNER[$path]} != root && ${OWNER[$path]} != "$user" ]] || (( 8#${MODE[$path]} & 8#022 )); then
+                bad+="${bad:+, }$path"
+            fi
+        done
+    done
+    EVIDENCE=${EVIDENCE:-"점검 대상 환경파일이 없습니다."}
+    if [ -z "$bad" ]; then
+        STATUS="양호"
+        DETAIL="사용자, 시스템 시작 파일 및 환경 파일 소유자가 root 또는 해당 계정이고 타 사용자 쓰기 권한이 없습니다."
+    else
+        STATUS="취약"
+        DETAIL="소유자가 다르거나 타 사용자 쓰기 권한이 있는 환경파일이 있습니다($bad). 클라우드 취약점 점검 가이드를 참고하시어 소유자를 변경하고 쓰기 권한을 제거하여 주시기 바랍니다."
+    fi
+}
+
+check_U_16() {
+    local list
+    list=$(<"$WORK_DIR/world_writable")
+    EVIDENCE="world writable 파일 목록:"$'\n'"${list:-없음}"
+    STATUS="인터뷰"
+    DETAIL="클라우드 취약점 점검 가이드를 참고하시어 world writable 파일의 존재 유무와 존재 시 설정 이유를 확인하여 주시기 바랍니다."
+}
+
+check_U_17() {
+    local user path bad="" services=""
+    for path in /etc/hosts.equiv "${HOME_OF[@]/%//.rhosts}"; do
+        [ -n "${MODE[$path]}" ] || continue
+        stat_text "$path"
+        EVIDENCE+="${EVIDENCE:+$'\n'}$REPLY"
+        perm_within "$path" 600 || bad+="${bad:+, }$path"
+    done
+    if conf_match /etc/hosts.equiv '^[[:space:]]*\+'; then
+        bad+="${bad:+, }/etc/hosts.equiv(+)"
+    fi
+    for user in "${!HOME_OF[@]}"; do
+        conf_match "${HOME_OF[$user]}/.rhosts" '^[[:space:]]*\+' && bad+="${bad:+, }${HOME_OF[$user]}/.rhosts(+)"
+    done
+    for path in rsh rlogin rexec; do
+        if unit_enabled "$path.socket" || xinetd_enabled "$path"; then
+            services+="${services:+, }$path"
+        fi
+    done
+    EVIDENCE+="${EVIDENCE:+$'\n'}활성화된 r 계열 서비스: ${services:-없음}"
+    if [ -z "$services" ] || [ -z "$bad" ]; then
+        STATUS="양호"
+        DETAIL="r 계열 서비스를 사용하지 않거나 hosts.equiv, .rhosts 파일이 적절히 설정되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="r 계열 서비스가 활성화되어 있고 hosts.equiv 또는 .rhosts 설정이 부적절합니다($bad). 클라우드 취약점 점검 가이드를 참고하시어 권한을 600 이하로 변경하고 \"+\" 설정을 제거하여 주시기 바랍니다."
+    fi
+}
+
+check_U_18() {
+    conf_match /etc/hosts.deny '.'
+    EVIDENCE="/etc/hosts.deny: ${REPLY:-설정 없음}"
+    conf_match /etc/hosts.allow '.'
+    EVIDENCE+=$'\n'"/etc/hosts.allow: ${REPLY:-설정 없음}"
+    if conf_match /etc/hosts.deny '^[[:space:]]*ALL[[:space:]]*:[[:space:]]*ALL'; then
+        STATUS="양호"
+        DETAIL="TCP Wrapper 로 허용할 호스트만 접속하도록 제한되어 있습니다."
+    else
+        STATUS="인터뷰"
+        DETAIL="/etc/hosts.deny 에 ALL:ALL 설정이 없습니다. 방화벽 등으로 접속 IP 및 포트를 제한하고 있는지 담당자 확인이 필요합니다."
+    fi
+}
+
+check_U_19() {
+    local path bad=""
+    for path in "${CRON_FILES[@]}"; do
+        [ -n "${MODE[$path]}" ] || continue
+        stat_text "$path"
+        EVIDENCE+="${EVIDENCE:+$'\n'}$REPLY"
+        if [ "${OWNER[$path]}" != root ] || (( 8#${MODE[$path]} & 8#022 )); then
+            bad+="${bad:+, }$path"
+        fi
+    done
+    EVIDENCE=${EVIDENCE:-"cron 관련 파일이 없습니다."}
+    if [ -z "$bad" ]; then
+        STATUS="양호"
+        DETAIL="cron 관련 파일의 소유자가 root 이고 타 사용자 쓰기 권한이 없습니다."
+    else
+        STATUS="취약"
+        DETAIL="소유자가 root 가 아니거나 쓰기 권한이 과도한 cron 파일이 있습니다($bad). 클라우드 취약점 점검 가이드를 참고하시어 소유자를 root 로, 권한을 640 이하로 변경하여 주시기 바랍니다."
+    fi
+}
+
+# ---------------------------------------------------------------------------
+# 서비스 관리
+# ---------------------------------------------------------------------------
+
+# 서비스 비활성화 점검 공통 처리 (인자: 서비스명...; xinetd, systemd 소켓, inetd, 프로세스 확인)
+check_services_disabled() {
+    local name active=""
+    for name; do
+        if xinetd_enabled "$name" || unit_enabled "$name.socket" "$name.service" ||
+           conf_match /etc/inetd.conf "^[[:space:]]*$name[[:space:]]" || proc_running "$name" "in.${name}d"; then
+            active+="${active:+, }$name"
+        fi
+    done
+    EVIDENCE="활성화된 서비스: ${active:-없음}"
+    [ -z "$active" ]
+}
+
+check_U_20() {
+    if check_services_disabled finger; then
+        STATUS="양호"
+        DETAIL="finger 서비스가 비활성화 되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="finger 서비스가 활성화 되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 finger 서비스를 비활성화하여 주시기 바랍니다."
+    fi
+}
+
+check_U_21() {
+    local found=""
+    conf_match /etc/passwd '^(ftp|anonymous):' && found+="${found:+$'\n'}/etc/passwd: $REPLY"
+    conf_match /etc/vsftpd/vsftpd.conf '^[[:space:]]*anonymous_enable[[:space:]]*=[[:space:]]*[Yy][Ee][Ss]' &&
+        found+="${found:+$'\n'}vsftpd.conf: $REPLY"
+    conf_match /etc/vsftpd.conf '^[[:space:]]*anonymous_enable[[:space:]]*=[[:space:]]*[Yy][Ee][Ss]' &&
+        found+="${found:+$'\n'}vsftpd.conf: $REPLY"
+    conf_match /etc/proftpd/proftpd.conf '<Anonymous' && found+="${found:+$'\n'}proftpd.conf: $REPLY"
+    conf_match /etc/proftpd.conf '<Anonymous' && found+="${found:+$'\n'}proftpd.conf: $REPLY"
+    EVIDENCE="Anonymous FTP 관련 설정: ${found:-없음}"
+    if [ -z "$found" ] || ! proc_running vsftpd proftpd in.ftpd; then
+        STATUS="양호"
+        DETAIL="Anonymous FTP 접속을 차단하고 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="Anonymous FTP 접속을 허용하고 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 ftp/anonymous 계정을 삭제하거나 anonymous_enable=NO 로 설정하여 주시기 바랍니다."
+    fi
+}
+
+check_U_22() {
+    if check_services_disabled rsh rlogin rexec; then
+        STATUS="양호"
+        DETAIL="r (rlogin, rsh, rexec) 계열 서비스가 비활성화 되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="r 계열 서비스가 활성화 되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 rlogin, rsh, rexec 서비스를 비활성화하여 주시기 바랍니다."
+    fi
+}
+
+check_U_23() {
+    if check_services_disabled echo discard daytime chargen; then
+        STATUS="양호"
+        DETAIL="DoS 공격에 취약한 서비스(echo, discard, daytime, chargen)가 비활성화 되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="DoS 공격에 취약한 서비스가 활성화 되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 echo, discard, daytime, chargen 서비스를 비활성화하여 주시기 바랍니다."
+    fi
+}
+
+check_U_24() {
+    if proc_running nfsd rpc.nfsd; then
+        STATUS="취약"
+        EVIDENCE="실행 중인 NFS 데몬: nfsd"
+        DETAIL="NFS 관련 데몬이 활성화되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 불필요한 경우 NFS 데몬(nfsd)을 중지하여 주시기 바랍니다."
+    else
+        STATUS="양호"
+        EVIDENCE="실행 중인 NFS 데몬: 없음"
+        DETAIL="NFS 관련 데몬이 비활성화되어 있습니다."
+    fi
+}
+
+check_U_25() {
+    if ! conf_match /etc/exports '.'; then
+        STATUS="N/A"
+        EVIDENCE="/etc/exports: 공유 설정 없음"
+        DETAIL="NFS 공유 설정이 없습니다."
+        return
+    fi
+    EVIDENCE="/etc/exports: $REPLY"
+    if conf_match /etc/exports '(^|[[:space:]])\*|^[^[:space:]]+[[:space:]]*$'; then
+        STATUS="취약"
+        DETAIL="모든 호스트(*)에 공유가 허용된 NFS 설정이 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 /etc/exports 에 접근 가능한 호스트를 지정하여 주시기 바랍니다."
+    else
+        STATUS="양호"
+        DETAIL="NFS 공유에 접근 가능한 호스트가 제한되어 있습니다."
+    fi
+}
+
+check_U_26() {
+    if proc_running automount autofs; then
+        STATUS="취약"
+        EVIDENCE="실행 중인 automount 데몬: automount"
+        DETAIL="automount 서비스가 활성화 되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 autofs 서비스를 중지하여 주시기 바랍니다."
+    else
+        STATUS="양호"
+        EVIDENCE="실행 중인 automount 데몬: 없음"
+        DETAIL="automount 서비스가 비활성화 되어 있습니다."
+    fi
+}
+
+check_U_27() {
+    if check_services_disabled rpc.cmsd rpc.ttdbserverd sadmind rusersd walld sprayd rstatd rpc.nisd rexd rpc.pcnfsd rpc.statd rpc.ypupdated rpc.rquotad kcms_server cachefsd; then
+        STATUS="양호"
+        DETAIL="불필요한 RPC 서비스가 비활성화 되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="불필요한 RPC 서비스가 활성화되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 불필요한 RPC 서비스를 비활성화하여 주시기 바랍니다."
+    fi
+}
+
+check_U_28() {
+    if proc_running ypserv ypbind ypxfrd rpc.yppasswdd rpc.ypupdated; then
+        STATUS="취약"
+        EVIDENCE="실행 중인 NIS 데몬이 있습니다."
+        DETAIL="NIS 또는 NIS+ 서비스가 구동 중입니다. 클라우드 취약점 점검 가이드를 참고하시어 불필요한 NIS 서비스를 중지하여 주시기 바랍니다."
+    else
+        STATUS="양호"
+        EVIDENCE="실행 중인 NIS 데몬: 없음"
+        DETAIL="NIS 또는 NIS+ 서비스가 구동 중이지 않습니다."
+    fi
+}
+
+check_U_29() {
+    if check_services_disabled tftp talk ntalk; then
+        STATUS="양호"
+        DETAIL="tftp, talk 서비스가 비활성화 되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="tftp 또는 talk 서비스가 활성화 되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 해당 서비스를 비활성화하여 주시기 바랍니다."
+    fi
+}
+
+check_U_30() {
+    local version=""
+    if proc_running sendmail; then
+        conf_match /etc/mail/sendmail.cf '^DZ' && version=${REPLY#DZ}
+        EVIDENCE="Sendmail 버전: ${version:-확인 불가}"
+        STATUS="인터뷰"
+        DETAIL="Sendmail 현재 버전: ${version:-확인 불가}. 담당자와 인터뷰를 통해 최신 버전으로 업데이트하십시오."
+    elif proc_running master && unit_enabled postfix.service; then
+        version=$(postconf -h mail_version 2>/dev/null)
+        EVIDENCE="Postfix 버전: ${version:-확인 불가}"
+        STATUS="인터뷰"
+        DETAIL="Postfix 현재 버전: ${version:-확인 불가}. 담당자와 인터뷰를 통해 최신 버전으로 업데이트하십시오."
+    else
+        STATUS="N/A"
+        EVIDENCE="실행 중인 메일 서비스: 없음"
+        DETAIL="Sendmail과 Postfix가 사용되고 있지 않습니다."
+    fi
+}
+
+check_U_31() {
+    if ! proc_running sendmail; then
+        STATUS="양호"
+        EVIDENCE="실행 중인 sendmail: 없음"
+        DETAIL="SMTP 서비스를 사용하지 않는 상태입니다."
+        return
+    fi
+    if conf_match /etc/mail/sendmail.cf 'Relaying denied'; then
+        STATUS="양호"
+        EVIDENCE="sendmail.cf: $REPLY"
+        DETAIL="SMTP 서비스를 사용하지만 릴레이 제한이 설정되어 있습니다."
+    else
+        STATUS="취약"
+        EVIDENCE="sendmail.cf: 릴레이 제한 설정 없음"
+        DETAIL="SMTP 서비스를 사용하며 릴레이 제한이 설정되어 있지 않습니다. 클라우드 취약점 점검 가이드를 참고하시어 sendmail.cf 에 릴레이 제한을 설정하여 주시기 바랍니다."
+    fi
+}
+
+check_U_32() {
+    if ! proc_running sendmail; then
+        STATUS="양호"
+        EVIDENCE="실행 중인 sendmail: 없음"
+        DETAIL="SMTP 서비스를 사용하지 않는 상태입니다."
+        return
+    fi
+    conf_match /etc/mail/sendmail.cf 'PrivacyOptions'
+    EVIDENCE="sendmail.cf: ${REPLY:-PrivacyOptions 설정 없음}"
+    if [[ $REPLY == *restrictqrun* ]]; then
+        STATUS="양호"
+        DETAIL="일반 사용자의 Sendmail 실행 방지(restrictqrun)가 설정되어 있습니다."
+    else
+        STATUS="취약"
+        DETAIL="일반 사용자의 Sendmail 실행 방지가 설정되어 있지 않습니다. 클라우드 취약점 점검 가이드를 참고하시어 PrivacyOptions 에 restrictqrun 을 추가하여 주시기 바랍니다."
+    fi
+}
+
+check_U_33() {
+    local version
+    if ! proc_running named; then
+        STATUS="양호"
+        EVIDENCE="실행 중인 named: 없음"
+        DETAIL="DNS 서비스를 사용하고 있지 않습니다."
+        return
+    fi
+    version=$(named -v 2>/dev/null)
+    EVIDENCE="현재 사용 중인 BIND 버전: ${version:-확인 불가}"
+    STATUS="인터뷰"
+    DETAIL="DNS 서비스를 사용하고 있습니다. 담당자와 인터뷰를 통해 주기적으로 보안 패치를 적용하고 있는지 확인하십시오."
+}
+
+check_U_34() {
+    if ! proc_running named; then
+        STATUS="양호"
+        EVIDENCE="실행 중인 named: 없음"
+        DETAIL="DNS 서비스를 사용하고 있지 않습니다."
+        return
+    fi
+    if conf_match /etc/named.conf 'allow-transfer'; then
+        EVIDENCE="/etc/named.conf: $REPLY"
+        if [[ $REPLY == *any* ]]; then
+            STATUS="취약"
+            DETAIL="Zone Transfer 가 모든 호스트에 허용되어 있습니다. 클라우드 취약점 점검 가이드를 참고하시어 allow-transfer 에 허가된 Secondary DNS 만 지정하여 주시기 바랍니다."
+        else
+            STATUS="양호"
+            DETAIL="Zone Transfer 가 허가된 사용자에게만 허용되어 있습니다."
+        fi
+    else
+        STATUS="취약"
+        EVIDENCE="/etc/named.conf: allow-transfer 설정 없음"
+        DETAIL="Zone Transfer 제한 설정이 없습니다. 클라우드 취약점 점검 가이드를 참고하시어 allow-transfer 를 설정하여 주시기 바랍니다."
+    fi
+}
+
+# ---------------------------------------------------------------------------
+# 패치 및 로그관리
+# ---------------------------------------------------------------------------
+
+check_U_35() {
+    STATUS="인터뷰"
+    EVIDENCE="커널 버전: $(uname -r)"
+    DETAIL="클라우드 취약점 점검 가이드를 참고하시어 최신 보안 패치 및 벤더 권고사항이 적용되어 있는지 점검하여 주시기 바랍니다."
+}
+
+check_U_36() {
+    STATUS="인터뷰"
+    EVIDENCE="담당자 확인이 필요한 항목입니다."
+    DETAIL="클라우드 취약점 점검 가이드를 참고하시어 로그 기록의 검토, 분석, 리포트 작성 및 보고가 정기적으로 이루어지고 있는지 점검하여 주시기 바랍니다."
+}
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+os_version=""
+if [ -r /etc/redhat-release ]; then
+    os_version=$(</etc/redhat-release)
+elif [ -r /etc/os-release ]; then
+    while IFS='=' read -r key value; do
+        [ "$key" = PRETTY_NAME ] && os_version=${value//\"/}
+    done < /etc/os-release
+fi
+json_escape "$os_version"; j_os=$REPLY
+
+exec 3>"$JSON_FILE"
+printf '{"targetip": "%s", "testedtime": "%s", "osinfo": "%s", "result": [' \
+    "$HOST_IP" "$(date '+%Y-%m-%d %H:%M:%S')" "$j_os" >&3
+
+run_check U-01 "계정관리" "root 계정 원격 접속 제한" 상 check_U_01
+run_check U-02 "계정관리" "패스워드 복잡성 설정" 상 check_U_02
+run_check U-03 "계정관리" "계정 잠금 임계값 설정" 상 check_U_03
+run_check U-04 "계정관리" "패스워드 최대 사용 기간 설정" 중 check_U_04
+run_check U-05 "계정관리" "패스워드 파일 보호" 상 check_U_05
+run_check U-06 "파일 및 디렉토리 관리" "root 홈 패스 디렉터리 권한 및 패스 설정" 상 check_U_06
+run_check U-07 "파일 및 디렉토리 관리" "파일 및 디렉터리 소유자 설정" 상 check_U_07
+run_check U-08 "파일 및 디렉토리 관리" "/etc/passwd 파일 소유자 및 권한 설정" 상 check_U_08
+run_check U-09 "파일 및 디렉토리 관리" "/etc/shadow 파일 소유자 및 권한 설정" 상 check_U_09
+run_check U-10 "파일 및 디렉토리 관리" "/etc/hosts 파일 소유자 및 권한 설정" 상 check_U_10
+run_check U-11 "파일 및 디렉토리 관리" "/etc/(x)inetd.conf 파일 소유자 및 권한 설정" 상 check_U_11
+run_check U-12 "파일 및 디렉토리 관리" "/etc/(r)syslog.conf 파일 소유자 및 권한 설정" 상 check_U_12
+run_check U-13 "파일 및 디렉토리 관리" "/etc/services 파일 및 권한 설정" 상 check_U_13
+run_check U-14 "파일 및 디렉토리 관리" "SUID SGID Sticy bit 설정 파일 점검" 상 check_U_14
+run_check U-15 "파일 및 디렉토리 관리" "사용자 시스템 시작파일 및 환경파일 소유자 및 권한 설정" 상 check_U_15
+run_check U-16 "파일 및 디렉토리 관리" "world writable 파일 점검" 상 check_U_16
+run_check U-17 "파일 및 디렉토리 관리" "rlogin//shell//exec 서비스 비활성화" 상 check_U_17
+run_check U-18 "파일 및 디렉토리 관리" "접속 IP 및 포트 제한" 상 check_U_18
+run_check U-19 "파일 및 디렉토리 관리" "cron 파일 소유자 및 권한 설정" 상 check_U_19
+run_check U-20 "서비스 관리" "Finger 서비스 비활성화" 상 check_U_20
+run_check U-21 "서비스 관리" "Anonymous FTP 비활성화" 상 check_U_21
+run_check U-22 "서비스 관리" "r 계열 서비스 비활성화" 상 check_U_22
+run_check U-23 "서비스 관리" "DOS 공격에 취약한 서비스 비활성화" 상 check_U_23
+run_check U-24 "서비스 관리" "NFS 서비스 비활성화" 상 check_U_24
+run_check U-25 "서비스 관리" "NFS 접근통제" 상 check_U_25
+run_check U-26 "서비스 관리" "automountd 제거" 상 check_U_26
+run_check U-27 "서비스 관리" "RPC 서비스 확인" 상 check_U_27
+run_check U-28 "서비스 관리" "NIS NIS+ 점검" 상 check_U_28
+run_check U-29 "서비스 관리" "tftp talk 서비스 비활성화" 상 check_U_29
+run_check U-30 "서비스 관리" "Sendmail 버전 점검" 상 check_U_30
+run_check U-31 "서비스 관리" "스팸 메일 릴레이 제한" 상 check_U_31
+run_check U-32 "서비스 관리" "일반사용자의 Sendmail 실행 방지" 상 check_U_32
+run_check U-33 "서비스 관리" "DNS 보안 버전 패치" 상 check_U_33
+run_check U-34 "서비스 관리" "DNS ZoneTransfer 설정" 상 check_U_34
+run_check U-35 "패치 및 로그관리" "최신 보안패치 및 벤더 권고사항 적용" 상 check_U_35
+run_check U-36 "패치 및 로그관리" "로그의 정기적 검토 및 보고" 상 check_U_36
+
+printf '\n]}\n' >&3
+exec 3>&-
+
+# 잘린 결과값의 원본을 압축 파일로 보관
+if [ -n "$(ls -A "$WORK_DIR/evidence")" ]; then
+    rm -f "$EVIDENCE_ARCHIVE"
+    tar czf "$EVIDENCE_ARCHIVE" -C "$WORK_DIR/evidence" . 2>/dev/null
+fi
+
+if [ $STDOUT_MODE = 1 ]; then
+    printf '@@CCE_JSON_BEGIN@@\n'
+    cat "$JSON_FILE"
+    printf '@@CCE_JSON_END@@\n'
+else
+    echo "CentOS check results written to $JSON_FILE" >&2
+fi
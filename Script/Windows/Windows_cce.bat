@@ -0,0 +1,502 @@
+@echo off
+REM Windows_cce.bat - Windows Server vulnerability check engine (W-01 ~ W-44)
+REM
+REM The batch part only starts PowerShell; the engine itself is the PowerShell code after the
+REM PSSTART marker below. Security policy (secedit), registry, services, accounts and shares are
+REM collected once, every check is evaluated in the same process, and each result item is
+REM streamed into the dashboard JSON schema as soon as it is evaluated.
+REM   {targetip, testedtime, osinfo, result: [{itemcode, title, importance, result, resultdetail, ...}]}
+REM
+REM Usage
+REM   Windows_cce.bat           : writes C:\temp\Windows_<IP>.json
+REM   Windows_cce.bat --stdout  : prints the JSON to standard output (streamlined playbook)
+REM
+REM Environment
+REM   CCE_EVIDENCE_BUDGET : max evidence bytes per item (default 4096, 0 = unlimited)
+REM                         full evidence of truncated items is kept in C:\temp\Windows_<IP>.evidence.tar.gz
+REM   CCE_EVIDENCE_ARCHIVE: path of that archive (the control node fetches and deletes it)
+REM
+REM The evidence archive holds configuration contents, so it is readable by Administrators and SYSTEM only.
+
+setlocal
+set "CCE_ARGS=%*"
+set "CCE_SELF=%~f0"
+powershell -NoProfile -ExecutionPolicy Bypass -Command "$s = [IO.File]::ReadAllText($env:CCE_SELF, [Text.Encoding]::UTF8); $m = '#' + 'PSSTART'; & ([ScriptBlock]::Create($s.Substring($s.IndexOf($m) + $m.Length)))"
+exit /b %ERRORLEVEL%
+#PSSTART
+
+$ErrorActionPreference = 'SilentlyContinue'
+$utf8 = New-Object Text.UTF8Encoding $false
+
+$toStdout = " $env:CCE_ARGS " -match ' --stdout '
+$budget = 4096
+if ($env:CCE_EVIDENCE_BUDGET) { $budget = [int]$env:CCE_EVIDENCE_BUDGET }
+
+$outDir = 'C:\temp'
+if (-not (Test-Path $outDir)) { New-Item -ItemType Directory -Path $outDir | Out-Null }
+
+$hostIp = ([Net.Dns]::GetHostAddresses($env:COMPUTERNAME) |
+    Where-Object { $_.AddressFamily -eq 'InterNetwork' -and -not [Net.IPAddress]::IsLoopback($_) } |
+    Select-Object -First 1).IPAddressToString
+$jsonFile = Join-Path $outDir "Windows_$hostIp.json"
+$evidenceDir = Join-Path $outDir "Windows_$hostIp.evidence"
+$evidenceArchive = Join-Path $outDir "Windows_$hostIp.evidence.tar.gz"
+if ($env:CCE_EVIDENCE_ARCHIVE) { $evidenceArchive = $env:CCE_EVIDENCE_ARCHIVE }
+
+# ---------------------------------------------------------------------------
+# 스냅샷 수집 (점검 전체에서 공유, 원본마다 한 번만 조회)
+# ---------------------------------------------------------------------------
+
+# 로컬 보안 정책 (secedit 한 번 실행, [System Access], [Privilege Rights], [Registry Values])
+$policy = @{}
+$policyFile = Join-Path $env:TEMP "cce_secpol_$PID.inf"
+secedit /export /cfg "$policyFile" /areas SECURITYPOLICY USER_RIGHTS /quiet | Out-Null
+foreach ($line in (Get-Content $policyFile)) {
+    if ($line -match '^\s*([^=\[;]+?)\s*=\s*(.*)$') { $policy[$matches[1]] = $matches[2].Trim() }
+}
+Remove-Item $policyFile -Force
+
+$services = @{}
+foreach ($svc in (Get-Service)) { $services[$svc.Name] = $svc }
+
+$users = @(Get-WmiObject Win32_UserAccount -Filter "LocalAccount=True")
+$shares = @(Get-WmiObject Win32_Share)
+$osInfo = Get-WmiObject Win32_OperatingSystem
+$hotfixes = @(Get-HotFix | Sort-Object InstalledOn -Descending)
+
+# Administrators 그룹 구성원 (그룹 이름은 언어별로 다르므로 SID 로 조회)
+$adminGroup = Get-WmiObject Win32_Group -Filter "LocalAccount=True and SID='S-1-5-32-544'"
+$adminMembers = @()
+if ($adminGroup) {
+    $group = [ADSI]"WinNT://$env:COMPUTERNAME/$($adminGroup.Name),group"
+    $adminMembers = @($group.psbase.Invoke('Members') | ForEach-Object {
+        $_.GetType().InvokeMember('Name', 'GetProperty', $null, $_, $null)
+    })
+}
+
+# 레지스트리 값 (키마다 한 번만 읽어 캐시)
+$registry = @{}
+function Get-Reg($path, $name) {
+    if (-not $registry.ContainsKey($path)) { $registry[$path] = Get-ItemProperty -Path $path }
+    if ($registry[$path]) { return $registry[$path].$name }
+    return $null
+}
+
+# secedit [Registry Values] 항목의 값 (형식: 유형,값)
+function Get-PolicyReg($path) {
+    $value = $policy["MACHINE\$path"]
+    if ($value) { return ($value -split ',', 2)[1].Trim('"') }
+    return $null
+}
+
+function Get-PolicyInt($name) {
+    if ($policy.ContainsKey($name)) { return [int]$policy[$name] }
+    return $null
+}
+
+# 사용자 권한 할당에 Administrators(*S-1-5-32-544) 외 다른 계정이 있는지 확인
+function Test-AdminOnlyRight($name) {
+    $value = $policy[$name]
+    if (-not $value) { return $true }
+    foreach ($sid in ($value -split ',')) {
+        if ($sid.Trim() -ne '*S-1-5-32-544') { return $false }
+    }
+    return $true
+}
+
+function Test-Running($name) {
+    return $services.ContainsKey($name) -and $services[$name].Status -eq 'Running'
+}
+
+function Result($status, $evidence, $detail) {
+    return @{ Status = $status; Evidence = [string]$evidence; Detail = $detail }
+}
+
+# ---------------------------------------------------------------------------
+# JSON 출력
+# ---------------------------------------------------------------------------
+
+function ConvertTo-JsonString([string]$text) {
+    $sb = New-Object Text.StringBuilder
+    foreach ($c in $text.ToCharArray()) {
+        switch ($c) {
+            '\' { [void]$sb.Append('\\') }
+            '"' { [void]$sb.Append('\"') }
+            "`n" { [void]$sb.Append('\n') }
+            "`r" { [void]$sb.Append('\r') }
+            "`t" { [void]$sb.Append('\t') }
+            default { if ([int]$c -ge 32) { [void]$sb.Append($c) } }
+        }
+    }
+    return $sb.ToString()
+}
+
+if ($toStdout) {
+    [Console]::OutputEncoding = $utf8
+    $writer = New-Object IO.StreamWriter([Console]::OpenStandardOutput(), $utf8)
+} else {
+    $writer = New-Object IO.StreamWriter($jsonFile, $false, $utf8)
+}
+$writer.Write('{"targetip": "' + (ConvertTo-JsonString $hostIp) + '", "testedtime": "' +
+    (Get-Date -Format 'yyyy-MM-dd HH:mm:ss') + '", "osinfo": "' + (ConvertTo-JsonString $osInfo.Caption) + '", "result": [')
+$script:firstItem = $true
+$process = [Diagnostics.Process]::GetCurrentProcess()
+
+# 점검 1건 실행 후 결과 항목을 바로 출력
+# 인자: 진단코드 구분 진단항목 취약도(상/중/하) 점검 스크립트블록
+function Invoke-Check($code, $category, $title, $importance, [ScriptBlock]$check) {
+    $watch = [Diagnostics.Stopwatch]::StartNew()
+    $process.Refresh()
+    $cpuStart = $process.TotalProcessorTime
+    $r = & $check
+    $process.Refresh()
+    $cpu = ($process.TotalProcessorTime - $cpuStart).TotalSeconds
+    $watch.Stop()
+
+    $importanceCode = switch ($importance) { '상' { 3 } '중' { 2 } default { 1 } }
+    $resultCode = switch ($r.Status) { '양호' { 0 } '취약' { 1 } default { 2 } }
+
+    # 결과값 예산 초과 시 UTF-8 문자 경계에서 자르고 원본은 <sha256>.txt 로 보관
+    $evidence = $r.Evidence
+    $bytes = $utf8.GetBytes($evidence)
+    $extra = ''
+    if ($budget -gt 0 -and $bytes.Length -gt $budget) {
+        $sha = -join ([Security.Cryptography.SHA256]::Create().ComputeHash($bytes) | ForEach-Object { $_.ToString('x2') })
+        if (-not (Test-Path $evidenceDir)) {
+            New-Item -ItemType Directory -Path $evidenceDir | Out-Null
+            icacls "$evidenceDir" /inheritance:r /grant:r '*S-1-5-32-544:(OI)(CI)F' '*S-1-5-18:(OI)(CI)F' | Out-Null
+        }
+        [IO.File]::WriteAllBytes((Join-Path $evidenceDir "$sha.txt"), $bytes)
+        $cut = $budget
+        while ($cut -gt 0 -and ($bytes[$cut] -band 0xC0) -eq 0x80) { $cut-- }
+        $evidence = $utf8.GetString($bytes, 0, $cut) + "`n...[truncated: $budget/$($bytes.Length) bytes, sha256=$sha]"
+        $extra = ', "evidencetruncated": true, "evidencesha256": "' + $sha + '"'
+    }
+
+    if (-not $script:firstItem) { $writer.Write(',') }
+    $script:firstItem = $false
+    $writer.Write("`n  " + '{"itemcode": "' + $code + '", "title": "' + (ConvertTo-JsonString $title) +
+        '", "importance": ' + $importanceCode + ', "result": ' + $resultCode +
+        ', "resultdetail": "' + (ConvertTo-JsonString $r.Detail) + '", "category": "' + (ConvertTo-JsonString $category) +
+        '", "status": "' + (ConvertTo-JsonString $r.Status) + '", "evidence": "' + (ConvertTo-JsonString $evidence) +
+        '", "evidencebytes": ' + $bytes.Length + $extra +
+        ', "walltime": ' + $watch.Elapsed.TotalSeconds.ToString('0.000', [Globalization.CultureInfo]::InvariantCulture) +
+        ', "cputime": ' + $cpu.ToString('0.000', [Globalization.CultureInfo]::InvariantCulture) + '}')
+    $writer.Flush()
+}
+
+$guide = '클라우드 취약점 점검 가이드를 참고하시어'
+
+# ---------------------------------------------------------------------------
+# 계정관리
+# ---------------------------------------------------------------------------
+
+Invoke-Check 'W-01' '계정관리' 'Administrator 계정 이름 바꾸기' '상' {
+    $admin = $users | Where-Object { $_.SID -like '*-500' } | Select-Object -First 1
+    $ev = "기본 관리자 계정 이름: $($admin.Name)"
+    if ($admin.Name -ne 'Administrator') {
+        Result '양호' $ev 'Administrator 기본 계정 이름이 변경되어 있습니다.'
+    } else {
+        Result '취약' $ev "Administrator 기본 계정 이름을 사용하고 있습니다. $guide 로컬 보안 정책에서 Administrator 계정 이름을 변경하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-02' '계정관리' 'Guest 계정 상태' '상' {
+    $guest = $users | Where-Object { $_.SID -like '*-501' } | Select-Object -First 1
+    $ev = "Guest 계정: $($guest.Name), 사용 안 함: $($guest.Disabled)"
+    if (-not $guest -or $guest.Disabled) {
+        Result '양호' $ev 'Guest 계정이 비활성화 되어 있습니다.'
+    } else {
+        Result '취약' $ev "Guest 계정이 활성화 되어 있습니다. $guide Guest 계정을 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-03' '계정관리' '불필요한 계정 제거' '상' {
+    $enabled = @($users | Where-Object { -not $_.Disabled } | ForEach-Object { $_.Name })
+    Result '인터뷰' ("활성화된 로컬 계정: " + ($enabled -join ', ')) "$guide 불필요한 계정이 존재하는지 담당자와 확인하여 주시기 바랍니다."
+}
+
+Invoke-Check 'W-04' '계정관리' '계정 잠금 임계값 설정' '상' {
+    $count = Get-PolicyInt 'LockoutBadCount'
+    $ev = "LockoutBadCount = $count"
+    if ($count -gt 0 -and $count -le 5) {
+        Result '양호' $ev "계정 잠금 임계값이 $count 회로 설정되어 있습니다."
+    } else {
+        Result '취약' $ev "계정 잠금 임계값이 설정되어 있지 않거나 5 초과입니다. $guide 계정 잠금 임계값을 5 이하로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-05' '계정관리' '해독 가능한 암호화를 사용하여 암호 저장 해제' '상' {
+    $value = Get-PolicyInt 'ClearTextPassword'
+    $ev = "ClearTextPassword = $value"
+    if ($value -eq 0) {
+        Result '양호' $ev '해독 가능한 암호화를 사용하여 암호 저장 정책이 사용 안 함으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "해독 가능한 암호화를 사용하여 암호 저장 정책이 사용으로 설정되어 있습니다. $guide 해당 정책을 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-06' '계정관리' '관리자 그룹에 최소한의 사용자 포함' '상' {
+    Result '인터뷰' ("Administrators 그룹 구성원: " + ($adminMembers -join ', ')) "$guide Administrators 그룹에 불필요한 계정이 포함되어 있는지 담당자와 확인하여 주시기 바랍니다."
+}
+
+Invoke-Check 'W-07' '계정관리' 'Everyone 사용 권한을 익명 사용자에게 적용 해제' '중' {
+    $value = Get-PolicyReg 'System\CurrentControlSet\Control\Lsa\EveryoneIncludesAnonymous'
+    $ev = "EveryoneIncludesAnonymous = $value"
+    if ($value -eq '0') {
+        Result '양호' $ev 'Everyone 사용 권한을 익명 사용자에게 적용 정책이 사용 안 함으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "Everyone 사용 권한을 익명 사용자에게 적용 정책이 사용으로 설정되어 있습니다. $guide 해당 정책을 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-08' '계정관리' '계정 잠금 기간 설정' '중' {
+    $duration = Get-PolicyInt 'LockoutDuration'
+    $reset = Get-PolicyInt 'ResetLockoutCount'
+    $ev = "LockoutDuration = $duration, ResetLockoutCount = $reset"
+    if ($duration -ge 60 -and $reset -ge 60) {
+        Result '양호' $ev '계정 잠금 기간 및 잠금 기간 원래대로 설정 기간이 60분 이상으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "계정 잠금 기간이 설정되어 있지 않거나 60분 미만입니다. $guide 계정 잠금 기간과 원래대로 설정 기간을 60분 이상으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-09' '계정관리' '패스워드 복잡성 설정' '중' {
+    $value = Get-PolicyInt 'PasswordComplexity'
+    $ev = "PasswordComplexity = $value"
+    if ($value -eq 1) {
+        Result '양호' $ev '암호는 복잡성을 만족해야 함 정책이 사용으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "암호는 복잡성을 만족해야 함 정책이 사용 안 함으로 설정되어 있습니다. $guide 해당 정책을 사용으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-10' '계정관리' '패스워드 최소 암호 길이' '중' {
+    $value = Get-PolicyInt 'MinimumPasswordLength'
+    $ev = "MinimumPasswordLength = $value"
+    if ($value -ge 8) {
+        Result '양호' $ev "최소 암호 길이가 $value 자로 설정되어 있습니다."
+    } else {
+        Result '취약' $ev "최소 암호 길이가 8자 미만입니다. $guide 최소 암호 길이를 8자 이상으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-11' '계정관리' '패스워드 최대 사용 기간' '중' {
+    $value = Get-PolicyInt 'MaximumPasswordAge'
+    $ev = "MaximumPasswordAge = $value"
+    if ($value -gt 0 -and $value -le 90) {
+        Result '양호' $ev "최대 암호 사용 기간이 $value 일로 설정되어 있습니다."
+    } else {
+        Result '취약' $ev "최대 암호 사용 기간이 90일 이내로 설정되어 있지 않습니다. $guide 최대 암호 사용 기간을 90일 이하로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-12' '계정관리' '패스워드 최소 사용 기간' '중' {
+    $value = Get-PolicyInt 'MinimumPasswordAge'
+    $ev = "MinimumPasswordAge = $value"
+    if ($value -gt 0) {
+        Result '양호' $ev "최소 암호 사용 기간이 $value 일로 설정되어 있습니다."
+    } else {
+        Result '취약' $ev "최소 암호 사용 기간이 설정되어 있지 않습니다. $guide 최소 암호 사용 기간을 1일 이상으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-13' '계정관리' '마지막 사용자 이름 표시 안 함' '중' {
+    $value = Get-PolicyReg 'Software\Microsoft\Windows\CurrentVersion\Policies\System\DontDisplayLastUserName'
+    $ev = "DontDisplayLastUserName = $value"
+    if ($value -eq '1') {
+        Result '양호' $ev '마지막 사용자 이름 표시 안 함 정책이 사용으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "마지막 사용자 이름 표시 안 함 정책이 사용 안 함으로 설정되어 있습니다. $guide 해당 정책을 사용으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-14' '계정관리' '로컬 로그온 허용' '중' {
+    $ev = "SeInteractiveLogonRight = $($policy['SeInteractiveLogonRight'])"
+    $others = @(($policy['SeInteractiveLogonRight'] -split ',') | Where-Object { $_ -and $_ -ne '*S-1-5-32-544' -and $_ -notlike 'IUSR*' })
+    if ($others.Count -eq 0) {
+        Result '양호' $ev '로컬 로그온 허용 정책에 Administrators, IUSR 만 존재합니다.'
+    } else {
+        Result '취약' $ev "로컬 로그온 허용 정책에 Administrators, IUSR 외 다른 계정 및 그룹이 존재합니다. $guide 불필요한 계정 및 그룹을 제거하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-15' '계정관리' '익명 SID/이름 변환 허용 해제' '중' {
+    $value = Get-PolicyInt 'LSAAnonymousNameLookup'
+    $ev = "LSAAnonymousNameLookup = $value"
+    if ($value -eq 0) {
+        Result '양호' $ev '익명 SID/이름 변환 허용 정책이 사용 안 함으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "익명 SID/이름 변환 허용 정책이 사용으로 설정되어 있습니다. $guide 해당 정책을 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-16' '계정관리' '최근 암호 기억' '중' {
+    $value = Get-PolicyInt 'PasswordHistorySize'
+    $ev = "PasswordHistorySize = $value"
+    if ($value -ge 4) {
+        Result '양호' $ev "최근 암호 기억이 $value 개로 설정되어 있습니다."
+    } else {
+        Result '취약' $ev "최근 암호 기억이 4개 미만입니다. $guide 최근 암호 기억을 4개 이상으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-17' '계정관리' '콘솔 로그온 시 로컬 계정에서 빈 암호 사용 제한' '중' {
+    $value = Get-PolicyReg 'System\CurrentControlSet\Control\Lsa\LimitBlankPasswordUse'
+    $ev = "LimitBlankPasswordUse = $value"
+    if ($value -eq '1') {
+        Result '양호' $ev '콘솔 로그온 시 로컬 계정에서 빈 암호 사용 제한 정책이 사용으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "콘솔 로그온 시 로컬 계정에서 빈 암호 사용 제한 정책이 사용 안 함으로 설정되어 있습니다. $guide 해당 정책을 사용으로 설정하여 주시기 바랍니다."
+    }
+}
+
+# ---------------------------------------------------------------------------
+# 서비스관리
+# ---------------------------------------------------------------------------
+
+Invoke-Check 'W-19' '서비스관리' '공유 권한 및 사용자 그룹 설정' '상' {
+    $userShares = @($shares | Where-Object { $_.Name -notlike '*$' } | ForEach-Object { "$($_.Name) ($($_.Path))" })
+    if ($userShares.Count -eq 0) {
+        Result '양호' '일반 공유 디렉터리: 없음' '일반 공유 디렉터리가 존재하지 않습니다.'
+    } else {
+        Result '인터뷰' ("일반 공유 디렉터리: " + ($userShares -join ', ')) "$guide 공유 디렉터리 접근 권한에 Everyone 이 포함되어 있는지 확인하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-20' '서비스관리' '하드디스크 기본 공유 제거' '상' {
+    $autoShare = Get-Reg 'HKLM:\SYSTEM\CurrentControlSet\Services\LanmanServer\Parameters' 'AutoShareServer'
+    $driveShares = @($shares | Where-Object { $_.Name -match '^[A-Z]\$$' } | ForEach-Object { $_.Name })
+    $ev = "AutoShareServer = $autoShare`n기본 공유: " + ($driveShares -join ', ')
+    if ($autoShare -eq 0 -and $driveShares.Count -eq 0) {
+        Result '양호' $ev '하드디스크 기본 공유가 제거되어 있고 AutoShareServer 가 0 으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "하드디스크 기본 공유(C$, D$ 등)가 존재하거나 AutoShareServer 가 0 이 아닙니다. $guide 기본 공유를 제거하고 AutoShareServer 를 0 으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-21' '서비스관리' '불필요한 서비스 제거' '상' {
+    $names = 'Alerter', 'ClipSrv', 'Messenger', 'simptcp', 'Browser', 'TlntSvr', 'SharedAccess', 'Fax', 'upnphost', 'SSDPSRV'
+    $running = @($names | Where-Object { Test-Running $_ })
+    $ev = "실행 중인 불필요 서비스: " + ($running -join ', ')
+    if ($running.Count -eq 0) {
+        Result '양호' $ev '일반적으로 불필요한 서비스가 중지되어 있습니다.'
+    } else {
+        Result '취약' $ev "일반적으로 불필요한 서비스가 구동 중입니다. $guide 사용하지 않는 서비스를 중지하고 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-22' '서비스관리' 'IIS 서비스 구동 점검' '상' {
+    if (Test-Running 'W3SVC') {
+        Result '인터뷰' 'W3SVC: Running' "IIS 서비스가 구동 중입니다. $guide IIS 서비스가 필요한지 담당자와 확인하여 주시기 바랍니다."
+    } else {
+        Result '양호' 'W3SVC: 실행 중 아님' 'IIS 서비스를 사용하지 않습니다.'
+    }
+}
+
+Invoke-Check 'W-35' '서비스관리' '원격으로 액세스 할 수 있는 레지스트리 경로' '상' {
+    if (Test-Running 'RemoteRegistry') {
+        Result '취약' 'RemoteRegistry: Running' "Remote Registry 서비스가 구동 중입니다. $guide Remote Registry 서비스를 중지하고 사용 안 함으로 설정하여 주시기 바랍니다."
+    } else {
+        Result '양호' 'RemoteRegistry: 실행 중 아님' 'Remote Registry 서비스가 중지되어 있습니다.'
+    }
+}
+
+# ---------------------------------------------------------------------------
+# 패치관리 / 로그관리
+# ---------------------------------------------------------------------------
+
+Invoke-Check 'W-32' '패치관리' '최신 HOT FIX 적용' '상' {
+    $latest = $hotfixes | Select-Object -First 1
+    $ev = "설치된 핫픽스 수: $($hotfixes.Count)`n최근 핫픽스: $($latest.HotFixID) ($($latest.InstalledOn))"
+    Result '인터뷰' $ev "$guide 최신 보안 패치가 적용되어 있는지 담당자와 확인하여 주시기 바랍니다."
+}
+
+Invoke-Check 'W-34' '로그관리' '로그의 정기적 검토 및 보고' '상' {
+    Result '인터뷰' '담당자 확인이 필요한 항목입니다.' "$guide 로그 기록의 검토, 분석, 리포트 작성 및 보고가 정기적으로 이루어지고 있는지 점검하여 주시기 바랍니다."
+}
+
+# ---------------------------------------------------------------------------
+# 보안관리
+# ---------------------------------------------------------------------------
+
+Invoke-Check 'W-38' '보안관리' '화면보호기 설정' '상' {
+    $desktop = 'HKCU:\Control Panel\Desktop'
+    $active = Get-Reg $desktop 'ScreenSaveActive'
+    $secure = Get-Reg $desktop 'ScreenSaverIsSecure'
+    $timeout = Get-Reg $desktop 'ScreenSaveTimeOut'
+    $ev = "ScreenSaveActive = $active, ScreenSaverIsSecure = $secure, ScreenSaveTimeOut = $timeout"
+    if ($active -eq '1' -and $secure -eq '1' -and $timeout -and [int]$timeout -le 600) {
+        Result '양호' $ev '화면 보호기가 설정되어 있고 대기 시간이 10분 이하, 암호 사용이 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "화면 보호기가 설정되어 있지 않거나 암호 사용이 설정되어 있지 않습니다. $guide 화면 보호기 대기 시간을 10분 이하로, 다시 시작할 때 로그온 화면 표시를 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-40' '보안관리' '원격 시스템에서 강제로 시스템 종료' '상' {
+    $ev = "SeRemoteShutdownPrivilege = $($policy['SeRemoteShutdownPrivilege'])"
+    if (Test-AdminOnlyRight 'SeRemoteShutdownPrivilege') {
+        Result '양호' $ev '원격 시스템에서 강제로 시스템 종료 정책에 Administrators 만 존재합니다.'
+    } else {
+        Result '취약' $ev "원격 시스템에서 강제로 시스템 종료 정책에 Administrators 외 다른 계정 및 그룹이 존재합니다. $guide 해당 정책에 Administrators 만 남기고 제거하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-41' '보안관리' '보안 감사를 로그할 수 없는 경우 즉시 시스템 종료 해제' '상' {
+    $value = Get-PolicyReg 'System\CurrentControlSet\Control\Lsa\CrashOnAuditFail'
+    $ev = "CrashOnAuditFail = $value"
+    if ($value -ne '1') {
+        Result '양호' $ev '보안 감사를 로그할 수 없는 경우 즉시 시스템 종료 정책이 사용 안 함으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "보안 감사를 로그할 수 없는 경우 즉시 시스템 종료 정책이 사용으로 설정되어 있습니다. $guide 해당 정책을 사용 안 함으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-42' '보안관리' 'SAM 계정과 공유의 익명 열거 허용 안 함' '상' {
+    $anonymous = Get-PolicyReg 'System\CurrentControlSet\Control\Lsa\RestrictAnonymous'
+    $anonymousSam = Get-PolicyReg 'System\CurrentControlSet\Control\Lsa\RestrictAnonymousSAM'
+    $ev = "RestrictAnonymous = $anonymous, RestrictAnonymousSAM = $anonymousSam"
+    if ($anonymous -eq '1' -and $anonymousSam -eq '1') {
+        Result '양호' $ev 'SAM 계정과 공유의 익명 열거 허용 안 함 정책이 사용으로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "SAM 계정과 공유의 익명 열거 허용 안 함 정책이 사용 안 함으로 설정되어 있습니다. $guide 해당 정책을 사용으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-43' '보안관리' 'Autologon 기능 제어' '상' {
+    $value = Get-Reg 'HKLM:\SOFTWARE\Microsoft\Windows NT\CurrentVersion\Winlogon' 'AutoAdminLogon'
+    $ev = "AutoAdminLogon = $value"
+    if ($value -ne '1') {
+        Result '양호' $ev 'Autologon 기능이 사용되지 않습니다.'
+    } else {
+        Result '취약' $ev "Autologon 기능이 사용되고 있습니다. $guide AutoAdminLogon 값을 0 으로 설정하여 주시기 바랍니다."
+    }
+}
+
+Invoke-Check 'W-44' '보안관리' '이동식 미디어 포맷 및 꺼내기 허용' '상' {
+    $value = Get-PolicyReg 'Software\Microsoft\Windows NT\CurrentVersion\Winlogon\AllocateDASD'
+    $ev = "AllocateDASD = $value"
+    if (-not $value -or $value -eq '0') {
+        Result '양호' $ev '이동식 미디어 포맷 및 꺼내기 허용 정책이 Administrators 로 설정되어 있습니다.'
+    } else {
+        Result '취약' $ev "이동식 미디어 포맷 및 꺼내기 허용 정책이 Administrators 외 사용자에게 허용되어 있습니다. $guide 해당 정책을 Administrators 로 설정하여 주시기 바랍니다."
+    }
+}
+
+$writer.Write("`n]}`n")
+$writer.Close()
+
+# 잘린 결과값의 원본을 압축 파일로 보관 (tar.exe 가 없는 버전은 디렉터리로 남김)
+if ((Test-Path $evidenceDir) -and (Get-Command tar.exe)) {
+    Remove-Item $evidenceArchive -Force
+    tar.exe czf "$evidenceArchive" -C "$evidenceDir" . 2>$null
+    if ($LASTEXITCODE -eq 0) {
+        Remove-Item $evidenceDir -Recurse -Force
+        # Administrators, SYSTEM 만 읽을 수 있도록 상속 권한 제거
+        icacls "$evidenceArchive" /inheritance:r /grant:r '*S-1-5-32-544:F' '*S-1-5-18:F' | Out-Null
+    }
+}
+
+if (-not $toStdout) {
+    [Console]::Error.WriteLine("Windows check results written to $jsonFile")
+}
@@ -0,0 +1,111 @@
+#!/bin/bash
+
+# 설정 스냅샷 수집 (점검 없이 수집만 수행)
+# 인자로 받은 파일(glob 가능)과 명령 출력(cmd:<이름>)을 읽어, 내용을 sha256 으로 주소화한 JSON 을 표준 출력으로 출력한다.
+# 판정은 제어 노드에서 check_engine.py 가 규칙 레지스트리로 수행한다.
+#   {targetip, osinfo, collectedtime, sources: {원본: sha256}, blobs: {sha256: 내용}}
+# --known 으로 받은 sha256 앞 16자리와 같은 내용은 제어 노드에 이미 있으므로 blobs 에서 제외한다.
+# become 의 pty 에서는 표준 오류가 섞이므로 JSON 앞뒤에 @@CCE_JSON_BEGIN@@ / @@CCE_JSON_END@@ 줄을 출력한다.
+#
+# 사용법: collect.sh [--known 해시1,해시2,...] /etc/passwd '/etc/xinetd.d/*' cmd:ps ...
+
+export LC_ALL=C
+
+# 수집 가능한 명령 출력
+declare -A COMMANDS=(
+    [ps]="ps -eo comm="
+    [enabled_units]="systemctl list-unit-files --state=enabled --no-legend --no-pager"
+)
+
+# 내용이 sha256 과 일치해야 하므로 제어 문자도 지우지 않고 \uXXXX 로 이스케이프
+json_escape() {
+    local c u
+    REPLY=$1
+    REPLY=${REPLY//\\/\\\\}
+    REPLY=${REPLY//\"/\\\"}
+    REPLY=${REPLY//$'\n'/\\n}
+    REPLY=${REPLY//$'\r'/\\r}
+    REPLY=${REPLY//$'\t'/\\t}
+    while [[ $REPLY =~ [[:cntrl:]] ]]; do
+        c=${BASH_REMATCH[0]}
+        printf -v u '\\u%04x' "'$c"
+        REPLY=${REPLY//"$c"/$u}
+    done
+}
+
+# 제어 노드에 이미 있는 내용 (sha256 앞 16자리)
+declare -A known
+if [ "$1" = "--known" ]; then
+    IFS=',' read -r -a known_list <<< "$2"
+    for prefix in "${known_list[@]}"; do
+        known[$prefix]=1
+    done
+    shift 2
+fi
+
+work=$(mktemp -d /tmp/cce_collect.XXXXXX) || exit 1
+trap 'rm -rf "$work"' EXIT
+
+# 수집 대상 목록 (원본 이름, 읽을 파일)
+sources=()
+paths=()
+shopt -s nullglob
+for pattern in "$@"; do
+    if [[ $pattern == cmd:* ]]; then
+        name=${pattern#cmd:}
+        [ -n "${COMMANDS[$name]}" ] || continue
+        ${COMMANDS[$name]} > "$work/$name" 2>/dev/null || continue
+        sources+=("$pattern")
+        paths+=("$work/$name")
+    else
+        for path in $pattern; do
+            [ -f "$path" ] && [ -r "$path" ] || continue
+            sources+=("$path")
+            paths+=("$path")
+        done
+    fi
+done
+shopt -u nullglob
+
+# sha256 은 한 번의 sha256sum 실행으로 계산
+hashes=()
+if [ ${#paths[@]} -gt 0 ]; then
+    mapfile -t hashes < <(sha256sum -- "${paths[@]}" 2>/dev/null | cut -d ' ' -f 1)
+fi
+
+ip=$(hostname -I 2>/dev/null | awk '{print $1}')
+os_version=""
+if [ -r /etc/redhat-release ]; then
+    os_version=$(</etc/redhat-release)
+elif [ -r /etc/os-release ]; then
+    os_version=$(. /etc/os-release && echo "$PRETTY_NAME")
+fi
+
+json_escape "$ip"; j_ip=$REPLY
+json_escape "$os_version"; j_os=$REPLY
+printf '@@CCE_JSON_BEGIN@@\n'
+printf '{"targetip": "%s", "osinfo": "%s", "collectedtime": "%s", "sources": {' \
+    "$j_ip" "$j_os" "$(date '+%Y-%m-%d %H:%M:%S')"
+for i in "${!sources[@]}"; do
+    json_escape "${sources[$i]}"
+    [ "$i" = 0 ] || printf ', '
+    printf '"%s": "%s"' "$REPLY" "${hashes[$i]}"
+done
+printf '}, "blobs": {'
+
+# 내용이 같은 원본은 한 번만 출력하고, 제어 노드에 이미 있는 내용은 출력하지 않음
+declare -A written
+first=1
+for i in "${!paths[@]}"; do
+    sha=${hashes[$i]}
+    [ -n "${written[$sha]}" ] || [ -n "${known[${sha:0:16}]}" ] && continue
+    written[$sha]=1
+    # 바이트 그대로 읽음 ($(<파일) 은 끝의 줄바꿈을 지워 sha256 과 달라지므로 표시 문자를 붙였다가 제거)
+    content=$(cat -- "${paths[$i]}"; printf x)
+    json_escape "${content%x}"
+    [ $first = 1 ] || printf ', '
+    printf '"%s": "%s"' "$sha" "$REPLY"
+    first=0
+done
+printf '}}\n'
+printf '@@CCE_JSON_END@@\n'
@@ -2,11 +2,159 @@
 
 # 실행할 스크립트 파일들을 배열에 추가
 scripts=(U-01.sh U-02.sh U-03.sh U-04.sh U-05.sh U-06.sh U-07.sh U-08.sh U-09.sh U-10.sh U-11.sh U-12.sh U-13.sh U-14.sh U-15.sh U-16.sh U-17.sh U-18.sh U-19.sh U-20.sh U-21.sh U-22.sh U-23.sh U-24.sh U-25.sh U-26.sh U-27.sh U-28.sh U-29.sh U-30.sh U-31.sh U-32.sh U-33.sh U-34.sh U-35.sh U-36.sh info.sh)
+CHECK_DIR="./linux"
 
-# 배열에 추가한 스크립트 파일들을 차례대로 실행
-for script in "${scripts[@]}"
-do
-    dos2unix "./linux/$script"
-    bash "./linux/$script"
-    echo "[$script] execution completed."
+# 동시 실행 점검 수 (-j N 또는 CCE_JOBS, 기본값 1: 순차 실행, 0: CPU 코어 수)
+jobs=${CCE_JOBS:-1}
+while getopts "j:l" opt; do
+    case $opt in
+        j) jobs=$OPTARG ;;
+        l) CCE_LOW_IMPACT=1 ;;
+        *) echo "usage: $0 [-j jobs] [-l]" >&2; exit 1 ;;
+    esac
 done
+if [ "$jobs" = 0 ]; then
+    jobs=$(nproc 2>/dev/null || echo 1)
+fi
+
+# 저부하 모드 (-l 또는 CCE_LOW_IMPACT=1): 운영 중인 서버를 업무 시간에 점검할 때 사용
+# 러너와 이후 실행되는 모든 점검의 CPU/IO 우선순위를 낮추고, 점검은 순차 실행하며,
+# 파일시스템 순회 속도를 CCE_WALK_RATE (기본값 초당 5000 항목) 로 제한
+# IO 는 idle 클래스 대신 best-effort 최저 순위를 사용 (부하가 계속되는 DB 서버에서도 점검이 끝나도록)
+if [ "$CCE_LOW_IMPACT" = 1 ]; then
+    renice -n 19 -p $$ >/dev/null 2>&1
+    ionice -c 2 -n 7 -p $$ >/dev/null 2>&1
+    jobs=1
+    export CCE_WALK_RATE=${CCE_WALK_RATE:-5000}
+fi
+
+# 여러 점검 항목이 공통으로 읽는 설정 파일 (실행마다 한 번만 읽어 스냅샷으로 고정)
+snapshot_files=(
+    /etc/passwd
+    /etc/securetty
+    /etc/ssh/sshd_config
+    /etc/pam.d/system-auth
+    /etc/pam.d/password-auth
+    /etc/security/pwquality.conf
+    /etc/login.defs
+    /etc/inetd.conf
+    /etc/xinetd.conf*
+    /etc/xinetd.d
+)
+
+# 줄바꿈 변환은 전체 스크립트에 대해 한 번만 수행
+dos2unix -q "${scripts[@]/#/$CHECK_DIR/}" "$CHECK_DIR/fs_index.sh" "$CHECK_DIR/report.sh" 2>/dev/null
+
+# 공통 설정 파일 스냅샷 생성 (가능하면 메모리 기반 /dev/shm 사용)
+snapshot_base=/tmp
+[ -d /dev/shm ] && [ -w /dev/shm ] && snapshot_base=/dev/shm
+CCE_SNAPSHOT=$(mktemp -d "$snapshot_base/cce_snapshot.XXXXXX") || CCE_SNAPSHOT=""
+if [ -n "$CCE_SNAPSHOT" ]; then
+    trap 'rm -rf "$CCE_SNAPSHOT"' EXIT
+    for path in "${snapshot_files[@]}"; do
+        [ -e "$path" ] && cp -a --parents "$path" "$CCE_SNAPSHOT" 2>/dev/null
+    done
+fi
+export CCE_SNAPSHOT
+
+# 결과 기록 함수 로드 (점검 결과를 CSV 와 JSON 으로 함께 기록)
+source "$CHECK_DIR/report.sh"
+
+# 파일시스템을 한 번만 순회하여 U-07, U-14, U-16 이 공유하는 인덱스 생성
+# 순회도 제한 시간(CCE_FS_INDEX_TIMEOUT) 안에서 실행하며, 넘기면 세 점검은 부분 인덱스로 타임아웃 기록
+source "$CHECK_DIR/fs_index.sh"
+if [ -n "$CCE_SNAPSHOT" ]; then
+    CCE_FS_INDEX="$CCE_SNAPSHOT/fs_index"
+    cce_build_fs_index "$CCE_FS_INDEX"
+else
+    cce_fs_index_ready
+fi || echo "[fs_index] 파일시스템 순회가 제한 시간(${CCE_FS_INDEX_TIMEOUT}초)을 넘겨 중단되었습니다."
+export CCE_FS_INDEX
+tested_time=$(date '+%Y-%m-%d %H:%M:%S')
+rm -f "linux_report_$USER.jsonl" "linux_report_$USER.host" "linux_report_$USER.timing" "linux_report_$USER.evidence.tar.gz" \
+    "linux_report_$USER.timeout"
+rm -rf "linux_report_$USER.evidence"
+
+# 점검 스크립트를 한 번만 읽어 함수로 등록 (점검마다 bash를 새로 실행하지 않음)
+# 타임아웃 결과 기록에 쓰도록 스크립트의 결과 기록 인자에서 구분, 진단항목, 취약도를 함께 읽어 둠
+meta_re='"([^"]*)" "[^"]*" "([^"]*)" "(상|중|하)"'
+for i in "${!scripts[@]}"; do
+    body=$(<"$CHECK_DIR/${scripts[$i]}")
+    if [[ $body =~ $meta_re ]]; then
+        CCE_CHECK_META[${scripts[$i]%.sh}]="${BASH_REMATCH[1]}|${BASH_REMATCH[2]}|${BASH_REMATCH[3]}"
+    fi
+    if ! eval "cce_check_$i() {
+$body
+}" 2>/dev/null; then
+        # 함수로 등록할 수 없는 스크립트는 기존 방식대로 별도 프로세스로 실행
+        eval "cce_check_$i() { bash \"$PWD/$CHECK_DIR/${scripts[$i]}\"; }"
+    fi
+done
+unset body meta_re
+
+# 등록한 점검 함수를 차례대로 실행
+# 서브셸에서 실행하여 점검 간 변수 공유와 exit 에 의한 러너 종료를 방지 (수행 시간도 함께 기록)
+run_sequential() {
+    for i in "${!scripts[@]}"; do
+        cce_report_timed "${scripts[$i]%.sh}" "cce_check_$i"
+        echo "[${scripts[$i]}] execution completed."
+    done
+}
+
+# 점검 함수를 최대 $jobs 개까지 동시에 실행
+# 각 점검은 별도 작업 디렉터리에서 실행하고, 완료 후 진단코드 순서대로 결과를 병합
+run_parallel() {
+    local work pids=() i
+    work=$(mktemp -d "${CCE_SNAPSHOT:-/tmp}/cce_jobs.XXXXXX") || { run_sequential; return; }
+
+    for i in "${!scripts[@]}"; do
+        if [ ${#pids[@]} -ge "$jobs" ]; then
+            if (( BASH_VERSINFO[0] > 4 || (BASH_VERSINFO[0] == 4 && BASH_VERSINFO[1] >= 3) )); then
+                wait -n
+            else
+                wait "${pids[0]}"
+            fi
+            local running=() pid
+            for pid in "${pids[@]}"; do
+                kill -0 "$pid" 2>/dev/null && running+=("$pid")
+            done
+            pids=("${running[@]}")
+        fi
+        mkdir -p "$work/$i"
+        : > "$work/$i/linux_report_$USER.csv"
+        ( cd "$work/$i" && cce_report_timed "${scripts[$i]%.sh}" "cce_check_$i" ) > "$work/$i.log" 2>&1 &
+        pids+=($!)
+    done
+    wait
+
+    # 결과 파일은 새로 작성하고 점검 순서대로 이어 붙임 (순차 실행 시 U-01 이 새로 작성하는 것과 동일)
+    : > "linux_report_$USER.csv"
+    for i in "${!scripts[@]}"; do
+        (
+            cd "$work/$i" && find . -type f | sort | while IFS= read -r file; do
+                # 결과값 원본은 sha256 이름이므로 이미 있으면 그대로 사용하고,
+                # 새로 만드는 디렉토리와 파일은 cce_report 와 같이 소유자만 읽을 수 있게 생성
+                case $file in
+                    ./linux_report_*.evidence/*)
+                        [ -e "$OLDPWD/$file" ] && continue
+                        (umask 077; mkdir -p "$OLDPWD/$(dirname "$file")" && cat "$file" > "$OLDPWD/$file")
+                        continue ;;
+                esac
+                mkdir -p "$OLDPWD/$(dirname "$file")"
+                cat "$file" >> "$OLDPWD/$file"
+            done
+        )
+        cat "$work/$i.log"
+        echo "[${scripts[$i]}] execution completed."
+    done
+    rm -rf "$work"
+}
+
+if [ "$jobs" -gt 1 ]; then
+    run_parallel
+else
+    run_sequential
+fi
+
+# 대시보드 스키마의 JSON 결과 작성 (linux_report_$USER.json)
+cce_report_finish "$tested_time"
@@ -1,13 +1,16 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # /etc/pam.d/system-auth 파일이 있는지 확인
-if [[ ! -f "/etc/pam.d/system-auth" ]]; then
+if [[ ! -f "${CCE_SNAPSHOT}/etc/pam.d/system-auth" ]]; then
   echo "ERROR: /etc/pam.d/system-auth file not found!"
   exit 1
 fi
 
 # enforce_for_root 설정 확인
-if grep -q "enforce_for_root" /etc/pam.d/system-auth; then
+if grep -q "enforce_for_root" "${CCE_SNAPSHOT}/etc/pam.d/system-auth"; then
   enforce_root="설정되어 있습니다"
 else
   enforce_root="설정되어 있지 않습니다"
@@ -15,24 +18,24 @@ fi
 
 # lcredit, dcredit, ucredit, ocredit 중 몇 개가 포함되어 있는지 확인
 credit_count=0
-if grep -q "lcredit" /etc/pam.d/system-auth; then
+if grep -q "lcredit" "${CCE_SNAPSHOT}/etc/pam.d/system-auth"; then
   ((credit_count++))
 fi
-if grep -q "dcredit" /etc/pam.d/system-auth; then
+if grep -q "dcredit" "${CCE_SNAPSHOT}/etc/pam.d/system-auth"; then
   ((credit_count++))
 fi
-if grep -q "ucredit" /etc/pam.d/system-auth; then
+if grep -q "ucredit" "${CCE_SNAPSHOT}/etc/pam.d/system-auth"; then
   ((credit_count++))
 fi
-if grep -q "ocredit" /etc/pam.d/system-auth; then
+if grep -q "ocredit" "${CCE_SNAPSHOT}/etc/pam.d/system-auth"; then
   ((credit_count++))
 fi
 
 # minlen 값을 읽어옴
-minlen=$(grep -E "minlen=[0-9]+" /etc/security/pwquality.conf | sed -E 's/.*minlen=([0-9]+).*/\1/')
+minlen=$(grep -E "minlen=[0-9]+" "${CCE_SNAPSHOT}/etc/security/pwquality.conf" | sed -E 's/.*minlen=([0-9]+).*/\1/')
 
 # pwquality.conf 파일에서 복잡도 설정 값 확인
-pwquality_config=$(grep -E "lcredit|dcredit|ucredit|ocredit|minlen" /etc/security/pwquality.conf)
+pwquality_config=$(grep -E "lcredit|dcredit|ucredit|ocredit|minlen" "${CCE_SNAPSHOT}/etc/security/pwquality.conf")
 
 # credit 옵션이 2개 이상이고 minlen이 10 이상인 경우 양호로 판단
 if [[ $credit_count -eq 2 && $minlen -ge 10 ]]; then
@@ -51,4 +54,4 @@ else
 fi
 
 # 결과를 csv 파일에 저장
-echo -e "계정관리,U-02,패스워드 복잡성 설정,상,$result,\"cat /etc/pam.d/system-auth | grep minlen | awk '{print \\\$7}'의 결과값입니다 : minlen=$minlen \ncat /etc/pam.d/system-auth | grep minlen | awk '{print \\\$8, \\\$9, \\\$10, \\\$11}'의 결과값입니다 : credit=$credit \n패스워드 복잡도 설정 값: $pwquality_config \nenforce_for_root 설정: $enforce_root\",$detail" >> linux_report_$USER.csv
+cce_report "계정관리" "U-02" "패스워드 복잡성 설정" "상" "$result" "cat /etc/pam.d/system-auth | grep minlen | awk '{print \\\$7}'의 결과값입니다 : minlen=$minlen \ncat /etc/pam.d/system-auth | grep minlen | awk '{print \\\$8, \\\$9, \\\$10, \\\$11}'의 결과값입니다 : credit=$credit \n패스워드 복잡도 설정 값: $pwquality_config \nenforce_for_root 설정: $enforce_root" "$detail"
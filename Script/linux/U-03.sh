@@ -1,12 +1,15 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # /etc/pam.d/system-auth에서 preauth와 authfail의 deny 값 추출
-preauth_system=$(grep -Po '^[^#]*pam_faillock.so.*preauth.*deny=\K\d+' /etc/pam.d/system-auth)
-authfail_system=$(grep -Po '^[^#]*pam_faillock.so.*authfail.*deny=\K\d+' /etc/pam.d/system-auth)
+preauth_system=$(grep -Po '^[^#]*pam_faillock.so.*preauth.*deny=\K\d+' "${CCE_SNAPSHOT}/etc/pam.d/system-auth")
+authfail_system=$(grep -Po '^[^#]*pam_faillock.so.*authfail.*deny=\K\d+' "${CCE_SNAPSHOT}/etc/pam.d/system-auth")
 
 # /etc/pam.d/password-auth에서 preauth와 authfail의 deny 값 추출
-preauth_password=$(grep -Po '^[^#]*pam_faillock.so.*preauth.*deny=\K\d+' /etc/pam.d/password-auth)
-authfail_password=$(grep -Po '^[^#]*pam_faillock.so.*authfail.*deny=\K\d+' /etc/pam.d/password-auth)
+preauth_password=$(grep -Po '^[^#]*pam_faillock.so.*preauth.*deny=\K\d+' "${CCE_SNAPSHOT}/etc/pam.d/password-auth")
+authfail_password=$(grep -Po '^[^#]*pam_faillock.so.*authfail.*deny=\K\d+' "${CCE_SNAPSHOT}/etc/pam.d/password-auth")
 
 # 초기 상태 설정
 final_result="양호"
@@ -27,4 +30,4 @@ if [[ -z $preauth_password ]] || ! [[ $preauth_password =~ ^[0-9]+$ ]] || (( pre
 fi
 
 # 결과 출력 (한 줄로 결합)
-echo -e "계정관리,U-03,계정 잠금 임계값 설정,상,$final_result,\"/etc/pam.d/system-auth의 preauth와 authfail의 deny 값 : preauth $preauth_system, authfail $authfail_system,\n/etc/pam.d/password-auth의 preauth와 authfail의 deny 값 : preauth $preauth_password, authfail $authfail_password\",\"$message\"" >> linux_report_$USER.csv
+cce_report "계정관리" "U-03" "계정 잠금 임계값 설정" "상" "$final_result" "/etc/pam.d/system-auth의 preauth와 authfail의 deny 값 : preauth $preauth_system, authfail $authfail_system,\n/etc/pam.d/password-auth의 preauth와 authfail의 deny 값 : preauth $preauth_password, authfail $authfail_password" "$message"
@@ -1,7 +1,15 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
+# 공용 파일시스템 인덱스 사용 (단독 실행 시 직접 생성)
+declare -F cce_fs_index_ready >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/fs_index.sh"
+# 순회가 제한 시간을 넘긴 부분 인덱스로는 판정하지 않음
+cce_fs_index_ready || { cce_report_fs_index_timeout "U-14" suid; exit 0; }
+
 # SUID/SGID 파일 검색
-suid_files=$(find / -user root -type f \( -perm -4000 -o -perm -2000 \) -exec ls -lg {} \; 2>/dev/null | tr '\n' '|')
+suid_files=$(xargs -r -d '\n' ls -lg < "$CCE_FS_INDEX/suid" 2>/dev/null | tr '\n' '|')
 
 #if [[ -n "$suid_files" ]]; then
     #vulnerability_found=0  # 취약점 발견 여부 플래그
@@ -24,7 +32,7 @@ suid_files=$(find / -user root -type f \( -perm -4000 -o -perm -2000 \) -exec ls
     #fi
 #else
     # setuid가 설정된 파일을 찾지 못한 경우
-    echo -e "파일 및 디렉토리 관리,U-14,SUID SGID Sticy bit 설정 파일 점검,상,인터뷰,담당자 확인이 필요한 항목입니다.,\"클라우드 취약점 점검 가이드를 참고하시어 SUID,GUID 파일의 접근권한이 적절하게 설정되어 있는지 점검하여 주시기 바랍니다.\n추가 점검 명령어: find / -user root -type f \( -perm -4000 -o -perm -2000 \) -exec ls -lg {} \;\"">> linux_report_$USER.csv
+    cce_report "파일 및 디렉토리 관리" "U-14" "SUID SGID Sticy bit 설정 파일 점검" "상" "인터뷰" "담당자 확인이 필요한 항목입니다." "클라우드 취약점 점검 가이드를 참고하시어 SUID,GUID 파일의 접근권한이 적절하게 설정되어 있는지 점검하여 주시기 바랍니다.\n추가 점검 명령어: find / -user root -type f \( -perm -4000 -o -perm -2000 \) -exec ls -lg {} \;"
 #fi
 
 
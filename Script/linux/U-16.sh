@@ -1,7 +1,15 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
+# 공용 파일시스템 인덱스 사용 (단독 실행 시 직접 생성)
+declare -F cce_fs_index_ready >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/fs_index.sh"
+# 순회가 제한 시간을 넘긴 부분 인덱스로는 판정하지 않음
+cce_fs_index_ready || { cce_report_fs_index_timeout "U-16" world_writable; exit 0; }
+
 # world writable 파일 검색
-#writable_files=$(find / -type f ! \( -path "/proc*" -o -path "sys/fs*" -o -path "/usr/local*" -prune \) -perm -2 -exec ls -al {} \; 2>/dev/null)
+writable_files=$(xargs -r -d '\n' ls -al < "$CCE_FS_INDEX/world_writable" 2>/dev/null)
 
 #result="양호"
 #detail="world writable 파일이 존재하지 않거나 존재 시 설정 이유를 확인하고 있는 경우입니다."
@@ -19,7 +27,7 @@
 #fi
 
 # 결과에 따라 리포트 파일에 추가
-echo -e "파일 및 디렉토리 관리,U-16,world writable 파일 점검,상,인터뷰,담당자 확인이 필요한 항목입니다.,\"클라우드 취약점 점검 가이드를 참고하시어 world writable 파일의 존재 유무와 존재 시 설정 이유를 확인하여 주시기 바랍니다.\n추가 점검 명령어: find / -type f ! \( -path '/proc*' -o -path 'sys/fs*' -o -path '/usr/local*' -prune \) -perm -2 -exec ls -al {} \;\"" >> linux_report_$USER.csv
+cce_report "파일 및 디렉토리 관리" "U-16" "world writable 파일 점검" "상" "인터뷰" "담당자 확인이 필요한 항목입니다.\nworld writable 파일 목록 : \n$writable_files" "클라우드 취약점 점검 가이드를 참고하시어 world writable 파일의 존재 유무와 존재 시 설정 이유를 확인하여 주시기 바랍니다.\n추가 점검 명령어: find / -type f ! \( -path '/proc*' -o -path 'sys/fs*' -o -path '/usr/local*' -prune \) -perm -2 -exec ls -al {} \;"
 
 
 
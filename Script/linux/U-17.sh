@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # 서비스 사용 여부 확인
 check_service_usage() {
     services=("rlogin" "shell" "exec")
@@ -77,9 +80,9 @@ fi
 
 # 결과를 CSV 파일에 저장
 if [ "$result" == "양호" ]; then
-    echo -e "파일 및 디렉토리 관리,U-17,rlogin//shell//exec 서비스 비활성화,상,$result,\"chkconfig --list $service 2>/dev/null | egrep '(on|활성)' 결과입니다 : 그런 파일이나 디렉터리가 없습니다.${IFS}/etc/hosts.equiv $HOME/.rhosts 결과입니다 : 그런 파일이나 디렉터리가 없습니다.\",$detail" >> linux_report_$USER.csv
+    cce_report "파일 및 디렉토리 관리" "U-17" "rlogin//shell//exec 서비스 비활성화" "상" "$result" "chkconfig --list $service 2>/dev/null | egrep '(on|활성)' 결과입니다 : 그런 파일이나 디렉터리가 없습니다.${IFS}/etc/hosts.equiv $HOME/.rhosts 결과입니다 : 그런 파일이나 디렉터리가 없습니다." "$detail"
 else
-    echo -e "파일 및 디렉토리 관리,U-17,rlogin//shell//exec 서비스 비활성화,상,$result,\"chkconfig --list $service 2>/dev/null | egrep '(on|활성)' 결과입니다 : $service 서비스가 활성화되어 있습니다.${IFS}/etc/hosts.equiv $HOME/.rhosts 결과입니다 : 파일 소유자 및 권한을 확인하세요.\",$detail" >> linux_report_$USER.csv
+    cce_report "파일 및 디렉토리 관리" "U-17" "rlogin//shell//exec 서비스 비활성화" "상" "$result" "chkconfig --list $service 2>/dev/null | egrep '(on|활성)' 결과입니다 : $service 서비스가 활성화되어 있습니다.${IFS}/etc/hosts.equiv $HOME/.rhosts 결과입니다 : 파일 소유자 및 권한을 확인하세요." "$detail"
 fi
 }
 
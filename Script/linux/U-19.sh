@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # 점검할 파일과 예상되는 소유자 및 권한 설정
 declare -A files=(
     ["/etc/crontab"]="root:root 640"
@@ -69,4 +72,4 @@ else
 fi
 
 # Append check result to report
-echo -e "파일 및 디렉터리 관리,U-19,cron 파일 소유자 및 권한 설정,상,$overall_status,\"$command_output\",\"$detail\"" >> linux_report_$USER.csv
+cce_report "파일 및 디렉터리 관리" "U-19" "cron 파일 소유자 및 권한 설정" "상" "$overall_status" "$command_output" "$detail"
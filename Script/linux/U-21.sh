@@ -1,7 +1,10 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # 진단 명령어 변수 정의 및 실행 결과 저장
-passwd=$(grep "^ftp:" "/etc/passwd")
+passwd=$(grep "^ftp:" "${CCE_SNAPSHOT}/etc/passwd")
 proftpd=$(cat /etc/proftpd/proftpd.con | grep -i "UserAlias" )
 vsftpd=$(cat /etc/vsftpd/vsftpd.conf | grep -i "anonymous_enable=yes")
 
@@ -9,8 +12,8 @@ detail_vul='Anonymous FTP 접속을 차단하고 있지 않습니다. 클라우
 detail_good='Anonymous FTP 접속을 차단하고 있습니다.'
 
 # /etc/passwd 파일 확인
-if [ -f "/etc/passwd" ]; then
-    if grep -q "^ftp:" "/etc/passwd"; then
+if [ -f "${CCE_SNAPSHOT}/etc/passwd" ]; then
+    if grep -q "^ftp:" "${CCE_SNAPSHOT}/etc/passwd"; then
         result1='취약'
     else
         result1='양호'
@@ -37,13 +40,13 @@ fi
 
 # 결과를 CSV 파일에 저장
 if [ "$result1" = '양호' ] && [ "$result2" = '양호' ] && [ "$result3" = '양호' ]; then
-    printf "서비스 관리,U-21,Anonymous FTP 비활성화,상,양호,\"/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd\",\"$detail_good\"\n" >> linux_report_$USER.csv
+    cce_report "서비스 관리" "U-21" "Anonymous FTP 비활성화" "상" "양호" "/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd" "$detail_good"
 else
-    printf "서비스 관리,U-21,Anonymous FTP 비활성화,상,취약,\"/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd\",\"$detail_vul\"\n" >> linux_report_$USER.csv
+    cce_report "서비스 관리" "U-21" "Anonymous FTP 비활성화" "상" "취약" "/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd" "$detail_vul"
 fi
 
 # 세 개의 파일이 전부 없는 경우 N/A 처리
-if [ ! -f "/etc/passwd" ] && [ ! -f "/etc/proftpd/proftpd.conf" ] && [ ! -f "/etc/vsftpd/vsftpd.conf" ]; then
-    printf "서비스 관리,U-21,Anonymous FTP 비활성화,상,N/A,\"/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd\",\"Anonymous FTP를 사용하고 있지 않습니다.\"\n" >> linux_report_$USER.csv
+if [ ! -f "${CCE_SNAPSHOT}/etc/passwd" ] && [ ! -f "/etc/proftpd/proftpd.conf" ] && [ ! -f "/etc/vsftpd/vsftpd.conf" ]; then
+    cce_report "서비스 관리" "U-21" "Anonymous FTP 비활성화" "상" "N/A" "/etc/passwd | grep ftp의 결과입니다 : $passwd\n*****\ngrep UserAlias /etc/proftpd/proftpd.conf && ! grep ^# /etc/proftpd/proftpd.conf | grep UserAlias의 결과입니다 : $proftpd\n*****\ngrep -iq anonymous_enable=yes /etc/vsftpd/vsftpd.conf의 결과입니다 : $vsftpd" "Anonymous FTP를 사용하고 있지 않습니다."
 fi
 
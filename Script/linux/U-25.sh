@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 export LANG=ko_KR.UTF-8
 
 if showmount -e localhost &>/dev/null; then
@@ -12,17 +15,17 @@ if showmount -e localhost &>/dev/null; then
       detail="NFS 서비스를 사용하고 있으며 everyone 공유를 제한하고 있는 상태입니다."
       command=$(showmount -e $HOSTMANE | grep everyone | wc -l)
       comment="showmount -e \$HOSTNAME | grep everyone | wc -l의 결과값입니다 : "
-		echo "서비스 관리,U-25,NFS 접근통제,상,양호,$comment $command, $detail" >> linux_report_$USER.csv
+		cce_report "서비스 관리" "U-25" "NFS 접근통제" "상" "양호" "$comment $command" "$detail"
 	else
       detail="NFS 서비스를 사용하고 있으며 everyone 공유를 제한하고 있지 않은 상태입니다. 클라우드 취약점 점검 가이드를 참고하시어 everyone 마운트를 제거하시고 /etc/exports 파일에서 접근 통제 설정을 해주시기 바랍니다."
       command=$(showmount -e $HOSTMANE | grep everyone | wc -l)
       comment="showmount -e \$HOSTNAME | grep everyone | wc -l의 결과값입니다 : "
-		echo "서비스 관리,U-25,NFS 접근통제,상,취약, $comment $command, $detail" >> linux_report_$USER.csv
+		cce_report "서비스 관리" "U-25" "NFS 접근통제" "상" "취약" "$comment $command" "$detail"
 	fi
 else
    detail="NFS 서비스를 사용하고 있지 않은 상태입니다."
    command=$(showmount -e localhost &>/dev/null)
    comment="showmount -e localhost &>dev/null의 결과값입니다 : "
-	echo "서비스 관리,U-25,NFS 접근통제,상,N/A,$comment $command,$detail" >> linux_report_$USER.csv
+	cce_report "서비스 관리" "U-25" "NFS 접근통제" "상" "N/A" "$comment $command" "$detail"
 	exit 1
 fi
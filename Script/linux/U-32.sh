@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 # SMTP 확인
 if ps -ef | grep -v grep | grep -q sendmail; then
     # SMTP 서비스 사용
@@ -24,4 +27,4 @@ else
     comment="ps -ef | grep -v grep | grep -q sendmail의 결과값입니다 : "
 fi
 
-echo "서비스 관리,U-32,일반사용자의 Sendmail 실행 방지,상,$result,$comment $command,$detail" >> linux_report_$USER.csv
+cce_report "서비스 관리" "U-32" "일반사용자의 Sendmail 실행 방지" "상" "$result" "$comment $command" "$detail"
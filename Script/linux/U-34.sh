@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 FILE=/etc/named.conf
 
 # DNS 서비스 확인
@@ -27,4 +30,4 @@ else
 	fi
 fi
 
-echo "서비스 관리,U-34,DNS ZoneTransfer 설정,상,$result,$comment $command,$detail" >> linux_report_$USER.csv
+cce_report "서비스 관리" "U-34" "DNS ZoneTransfer 설정" "상" "$result" "$comment $command" "$detail"
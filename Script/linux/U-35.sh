@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 #진단기준:
 #양호 - 패치 적용 정책을 수립하여 주기적으로 패치를 관리하고 있는 경우
 #취약 - 패치 적용 정책을 수립하여 주기적으로 패치를 관리하고 있지 않는 경우
@@ -17,4 +20,4 @@
 #3) Update 설치 
 # # rpm -Uvh <pakage-name>
 
-echo -e "패치 및 로그관리,U-35,최신 보안패치 및 벤더 권고사항 적용,상,인터뷰,담당자 확인이 필요한 항목입니다.,\"클라우드 취약점 점검 가이드를 참고하시어 발표된 중 현재 사용 중인 보안 관련 Update 찾아 해당 Update Download\n추가 점검 명령어 : rpm -Uvh <pakage-name>\"" >> linux_report_$USER.csv
+cce_report "패치 및 로그관리" "U-35" "최신 보안패치 및 벤더 권고사항 적용" "상" "인터뷰" "담당자 확인이 필요한 항목입니다." "클라우드 취약점 점검 가이드를 참고하시어 발표된 중 현재 사용 중인 보안 관련 Update 찾아 해당 Update Download\n추가 점검 명령어 : rpm -Uvh <pakage-name>"
@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 #:진단기준 
 #양호 : 로그 기록의 검토, 분석, 리포트 작성 및 보고 등이 정기적으로 이루어지고 있는 경우
 #취약 : 로그 기록의 검토, 분석, 리포트 작성 및 보고 등이 정기적으로 이루어지지 않는 경우
@@ -17,4 +20,4 @@
 
 #echo -e "패치 및 로그관리,U-36,로그의 정기적 검토 및 보고,상,N/A,기본적 log 파일의 위치는 /var/adm또는 /var/log입니다.,커널과 시스템에 관련된 로그 메시지들은 syslogd와 klogd 두개의 데몬에 의해 /var/log/messages에 기록하게 됩니다. /n/n이 파일을 분석함으로써 시스템을 항상 점검 관리해야 합니다." >> linux_report.csv
 
-echo -e "패치 및 로그관리,U-36,로그의 정기적 검토 및 보고,상,인터뷰,담당자 확인이 필요한 항목입니다.,클라우드 취약점 점검 가이드를 참고하시어 로그 기록의 검토 분석 리포트 작성 및 보고 등이 정기적으로 이루어지고 있는지 점검하여 주시기 바랍니다." >> linux_report_$USER.csv
+cce_report "패치 및 로그관리" "U-36" "로그의 정기적 검토 및 보고" "상" "인터뷰" "담당자 확인이 필요한 항목입니다." "클라우드 취약점 점검 가이드를 참고하시어 로그 기록의 검토 분석 리포트 작성 및 보고 등이 정기적으로 이루어지고 있는지 점검하여 주시기 바랍니다."
@@ -0,0 +1,113 @@
+#!/bin/bash
+
+# 파일시스템 1회 순회 인덱스
+# U-07(소유자/그룹 없는 파일), U-14(SUID/SGID 파일), U-16(world writable 파일) 점검이 공유한다.
+# linux.sh 에서 실행 시작 시 한 번 생성하며, 점검 스크립트를 단독 실행하면 해당 스크립트가 직접 생성한다.
+#
+# 환경 변수
+#   CCE_FS_INDEX : 인덱스 디렉터리 (nouser, suid, world_writable 목록 파일 포함)
+#   CCE_FS_ROOTS : 순회 시작 경로 (공백 구분, 기본값: 로컬 파일시스템 마운트 지점)
+#   CCE_WALK_RATE : 초당 최대 순회 항목 수 (기본값 0: 제한 없음, 저부하 모드에서 사용)
+#   CCE_FS_INDEX_TIMEOUT : 인덱스 생성 제한 시간(초) (기본값 CCE_CHECK_TIMEOUT, 0 이면 제한 없음)
+#
+# 응답하지 않는 네트워크 파일시스템 등으로 제한 시간을 넘기면 순회를 중단하고(TERM, 5초 후 KILL)
+# 그때까지 찾은 목록을 부분 인덱스로 남긴다 (.timeout 표시). 이 경우 U-07, U-14, U-16 은 타임아웃으로 기록한다.
+
+# 순회 중단에 쓰는 cce_kill_tree 로드 (단독 실행 시)
+declare -F cce_kill_tree >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+CCE_FS_INDEX_TIMEOUT=${CCE_FS_INDEX_TIMEOUT:-${CCE_CHECK_TIMEOUT:-300}}
+
+# 순회하지 않을 가상 파일시스템 경로
+CCE_FS_PRUNE=(/proc /sys /dev /run)
+# world writable 목록에서 제외할 경로 (U-16 점검 기준)
+CCE_FS_WW_EXCLUDE=(/usr/local /sys/fs)
+
+# 순회 시작 경로 출력 (각 경로는 -xdev 로 자신의 파일시스템 안에서만 순회)
+cce_fs_roots() {
+    if [ -n "$CCE_FS_ROOTS" ]; then
+        printf '%s\n' $CCE_FS_ROOTS
+        return
+    fi
+    {
+        echo /
+        df -lP -x tmpfs -x devtmpfs -x squashfs 2>/dev/null | awk 'NR > 1 {print $6}'
+    } | sort -u
+}
+
+# 순회 속도 제한: find 가 항목마다 출력하는 줄을 초당 $1 개까지만 읽음
+# 파이프가 가득 차면 find 가 멈추므로 디스크 순회 자체가 느려짐
+cce_walk_throttle() {
+    [ "$1" -gt 0 ] 2>/dev/null || { cat > /dev/null; return; }
+    awk -v rate="$1" '
+        BEGIN { step = rate >= 10 ? int(rate / 10) : 1; pause = step / rate }
+        NR % step == 0 { system("sleep " pause) }'
+}
+
+# 인덱스 생성: find 한 번으로 세 가지 목록을 동시에 기록 (제한 시간을 넘기면 부분 인덱스, 1 반환)
+cce_build_fs_index() {
+    local out=$1
+    local prune=() ww_exclude=() roots=() throttle=() path pid watchdog=""
+
+    mkdir -p "$out" || return 1
+    for path in "${CCE_FS_PRUNE[@]}"; do
+        prune+=(-path "$path" -o)
+    done
+    unset 'prune[${#prune[@]}-1]'
+    for path in "${CCE_FS_WW_EXCLUDE[@]}"; do
+        ww_exclude+=(-path "$path/*" -o)
+    done
+    unset 'ww_exclude[${#ww_exclude[@]}-1]'
+    mapfile -t roots < <(cce_fs_roots)
+
+    [ "${CCE_WALK_RATE:-0}" -gt 0 ] 2>/dev/null && throttle=(-printf '\n' ,)
+
+    rm -f "$out/.timeout"
+    (
+        find "${roots[@]}" -xdev \( "${prune[@]}" \) -prune -o \
+            \( "${throttle[@]}" \( \( -nouser -o -nogroup \) -fprint "$out/nouser" \) , \
+               \( -type f -user root \( -perm -4000 -o -perm -2000 \) -fprint "$out/suid" \) , \
+               \( -type f -perm -2 ! \( "${ww_exclude[@]}" \) -fprint "$out/world_writable" \) \) \
+            2>/dev/null | cce_walk_throttle "${CCE_WALK_RATE:-0}"
+    ) &
+    pid=$!
+
+    if [ "$CCE_FS_INDEX_TIMEOUT" -gt 0 ] 2>/dev/null; then
+        (
+            sleep "$CCE_FS_INDEX_TIMEOUT"
+            : > "$out/.timeout"
+            cce_kill_tree "$pid" TERM
+            sleep 5
+            cce_kill_tree "$pid" KILL
+        ) &
+        watchdog=$!
+    fi
+
+    wait "$pid"
+    if [ -n "$watchdog" ]; then
+        cce_kill_tree "$watchdog" KILL
+        wait "$watchdog" 2>/dev/null
+    fi
+    # 부분 인덱스도 다시 순회하지 않도록 완료로 표시
+    touch "$out/.complete"
+    [ ! -f "$out/.timeout" ]
+}
+
+# 인덱스가 없으면 임시 디렉터리에 생성하고 CCE_FS_INDEX 로 지정
+# 인덱스가 제한 시간을 넘겨 부분 인덱스이면 1 반환 (점검은 cce_report_fs_index_timeout 으로 기록)
+cce_fs_index_ready() {
+    if [ -n "$CCE_FS_INDEX" ] && [ -f "$CCE_FS_INDEX/.complete" ]; then
+        [ ! -f "$CCE_FS_INDEX/.timeout" ]
+        return
+    fi
+    CCE_FS_INDEX=$(mktemp -d "${TMPDIR:-/tmp}/cce_fs_index.XXXXXX") || return 1
+    trap 'rm -rf "$CCE_FS_INDEX"' EXIT
+    cce_build_fs_index "$CCE_FS_INDEX"
+}
+
+# 부분 인덱스를 쓰는 점검의 타임아웃 기록 (인자: 진단코드 목록파일, 중단 전까지 찾은 항목을 결과값으로 남김)
+cce_report_fs_index_timeout() {
+    local code=$1 list
+    list=$(cat "$CCE_FS_INDEX/$2" 2>/dev/null)
+    cce_report_timeout "$code" "$CCE_FS_INDEX_TIMEOUT" \
+        "파일시스템 순회가 제한 시간(${CCE_FS_INDEX_TIMEOUT}초) 안에 끝나지 않아 중단되었습니다.\n중단 전까지 찾은 항목:\n${list:-없음}"
+}
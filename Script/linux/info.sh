@@ -1,9 +1,11 @@
 #!/bin/bash
 
+# 결과 기록 함수 로드 (단독 실행 시)
+declare -F cce_report >/dev/null || source "$(dirname "${BASH_SOURCE[0]}")/report.sh"
+
 os_version=$(hostnamectl | grep "Operating System" | awk -F ': ' '{print $2}')
 ip=$(hostname -I | awk {'print $1'})
 
 
-echo -e "IP,OS,USER" >> linux_report_$USER.csv
-echo -e "$ip,$os_version,$USER" >> linux_report_$USER.csv
+cce_report_info "$ip" "$os_version"
 
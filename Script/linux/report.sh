@@ -0,0 +1,254 @@
+#!/bin/bash
+
+# 점검 결과 기록 함수
+# 점검 스크립트는 cce_report 로 결과를 남기며, 한 번의 호출로 다음 두 가지를 함께 기록한다.
+#   linux_report_$USER.csv   : 기존 보고서 CSV 행 (Parsing/parsingMain.py 의 process_csv_files 사용)
+#   linux_report_$USER.jsonl : 대시보드 스키마의 result 항목 (한 줄에 하나)
+# linux.sh 는 점검마다 cce_report_timed 로 수행 시간을 측정하고(linux_report_$USER.timing),
+# 실행이 끝나면 cce_report_finish 로 linux_report_$USER.json 을 작성한다.
+#
+# 결과값(시스템 실제 결과값)은 점검별 예산(바이트)을 넘으면 잘라서 기록하고, 잘린 표시와 원본 sha256 을 남긴다.
+# 원본 전체는 linux_report_$USER.evidence.tar.gz 에 <sha256>.txt 로 보관하여 상세 조회 시에만 읽도록 한다.
+#   CCE_EVIDENCE_BUDGET       : 기본 예산 (기본값 4096, 0 이면 제한 없음)
+#   CCE_EVIDENCE_BUDGET_U_07  : 점검별 예산 (진단코드의 - 를 _ 로 바꾼 이름)
+#
+# 점검별 제한 시간(초)을 넘긴 점검은 하위 프로세스까지 중단하고 점검결과 "타임아웃"(result 3)으로 기록한다.
+#   CCE_CHECK_TIMEOUT       : 기본 제한 시간 (기본값 300, 0 이면 제한 없음)
+#   CCE_CHECK_TIMEOUT_U_07  : 점검별 제한 시간
+CCE_EVIDENCE_BUDGET=${CCE_EVIDENCE_BUDGET:-4096}
+CCE_CHECK_TIMEOUT=${CCE_CHECK_TIMEOUT:-300}
+
+# 점검 항목 정보 (진단코드 → "구분|진단항목|취약도", 타임아웃 기록에 사용, linux.sh 가 채움)
+declare -A CCE_CHECK_META
+
+# JSON 문자열 이스케이프 (결과는 REPLY 에 저장, 서브셸을 만들지 않음)
+cce_json_escape() {
+    REPLY=$1
+    REPLY=${REPLY//\\/\\\\}
+    REPLY=${REPLY//\"/\\\"}
+    REPLY=${REPLY//$'\n'/\\n}
+    REPLY=${REPLY//$'\r'/\\r}
+    REPLY=${REPLY//$'\t'/\\t}
+    REPLY=${REPLY//[[:cntrl:]]/}
+}
+
+# CSV 필드 인용 (큰따옴표는 두 번 써서 이스케이프, 결과는 REPLY 에 저장)
+cce_csv_quote() {
+    REPLY="\"${1//\"/\"\"}\""
+}
+
+# UTF-8 문자가 깨지지 않도록 바이트 단위로 앞부분만 잘라 출력
+# 인자: 문자열 최대바이트
+cce_evidence_head() {
+    local LC_ALL=C
+    local s=${1:0:$2}
+
+    # 마지막 문자가 잘렸으면 남은 바이트 제거
+    if [[ $s == *[$'\x80'-$'\xff'] ]]; then
+        while [[ $s == *[$'\x80'-$'\xbf'] ]]; do
+            s=${s%?}
+        done
+        [[ $s == *[$'\xc0'-$'\xff'] ]] && s=${s%?}
+    fi
+    printf '%s' "$s"
+}
+
+# 점검 결과 1건 기록
+# 인자: 구분 진단코드 진단항목 취약도(상/중/하) 점검결과(양호/취약/N/A/인터뷰/타임아웃) 시스템 실제 결과값 상세설명 및 조치방안
+# 실제 결과값과 상세설명은 echo -e 와 동일하게 \n 등의 이스케이프를 해석한다.
+cce_report() {
+    local category=$1 code=$2 title=$3 importance=$4 status=$5
+    local evidence detail importance_code result_code evidence_csv detail_csv evidence_bytes
+    local budget_var budget evidence_sha="" evidence_extra=""
+    local j_code j_title j_detail j_category j_status j_evidence
+
+    printf -v evidence '%b' "$6"
+    printf -v detail '%b' "$7"
+
+    case $importance in
+        상) importance_code=3 ;;
+        중) importance_code=2 ;;
+        *) importance_code=1 ;;
+    esac
+    case $status in
+        양호) result_code=0 ;;
+        취약) result_code=1 ;;
+        타임아웃) result_code=3 ;;
+        *) result_code=2 ;;
+    esac
+
+    evidence_bytes=$(LC_ALL=C; echo ${#evidence})
+
+    # 결과값 예산 초과 시 앞부분만 남기고 원본은 별도 파일로 보관
+    budget_var="CCE_EVIDENCE_BUDGET_${code//-/_}"
+    budget=${!budget_var:-$CCE_EVIDENCE_BUDGET}
+    if [ "$budget" -gt 0 ] && [ "$evidence_bytes" -gt "$budget" ]; then
+        evidence_sha=$(printf '%s' "$evidence" | sha256sum | cut -d ' ' -f 1)
+        # 원본에는 설정 파일 내용이 들어 있으므로 소유자만 읽을 수 있게 생성
+        (umask 077; mkdir -p "linux_report_$USER.evidence")
+        if [ ! -e "linux_report_$USER.evidence/$evidence_sha.txt" ]; then
+            (umask 077; printf '%s' "$evidence" > "linux_report_$USER.evidence/$evidence_sha.txt")
+        fi
+        evidence="$(cce_evidence_head "$evidence" "$budget")"$'\n'"...[truncated: ${budget}/${evidence_bytes} bytes, sha256=${evidence_sha}]"
+        evidence_extra=", \"evidencetruncated\": true, \"evidencesha256\": \"$evidence_sha\""
+    fi
+
+    cce_csv_quote "$evidence"; evidence_csv=$REPLY
+    cce_csv_quote "$detail"; detail_csv=$REPLY
+    printf '%s,%s,%s,%s,%s,%s,%s\n' "$category" "$code" "$title" "$importance" "$status" \
+        "$evidence_csv" "$detail_csv" >> "linux_report_$USER.csv"
+
+    cce_json_escape "$code"; j_code=$REPLY
+    cce_json_escape "$title"; j_title=$REPLY
+    cce_json_escape "$detail"; j_detail=$REPLY
+    cce_json_escape "$category"; j_category=$REPLY
+    cce_json_escape "$status"; j_status=$REPLY
+    cce_json_escape "$evidence"; j_evidence=$REPLY
+    printf '{"itemcode": "%s", "title": "%s", "importance": %d, "result": %d, "resultdetail": "%s", "category": "%s", "status": "%s", "evidence": "%s", "evidencebytes": %d%s}\n' \
+        "$j_code" "$j_title" "$importance_code" "$result_code" "$j_detail" \
+        "$j_category" "$j_status" "$j_evidence" "$evidence_bytes" "$evidence_extra" >> "linux_report_$USER.jsonl"
+}
+
+# 현재 시각 (마이크로초)
+cce_now_us() {
+    if [ -n "$EPOCHREALTIME" ]; then
+        echo "${EPOCHREALTIME/[.,]/}"
+    else
+        echo $(( $(date +%s%N) / 1000 ))
+    fi
+}
+
+# 프로세스와 모든 하위 프로세스에 시그널 전송 (먼저 멈춰서 새 프로세스를 만들지 못하게 함)
+cce_kill_tree() {
+    local pid=$1 sig=$2 child
+    kill -STOP "$pid" 2>/dev/null
+    for child in $(ps -o pid= --ppid "$pid" 2>/dev/null); do
+        cce_kill_tree "$child" "$sig"
+    done
+    kill -"$sig" "$pid" 2>/dev/null
+    kill -CONT "$pid" 2>/dev/null
+}
+
+# 점검 1건을 서브셸에서 실행하며 수행 시간과 CPU 시간을 기록
+# 인자: 진단코드 실행할 명령(점검 함수)
+# 점검이 exit 로 끝나도 EXIT trap 에서 기록하며, CPU 시간은 점검이 실행한 자식 프로세스를 포함한다.
+# 제한 시간을 넘기면 감시 프로세스가 점검을 중단하고(TERM, 5초 후 KILL) 타임아웃 결과를 기록한다.
+cce_report_timed() {
+    local code=$1 timeout_var timeout pid watchdog=""
+    shift
+    timeout_var="CCE_CHECK_TIMEOUT_${code//-/_}"
+    timeout=${!timeout_var:-$CCE_CHECK_TIMEOUT}
+    rm -f "linux_report_$USER.timeout"
+
+    (
+        trap "cce_report_timing '$code' '$(cce_now_us)'" EXIT
+        trap 'exit 143' TERM
+        "$@"
+    ) &
+    pid=$!
+
+    if [ "$timeout" -gt 0 ]; then
+        (
+            sleep "$timeout"
+            : > "linux_report_$USER.timeout"
+            cce_kill_tree "$pid" TERM
+            sleep 5
+            cce_kill_tree "$pid" KILL
+        ) &
+        watchdog=$!
+    fi
+
+    wait "$pid"
+    if [ -n "$watchdog" ]; then
+        cce_kill_tree "$watchdog" KILL
+        wait "$watchdog" 2>/dev/null
+    fi
+    if [ -f "linux_report_$USER.timeout" ]; then
+        rm -f "linux_report_$USER.timeout"
+        cce_report_timeout "$code" "$timeout"
+    fi
+}
+
+# 제한 시간을 넘겨 중단된 점검의 결과 기록 (인자: 진단코드 제한시간 [결과값])
+cce_report_timeout() {
+    local code=$1 timeout=$2 category title importance
+    IFS='|' read -r category title importance <<< "${CCE_CHECK_META[$code]}"
+    cce_report "${category:-기타}" "$code" "${title:-$code}" "${importance:-하}" "타임아웃" \
+        "${3:-점검이 제한 시간(${timeout}초) 안에 끝나지 않아 중단되었습니다.}" \
+        "점검 명령이 응답하지 않아 결과를 확인하지 못했습니다. 네트워크 파일시스템 등 응답이 느린 자원을 확인한 후 다시 점검하거나 담당자와 인터뷰를 통해 확인하십시오."
+}
+
+# 수행 시간 기록: 진단코드 wall(초) cpu(초)
+cce_report_timing() {
+    local code=$1 start=$2 end
+    end=$(cce_now_us)
+    # times 는 파이프로 연결하면 별도 서브셸에서 실행되므로 파일로 받아 현재 셸의 값을 기록
+    times > "linux_report_$USER.times"
+    awk -v code="$code" -v wall_us=$((end - start)) '
+        {
+            for (i = 1; i <= NF; i++) {
+                split($i, t, "m")
+                sub("s", "", t[2])
+                cpu += t[1] * 60 + t[2]
+            }
+        }
+        END { printf "%s %.3f %.3f\n", code, wall_us / 1000000, cpu }
+    ' "linux_report_$USER.times" >> "linux_report_$USER.timing"
+    rm -f "linux_report_$USER.times"
+}
+
+# 점검 대상 시스템 정보 기록 (info.sh)
+cce_report_info() {
+    local ip=$1 os_version=$2
+
+    echo -e "IP,OS,USER" >> linux_report_$USER.csv
+    echo -e "$ip,$os_version,$USER" >> linux_report_$USER.csv
+    printf '%s\n%s\n' "$ip" "$os_version" > "linux_report_$USER.host"
+}
+
+# 기록된 항목을 모아 대시보드 스키마의 JSON 문서 작성
+# {targetip, testedtime, osinfo, result: [...]}
+cce_report_finish() {
+    local tested_time=${1:-$(date '+%Y-%m-%d %H:%M:%S')}
+    local ip="" os_version="" line first=1 j_ip j_os code wall cpu item_code
+    declare -A wall_times cpu_times
+
+    if [ -f "linux_report_$USER.host" ]; then
+        { IFS= read -r ip; IFS= read -r os_version; } < "linux_report_$USER.host"
+    fi
+    if [ -f "linux_report_$USER.timing" ]; then
+        while read -r code wall cpu; do
+            wall_times[$code]=$wall
+            cpu_times[$code]=$cpu
+        done < "linux_report_$USER.timing"
+    fi
+
+    cce_json_escape "$ip"; j_ip=$REPLY
+    cce_json_escape "$os_version"; j_os=$REPLY
+
+    {
+        printf '{"targetip": "%s", "testedtime": "%s", "osinfo": "%s", "result": [' "$j_ip" "$tested_time" "$j_os"
+        if [ -f "linux_report_$USER.jsonl" ]; then
+            while IFS= read -r line; do
+                # 점검별 수행 시간을 해당 항목에 추가
+                item_code=${line#\{\"itemcode\": \"}
+                item_code=${item_code%%\"*}
+                if [ -n "${wall_times[$item_code]}" ]; then
+                    line="${line%\}}, \"walltime\": ${wall_times[$item_code]}, \"cputime\": ${cpu_times[$item_code]}}"
+                fi
+                [ $first = 1 ] || printf ','
+                printf '\n  %s' "$line"
+                first=0
+            done < "linux_report_$USER.jsonl"
+        fi
+        printf '\n]}\n'
+    } > "linux_report_$USER.json"
+    rm -f "linux_report_$USER.jsonl" "linux_report_$USER.host" "linux_report_$USER.timing"
+
+    # 잘린 결과값의 원본을 압축 파일로 묶음 (소유자만 읽을 수 있게 생성)
+    if [ -d "linux_report_$USER.evidence" ]; then
+        rm -f "linux_report_$USER.evidence.tar.gz"
+        (umask 077; tar czf "linux_report_$USER.evidence.tar.gz" -C "linux_report_$USER.evidence" .) &&
+            rm -rf "linux_report_$USER.evidence"
+    fi
+}
@@ -110,7 +110,7 @@ def load_json_files() -> list[dict]:
     return data
 
 # 매핑 테이블
-RESULT_MAP = {0: "양호", 1: "취약", 2: "해당없음"}
+RESULT_MAP = {0: "양호", 1: "취약", 2: "해당없음", 3: "타임아웃"}
 IMPORTANCE_MAP = {1: "낮음", 2: "보통", 3: "높음"}
 
 def preprocess() -> pd.DataFrame:
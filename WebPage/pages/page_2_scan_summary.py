@@ -571,7 +571,7 @@ def process_json_data(json_data, filename):
 
 def convert_result_code(code):
     """결과 코드 변환"""
-    mapping = {0: "양호", 1: "취약", 2: "해당없음"}
+    mapping = {0: "양호", 1: "취약", 2: "해당없음", 3: "타임아웃"}
     return mapping.get(code, "알수없음")
 
 def convert_importance_code(code):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import tarfile
 from datetime import datetime
 from functools import lru_cache
 from typing import Dict, List
@@ -31,7 +32,7 @@ def _load_df(result_dir: str) -> pd.DataFrame:
 def _parse_json(js: Dict, fname: str) -> List[Dict]:
     imp = {1: "하", 2: "중", 3: "상"}.get
     risk = {1: "낮음", 2: "보통", 3: "높음"}.get
-    res = {0: "양호", 1: "취약", 2: "수동"}.get
+    res = {0: "양호", 1: "취약", 2: "수동", 3: "타임아웃"}.get
     rows: List[Dict] = []
     for it in js.get("result", []):
         rows.append(
@@ -45,10 +46,25 @@ def _parse_json(js: Dict, fname: str) -> List[Dict]:
                 "PC명": os.path.splitext(fname)[0],
                 "진단시점": js.get("testedtime", "Unknown"),
                 "OS정보": js.get("osinfo", "Unknown"),
+                "결과값": it.get("evidence", ""),
+                "결과값해시": it.get("evidencesha256", ""),
             }
         )
     return rows
 
+# 잘린 결과값 원본 (상세 조회 시에만 <PC명>.evidence.tar.gz 에서 읽음) ------------
+@st.cache_data(show_spinner=False, max_entries=32)
+def _load_full_evidence(result_dir: str, pc: str, sha256: str) -> str:
+    path = os.path.join(result_dir, f"{pc}.evidence.tar.gz")
+    if not os.path.exists(path):
+        return ""
+    with tarfile.open(path, "r:gz") as tar:
+        try:
+            member = tar.extractfile(f"./{sha256}.txt")
+        except KeyError:
+            return ""
+        return member.read().decode("utf-8", errors="replace") if member else ""
+
 # KPI 계산 ---------------------------------------------------------------------
 @lru_cache(maxsize=None)
 def _kpi(_: int, total: int, vuln: int, good: int, high: int):
@@ -161,6 +177,23 @@ def _results_section(df: pd.DataFrame):
     st.markdown(f'<div class="table-scroll">{html}</div>', unsafe_allow_html=True)
     st.markdown("</div>", unsafe_allow_html=True)
 
+# Evidence detail -------------------------------------------------------------
+
+def _evidence_section(df: pd.DataFrame, result_dir: str):
+    if df.empty:
+        return
+    with st.expander("🔍 시스템 실제 결과값 보기", expanded=False):
+        labels = [f"{row['PC명']} / {row['진단코드']} {row['진단항목']}" for _, row in df.iterrows()]
+        idx = st.selectbox("항목", range(len(labels)), format_func=labels.__getitem__)
+        row = df.iloc[idx]
+        st.code(row["결과값"] or "-", language=None)
+        if row["결과값해시"] and st.button("전체 결과값 불러오기"):
+            full = _load_full_evidence(result_dir, row["PC명"], row["결과값해시"])
+            if full:
+                st.code(full, language=None)
+            else:
+                st.warning("원본 결과값 파일을 찾을 수 없습니다.")
+
 # ---- Actions ----------------------------------------------------------------
 
 def _actions(df: pd.DataFrame):
@@ -182,11 +215,13 @@ def _actions(df: pd.DataFrame):
 def show():
     _header()
     base = os.path.dirname(os.path.abspath(__file__))
-    df = _load_df(os.path.join(base, '../result'))
+    result_dir = os.path.join(base, '../result')
+    df = _load_df(result_dir)
     if df.empty:
         st.warning('데이터가 없습니다.'); return
     filtered = _filter_box(df)
     _results_section(filtered)
+    _evidence_section(filtered, result_dir)
     _actions(filtered)
 
 if __name__=='__main__':
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
+import os
 from typing import List, Dict
 
+import pandas as pd
 import streamlit as st
 from WebPage.styles.style import STYLES  # 🌐 CSS 공용
 
@@ -71,6 +74,87 @@ HOSTS: List[Dict] = [
     }
 ]
 
+# 결과 JSON 의 (파일명, 수정 시각) 목록 - 결과가 추가·변경되면 _load_timings 캐시를 새로 계산
+def _result_mtimes(result_dir: str) -> tuple:
+    if not os.path.isdir(result_dir):
+        return ()
+    mtimes = []
+    for entry in os.scandir(result_dir):
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            mtimes.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(sorted(mtimes))
+
+# 점검 항목별 수행 시간 (linux.sh 가 결과 JSON 의 각 항목에 walltime/cputime/evidencebytes 기록)
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_timings(result_dir: str, mtimes: tuple = ()) -> pd.DataFrame:
+    rows: List[Dict] = []
+    if not os.path.isdir(result_dir):
+        return pd.DataFrame(rows)
+    for fname in os.listdir(result_dir):
+        if not fname.endswith(".json"):
+            continue
+        # 기록 중이거나 손상된 결과 파일은 건너뜀
+        try:
+            with open(os.path.join(result_dir, fname), encoding="utf-8") as fp:
+                js = json.load(fp)
+        except (json.JSONDecodeError, OSError):
+            continue
+        seen = set()
+        for it in js.get("result", []):
+            code = it.get("itemcode")
+            # 한 점검이 여러 행을 남겨도 수행 시간은 점검 단위로 한 번만 집계
+            if "walltime" not in it or code in seen:
+                continue
+            seen.add(code)
+            rows.append(
+                {
+                    "호스트": js.get("targetip") or os.path.splitext(fname)[0],
+                    "진단코드": code,
+                    "진단항목": it.get("title", "N/A"),
+                    "수행시간(초)": float(it.get("walltime", 0)),
+                    "CPU시간(초)": float(it.get("cputime", 0)),
+                    "결과값(KB)": round(it.get("evidencebytes", 0) / 1024, 1),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def _slowest_checks_section(df: pd.DataFrame, top: int = 10) -> None:
+    st.markdown("### 점검 항목별 수행 시간")
+    if df.empty:
+        st.info("수행 시간이 기록된 점검 결과가 없습니다.")
+        return
+
+    ranking = (
+        df.groupby(["진단코드", "진단항목"])
+        .agg(
+            호스트수=("호스트", "nunique"),
+            평균수행시간=("수행시간(초)", "mean"),
+            최대수행시간=("수행시간(초)", "max"),
+            평균CPU시간=("CPU시간(초)", "mean"),
+            평균결과값KB=("결과값(KB)", "mean"),
+        )
+        .sort_values("평균수행시간", ascending=False)
+        .round(3)
+        .reset_index()
+    )
+    col_rank, col_host = st.columns(2)
+    with col_rank:
+        st.markdown(f"**전체 호스트 기준 느린 점검 Top {top}**")
+        st.dataframe(ranking.head(top), use_container_width=True, hide_index=True)
+    with col_host:
+        st.markdown(f"**호스트별 느린 점검 Top {top}**")
+        st.dataframe(
+            df.sort_values("수행시간(초)", ascending=False).head(top),
+            use_container_width=True,
+            hide_index=True,
+        )
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 def show() -> None:
     st.markdown(STYLES, unsafe_allow_html=True)
@@ -120,6 +204,11 @@ def show() -> None:
             st.time.sleep(1)  # Fixed incorrect function call
         st.success("🎉 점검 완료!")
 
+    # 점검 항목별 수행 시간 순위
+    base = os.path.dirname(os.path.abspath(__file__))
+    result_dir = os.path.join(base, "../result")
+    _slowest_checks_section(_load_timings(result_dir, _result_mtimes(result_dir)))
+
 
 if __name__ == "__main__":
     st.set_page_config(page_title="호스트 점검", layout="wide")
@@ -1,112 +1,400 @@
 import os
+import json
+import asyncio
 import yaml
+import time
+import shlex
 import tempfile
+import threading
 import ansible_runner
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from functools import partial
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from check_engine import get_registry, get_blob_dir, known_blob_prefixes
 
-def run_ansible_playbook_on_hosts(host_list: List[Dict[str, str]]) -> bool:
+# SSH connection settings for Unix groups, selected with connection_profile.
+# 'performance' multiplexes every task of a host over one SSH connection
+# (ControlMaster/ControlPersist) and pipelines modules instead of copying them.
+# The control sockets live in a fixed directory, not in ansible_runner's
+# per-run private_data_dir, so connections opened by the connectivity probe
+# stay warm for the scan that follows.
+# Note: pipelining with become requires 'requiretty' to be disabled in sudoers.
+SSH_CONNECTION_PROFILES = {
+    'default': {
+        'ansible_ssh_common_args': '-o StrictHostKeyChecking=no'
+    },
+    'performance': {
+        'ansible_ssh_common_args': '-o StrictHostKeyChecking=no -o ControlMaster=auto -o ControlPersist=600s',
+        'ansible_ssh_pipelining': True,
+        'ansible_control_path_dir': '~/.ansible/cp'
+    }
+}
+
+# Low-impact scan mode for hosts that serve production traffic. The check
+# scripts lower their CPU/IO priority (nice 19, best-effort IO class 7) and
+# cap the filesystem walk at LOW_IMPACT_WALK_RATE entries per second.
+# A host is scanned this way when HOST_LOW_IMPACT is set, or, if it is not
+# given, when its HOST_IMPORTANCE is one of LOW_IMPACT_IMPORTANCE.
+LOW_IMPACT_IMPORTANCE = ('상',)
+LOW_IMPACT_WALK_RATE = 5000
+
+# Task-level limits (seconds) for the scan and collection tasks. The engines
+# already bound every check (CCE_CHECK_TIMEOUT, 300 s by default) and the
+# filesystem walk (CCE_FS_INDEX_TIMEOUT); these only stop an engine that
+# stopped responding itself, so one host cannot hold up the whole play.
+SCAN_TASK_TIMEOUT = 3600
+COLLECT_TASK_TIMEOUT = 600
+
+# In --stdout mode the check engines and Script/collect.sh print their JSON
+# between these lines. With become, the 'script' module runs over a pty, so
+# stderr (engine warnings, sudo banners, locale messages) lands in stdout
+# around the payload; only the text between the markers is parsed.
+RESULT_BEGIN_MARKER = '@@CCE_JSON_BEGIN@@'
+RESULT_END_MARKER = '@@CCE_JSON_END@@'
+
+# Fact set by the last task of every scan/collection playbook once the host's
+# result is on the control node. HostEventTracker marks hosts completed on it.
+RESULT_FACT = 'cce_result_path'
+
+# Archive of the full evidence of truncated items (see CCE_EVIDENCE_BUDGET in
+# the engines). It is fetched next to the host's result JSON as
+# {HOST_IDEN}.evidence.tar.gz, which page_3 reads, and deleted on the host.
+# The streamlined playbook passes this path to the engine; the other
+# playbooks find the archive under the engine's default name.
+UNIX_EVIDENCE_ARCHIVE = "/tmp/{{ host_os_type }}_{{ host_identifier }}.evidence.tar.gz"
+
+def run_ansible_playbook_on_hosts(host_list: List[Dict[str, str]],
+                                  concurrent: bool = False,
+                                  max_workers: Optional[int] = None,
+                                  forks: Optional[int] = None,
+                                  strategy: str = 'linear',
+                                  serial: Optional[Union[int, str, list]] = None,
+                                  record_timing: bool = False,
+                                  single_pass: bool = False,
+                                  connectivity_results: Optional[Dict[str, Dict[str, any]]] = None,
+                                  connectivity_cache: Optional['ConnectivityCache'] = None,
+                                  on_host_update: Optional[Callable[[str, Dict[str, any]], None]] = None,
+                                  connection_profile: str = 'default',
+                                  streamlined: bool = False,
+                                  batch_size: Optional[int] = None,
+                                  checkpoint: Optional['ScanCheckpoint'] = None,
+                                  rescan_older_than: Optional[float] = None,
+                                  rescan_vulnerable_only: bool = False,
+                                  tcp_preprobe: bool = False,
+                                  collect_only: bool = False) -> bool:
     """
     Execute Ansible playbook on multiple hosts grouped by OS type.
     
     Args:
         host_list: List of dictionaries containing host information
                   Each dict should have: HOST_IDEN, HOST_ADDR, HOST_USER, HOST_PORT, HOST_SUPW, HOST_OS
+                  and may have HOST_IMPORTANCE / HOST_LOW_IMPACT (see is_low_impact_host)
+        concurrent: Run the per-OS playbooks in parallel instead of one after another
+        max_workers: Maximum number of OS groups executed at the same time (concurrent mode only)
+        forks: Number of parallel Ansible forks per OS group (None = Ansible default)
+        strategy: Play strategy, 'linear' (default) or 'free'
+        serial: Batch size for the play ('serial' keyword), e.g. 50, "25%" or [10, 50, "100%"]
+        record_timing: Save per-host task timing to tmp/timing/ for tuning forks/strategy/serial
+        single_pass: Run the ping/sudo/fact checks as the first tasks of the scan playbook
+                     instead of a separate connectivity run; unreachable hosts drop out inline
+        connectivity_results: Optional dict filled with the connectivity report (same shape as
+                              check_ansible_connectivity) built from the scan's own events
+        connectivity_cache: Optional ConnectivityCache; hosts whose scan fails are expired
+                            from it (and single-pass results are stored in it)
+        on_host_update: Optional callback(host_iden, host_state) called while the run is
+                        in progress whenever a host's state changes (see HostEventTracker)
+        connection_profile: Key of SSH_CONNECTION_PROFILES used for Unix groups
+                            ('performance' enables ControlPersist and pipelining)
+        streamlined: For Unix groups, run the script with a single 'script' task and write
+                     its JSON stdout straight to tmp/{HOST_IDEN}.json (no find/fetch/rename)
+        batch_size: Split each OS group into chunks of this many hosts, each with its own
+                    inventory and ansible_runner run (batch mode)
+        checkpoint: ScanCheckpoint recording completed HOST_IDENs in batch mode; hosts that
+                    are checkpointed and have a fresh tmp/{HOST_IDEN}.json are skipped.
+                    Defaults to tmp/scan_checkpoint.json when batch_size is set.
+        rescan_older_than: Incremental mode; only scan hosts whose existing result
+                           (testedtime) is older than this many seconds
+        rescan_vulnerable_only: Incremental mode; only scan hosts whose existing result
+                                has 취약 items (see select_hosts_for_rescan)
+        tcp_preprobe: Drop hosts whose HOST_PORT does not accept a TCP connection before
+                      running Ansible (see probe_hosts_tcp); their results go into
+                      connectivity_results and count as a failure
+        collect_only: For Unix groups, only collect the config snapshot the rule registry
+                      needs (Script/collect.sh) into tmp/snapshots/{HOST_IDEN}.json instead of
+                      running the checks; score them with check_engine.rescore_snapshots
     
     Returns:
         bool: True if all OS groups successful, False otherwise
     """
     
+    validate_strategy(strategy)
+    validate_connection_profile(connection_profile)
+    
+    if rescan_older_than is not None or rescan_vulnerable_only:
+        host_list = select_hosts_for_rescan(host_list, rescan_older_than, rescan_vulnerable_only)
+        if not host_list:
+            print("All host results are up to date. Nothing to rescan.")
+            return True
+    
+    all_reachable = True
+    if tcp_preprobe:
+        host_list, dead_results = filter_tcp_reachable_hosts(host_list)
+        if connectivity_results is not None:
+            connectivity_results.update(dead_results)
+        all_reachable = not dead_results
+        if not host_list:
+            return False
+    
     # Group hosts by OS type
     os_groups = group_hosts_by_os(host_list)
+    run_options = {
+        'forks': forks,
+        'strategy': strategy,
+        'serial': serial,
+        'record_timing': record_timing,
+        'probe': single_pass,
+        'connectivity_results': connectivity_results,
+        'connectivity_cache': connectivity_cache,
+        'on_host_update': on_host_update,
+        'connection_profile': connection_profile,
+        'streamlined': streamlined,
+        'collect_only': collect_only
+    }
     
-    overall_success = True
+    group_runner = run_os_group_playbook
+    if batch_size:
+        group_runner = partial(run_os_group_in_batches, batch_size=batch_size,
+                               checkpoint=checkpoint or ScanCheckpoint())
     
-    # Process each OS group separately
-    for os_type, hosts in os_groups.items():
-        print(f"\n{'='*50}")
-        print(f"Processing {len(hosts)} {os_type} hosts...")
-        print(f"{'='*50}")
-        
-        # Check if script exists for this OS type
-        script_path = get_script_path(os_type)
-        if not os.path.exists(script_path):
-            print(f"Warning: Script {script_path} not found. Skipping {os_type} hosts.")
-            overall_success = False
-            continue
-        
-        # Create inventory for this OS group
-        inventory = create_os_inventory(hosts, os_type)
+    if not concurrent or len(os_groups) <= 1:
+        overall_success = True
         
-        # Create playbook for this OS type
-        playbook = create_os_playbook(os_type)
-        
-        # Create extravars
-        extravars = create_extravars(hosts)
+        # Process each OS group separately
+        for os_type, hosts in os_groups.items():
+            if not group_runner(os_type, hosts, **run_options):
+                overall_success = False
         
-        # Execute playbook for this OS group
-        with tempfile.TemporaryDirectory() as temp_dir:
+        return overall_success and all_reachable
+    
+    # Run every OS group in its own worker; total time ~= slowest group
+    workers = min(max_workers or len(os_groups), len(os_groups))
+    print(f"\nRunning {len(os_groups)} OS groups concurrently ({workers} workers)...")
+    
+    group_results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(group_runner, os_type, hosts, True, **run_options): os_type
+            for os_type, hosts in os_groups.items()
+        }
+        for future in as_completed(futures):
+            os_type = futures[future]
             try:
-                print(f"Executing {os_type} playbook using ansible_runner...")
-                
-                result = ansible_runner.run(
-                    private_data_dir=temp_dir,
-                    inventory=inventory,
-                    playbook=playbook,
-                    extravars=extravars,
-                    quiet=False,
-                    verbosity=1
-                )
-                
-                if result.status == 'successful':
-                    print(f"✓ {os_type} playbook executed successfully!")
-                    
-                    # Print host-specific results
-                    for event in result.events:
-                        if event.get('event') == 'runner_on_ok':
-                            task_name = event.get('event_data', {}).get('task', 'Unknown task')
-                            host = event.get('event_data', {}).get('host', 'Unknown host')
-                            if 'Fetch JSON file' in task_name:
-                                print(f"  ✓ JSON file retrieved from {host}")
-                else:
-                    print("No hosts are manageable by Ansible. Please check your configuration.")
-                    print(f"✗ {os_type} playbook failed with status: {result.status}")
-                    overall_success = False
-                    
-                    # Print error details
-                    for event in result.events:
-                        if event.get('event') in ['runner_on_failed', 'runner_on_unreachable']:
-                            host = event.get('event_data', {}).get('host', 'Unknown host')
-                            res = event.get('event_data', {}).get('res', {})
-                            msg = res.get('msg', res.get('stderr', 'Unknown error'))
-                            print(f"  ✗ Error on {host}: {msg}")
-                            
+                group_results[os_type] = future.result()
             except Exception as e:
                 print(f"✗ Error executing {os_type} playbook: {e}")
-                overall_success = False
+                group_results[os_type] = False
+    
+    for os_type, success in group_results.items():
+        print(f"  {'✓' if success else '✗'} {os_type}: {'SUCCESS' if success else 'FAILED'}")
+    
+    return all(group_results.values()) and all_reachable
+
+def run_os_group_playbook(os_type: str, hosts: List[Dict[str, str]], quiet: bool = False,
+                          forks: Optional[int] = None, strategy: str = 'linear',
+                          serial: Optional[Union[int, str, list]] = None,
+                          record_timing: bool = False, probe: bool = False,
+                          connectivity_results: Optional[Dict[str, Dict[str, any]]] = None,
+                          connectivity_cache: Optional['ConnectivityCache'] = None,
+                          on_host_update: Optional[Callable[[str, Dict[str, any]], None]] = None,
+                          connection_profile: str = 'default',
+                          streamlined: bool = False,
+                          collect_only: bool = False,
+                          completed_hosts: Optional[set] = None) -> bool:
+    """
+    Execute the playbook for a single OS group.
+    
+    Args:
+        os_type: Normalized OS type (Ubuntu, CentOS, Windows, else)
+        hosts: Hosts belonging to this OS group (output of group_hosts_by_os)
+        quiet: Suppress ansible_runner stdout (used when groups run concurrently)
+        forks, strategy, serial, record_timing: See run_ansible_playbook_on_hosts
+        probe: Prepend the connectivity probe tasks to the scan playbook (single-pass mode)
+        connectivity_results: Dict updated with this group's connectivity results
+                              (all hosts with probe, otherwise only hosts that failed)
+        connectivity_cache: Cache to expire failed hosts from (and store probe results in)
+        on_host_update: Callback for per-host state changes while the run is in progress
+        connection_profile: SSH connection profile for Unix groups
+        streamlined: Use the single round-trip Unix playbook
+        collect_only: Collect config snapshots instead of running the checks (Unix only)
+        completed_hosts: Set updated with the HOST_IDENs whose JSON result was retrieved
+    
+    Returns:
+        bool: True if the playbook run for this group was successful
+    """
+    print(f"\n{'='*50}")
+    print(f"Processing {len(hosts)} {os_type} hosts...")
+    print(f"{'='*50}")
+    
+    if collect_only and os_type in ('Windows', 'else'):
+        print(f"Warning: Snapshot collection is not supported for {os_type}. Skipping {os_type} hosts.")
+        if connectivity_results is not None:
+            connectivity_results.update(
+                create_failed_connectivity_results(os_type, hosts, 'Not probed: snapshot collection not supported'))
+        return False
+    
+    # Check if script exists for this OS type
+    script_path = get_collector_path() if collect_only else get_script_path(os_type)
+    if not os.path.exists(script_path):
+        print(f"Warning: Script {script_path} not found. Skipping {os_type} hosts.")
+        if connectivity_results is not None:
+            connectivity_results.update(
+                create_failed_connectivity_results(os_type, hosts, f'Not probed: {script_path} not found'))
+        return False
+    
+    # Create inventory for this OS group
+    inventory = create_os_inventory(hosts, os_type, connection_profile)
+    
+    # Create playbook for this OS type
+    playbook = create_os_playbook(os_type, strategy, serial, streamlined, collect_only)
+    if probe:
+        add_connectivity_probe(playbook, os_type)
+    
+    # Create extravars
+    extravars = create_extravars(hosts)
+    
+    # Per-host state is updated as each event arrives instead of scanning result.events afterwards
+    tracker = HostEventTracker(os_type, hosts, on_update=on_host_update)
+    
+    # Execute playbook for this OS group
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            print(f"Executing {os_type} playbook using ansible_runner...")
+            
+            result = ansible_runner.run(
+                private_data_dir=temp_dir,
+                inventory=inventory,
+                playbook=playbook,
+                extravars=extravars,
+                quiet=quiet,
+                verbosity=1,
+                event_handler=tracker.handle,
+                **runner_fork_kwargs(forks)
+            )
+            
+            if record_timing:
+                save_host_timings(os_type, tracker.host_timings())
+            
+            if completed_hosts is not None:
+                completed_hosts.update(tracker.completed - tracker.failed)
+            
+            if connectivity_results is not None:
+                if probe:
+                    connectivity_results.update(tracker.connectivity)
+                else:
+                    # Without the probe tasks no event marks a host reachable, so the
+                    # tracker only knows about failures; other hosts keep their result
+                    connectivity_results.update(
+                        {host_iden: tracker.connectivity[host_iden] for host_iden in tracker.failed})
+            if connectivity_cache is not None:
+                if probe:
+                    connectivity_cache.store_results(tracker.connectivity)
+                for host_iden in tracker.failed:
+                    connectivity_cache.invalidate(host_iden)
+                connectivity_cache.save()
+            
+            if result.status == 'successful':
+                print(f"✓ {os_type} playbook executed successfully!")
+                
+                # Print host-specific results
+                for host in tracker.fetched:
+                    print(f"  ✓ JSON file retrieved from {host}")
+                return True
+            
+            print("No hosts are manageable by Ansible. Please check your configuration.")
+            print(f"✗ {os_type} playbook failed with status: {result.status}")
+            
+            # Print error details
+            for host, msg in tracker.errors:
+                print(f"  ✗ Error on {host}: {msg}")
+            return False
+                        
+        except Exception as e:
+            print(f"✗ Error executing {os_type} playbook: {e}")
+            if connectivity_results is not None:
+                connectivity_results.update(
+                    create_failed_connectivity_results(os_type, hosts, f'Ansible execution failed: {str(e)}'))
+            if connectivity_cache is not None:
+                for host in hosts:
+                    connectivity_cache.invalidate(host['HOST_IDEN'])
+                connectivity_cache.save()
+            return False
+
+def run_os_group_in_batches(os_type: str, hosts: List[Dict[str, str]], quiet: bool = False,
+                            batch_size: int = 100, checkpoint: Optional['ScanCheckpoint'] = None,
+                            **run_options) -> bool:
+    """
+    Execute the playbook for a single OS group in chunks of batch_size hosts.
+    
+    Each chunk gets its own inventory and ansible_runner run, so memory stays
+    flat regardless of group size. Completed HOST_IDENs are written to the
+    checkpoint after every chunk, and hosts already completed with a fresh
+    result file are skipped, so an interrupted scan can simply be rerun.
+    
+    run_options are passed through to run_os_group_playbook.
+    """
+    checkpoint = checkpoint or ScanCheckpoint()
+    collect_only = run_options.get('collect_only', False)
+    pending = [host for host in hosts
+               if not checkpoint.is_done(host['HOST_IDEN'], os_type, collect_only)]
+    
+    skipped = len(hosts) - len(pending)
+    if skipped:
+        print(f"Skipping {skipped} {os_type} hosts with fresh results (checkpoint {checkpoint.path})")
+    
+    overall_success = True
+    total_batches = (len(pending) + batch_size - 1) // batch_size
+    
+    for batch_num, start in enumerate(range(0, len(pending), batch_size), start=1):
+        batch = pending[start:start + batch_size]
+        print(f"\n{os_type} batch {batch_num}/{total_batches} ({len(batch)} hosts)")
+        
+        completed = set()
+        if not run_os_group_playbook(os_type, batch, quiet, completed_hosts=completed, **run_options):
+            overall_success = False
+        
+        checkpoint.mark_done(completed, collect_only)
+        checkpoint.save()
     
     return overall_success
 
+def run_single_pass_scan(host_list: List[Dict[str, str]], **options) -> Tuple[bool, Dict[str, Dict[str, any]]]:
+    """
+    Probe and scan all hosts in one Ansible run per OS group.
+    
+    The ping, privilege and fact checks run as the first tasks of the scan
+    playbook, so each host is connected to once instead of three times.
+    
+    Args:
+        host_list: Same as run_ansible_playbook_on_hosts
+        options: Extra keyword arguments for run_ansible_playbook_on_hosts
+    
+    Returns:
+        Tuple of (overall success, connectivity results keyed by HOST_IDEN)
+    """
+    connectivity_results = {}
+    success = run_ansible_playbook_on_hosts(host_list, single_pass=True,
+                                            connectivity_results=connectivity_results, **options)
+    return success, connectivity_results
+
 def group_hosts_by_os(host_list: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
     """Group hosts by their OS type, extracting base OS from version strings."""
     os_groups = defaultdict(list)
     
     for host in host_list:
         os_full = host.get('HOST_OS', 'else')
-        
-        # Extract base OS type from full OS string (e.g., "Ubuntu 24.04" -> "ubuntu")
-        os_base = extract_base_os_type(os_full)
-        
-        # Normalize OS names to standard categories
-        if os_base in ['ubuntu', 'debian']:
-            os_type = 'Ubuntu'
-        elif os_base in ['centos', 'rhel', 'redhat', 'fedora', 'rocky', 'almalinux']:
-            os_type = 'CentOS'
-        elif os_base in ['windows', 'win']:
-            os_type = 'Windows'
-        else:
-            os_type = 'else'
+        os_type = normalize_os_type(os_full)
         
         # Update the host dict with normalized OS and keep original
         host_copy = host.copy()
@@ -116,6 +404,24 @@ def group_hosts_by_os(host_list: List[Dict[str, str]]) -> Dict[str, List[Dict[st
     
     return dict(os_groups)
 
+def normalize_os_type(os_full: str) -> str:
+    """Map a full OS string to its playbook group (Ubuntu, CentOS, Windows or else)."""
+    # Extract base OS type from full OS string (e.g., "Ubuntu 24.04" -> "ubuntu")
+    os_base = extract_base_os_type(os_full)
+    
+    # Normalize OS names to standard categories
+    if os_base in ['ubuntu', 'debian']:
+        return 'Ubuntu'
+    elif os_base in ['centos', 'rhel', 'redhat', 'fedora', 'rocky', 'almalinux']:
+        return 'CentOS'
+    elif os_base in ['windows', 'win']:
+        return 'Windows'
+    return 'else'
+
+def get_host_os_type(host: Dict[str, str]) -> str:
+    """Normalized OS type of a host dict, grouped (HOST_OS_TYPE) or raw (HOST_OS)."""
+    return host.get('HOST_OS_TYPE') or normalize_os_type(host.get('HOST_OS', 'else'))
+
 def extract_base_os_type(os_string: str) -> str:
     """
     Extract base OS type from full OS string.
@@ -152,18 +458,33 @@ def extract_base_os_type(os_string: str) -> str:
         return 'else'
 
 def get_script_path(os_type: str) -> str:
-    """Get the script path for the given OS type."""
+    """
+    Get the script path for the given OS type.
+
+    All engines live under Script/ (a single tree, so checkouts on
+    case-insensitive filesystems do not merge it with a lowercase twin).
+    """
     script_names = {
-        'Ubuntu': 'script/Ubuntu/Ubuntu_cce.sh',
-        'CentOS': 'script/CentOS/CentOS_cce.sh', 
-        'Windows': 'script/Windows/Windows_cce.bat',
-        'else': 'script/else/else_cce.sh'
+        'Ubuntu': 'Script/Ubuntu/Ubuntu_cce.sh',
+        'CentOS': 'Script/CentOS/CentOS_cce.sh',
+        'Windows': 'Script/Windows/Windows_cce.bat',
+        'else': 'Script/else/else_cce.sh'
     }
     
-    return os.path.join(os.getcwd(), script_names.get(os_type, 'Script/else/else.sh'))
+    return os.path.join(os.getcwd(), script_names.get(os_type, script_names['else']))
 
-def create_os_inventory(host_list: List[Dict[str, str]], os_type: str) -> dict:
-    """Create Ansible inventory dictionary for specific OS type."""
+def get_collector_path() -> str:
+    """Get the path of the config snapshot collector (collection-only mode)."""
+    return os.path.join(os.getcwd(), 'Script', 'collect.sh')
+
+def create_os_inventory(host_list: List[Dict[str, str]], os_type: str,
+                        connection_profile: str = 'default') -> dict:
+    """
+    Create Ansible inventory dictionary for specific OS type.
+    
+    connection_profile selects the SSH settings from SSH_CONNECTION_PROFILES
+    (ignored for Windows hosts, which use WinRM).
+    """
     group_name = f"{os_type.lower()}_hosts"
     
     inventory = {
@@ -179,36 +500,108 @@ def create_os_inventory(host_list: List[Dict[str, str]], os_type: str) -> dict:
             'ansible_user': host['HOST_USER'],
             'ansible_port': int(host['HOST_PORT']),
             'ansible_become_password': host['HOST_SUPW'],
-            'ansible_ssh_common_args': '-o StrictHostKeyChecking=no',
             'host_os_type': host['HOST_OS_TYPE'],
             'host_os_full': host['HOST_OS_FULL'],
             'host_ip': host['HOST_ADDR'],
-            'host_identifier': host['HOST_IDEN']
+            'host_identifier': host['HOST_IDEN'],
+            'cce_low_impact': is_low_impact_host(host)
         }
+        if host_config['cce_low_impact']:
+            host_config['cce_walk_rate'] = LOW_IMPACT_WALK_RATE
         
         # Windows-specific configuration
         if os_type == 'Windows':
             host_config.update({
+                'ansible_ssh_common_args': SSH_CONNECTION_PROFILES['default']['ansible_ssh_common_args'],
                 'ansible_connection': 'winrm',
                 'ansible_winrm_transport': 'basic',
                 'ansible_winrm_server_cert_validation': 'ignore'
             })
+        else:
+            host_config.update(SSH_CONNECTION_PROFILES[connection_profile])
         
         inventory[group_name]['hosts'][host_name] = host_config
     
     return inventory
 
-def create_os_playbook(os_type: str) -> list:
+def is_low_impact_host(host: Dict[str, str]) -> bool:
+    """
+    Decide whether a host is scanned in low-impact mode.
+    
+    An explicit HOST_LOW_IMPACT (bool, or 'Y'/'1'/'true') wins; otherwise
+    hosts whose HOST_IMPORTANCE is in LOW_IMPACT_IMPORTANCE are low-impact.
+    """
+    flag = host.get('HOST_LOW_IMPACT')
+    if flag is not None and flag != '':
+        if isinstance(flag, str):
+            return flag.strip().lower() in ('y', 'yes', '1', 'true')
+        return bool(flag)
+    return host.get('HOST_IMPORTANCE') in LOW_IMPACT_IMPORTANCE
+
+def low_impact_environment() -> dict:
+    """Task environment passing the host's low-impact settings to the check script."""
+    return {
+        'CCE_LOW_IMPACT': "{{ '1' if cce_low_impact | default(false) else '0' }}",
+        'CCE_WALK_RATE': "{{ cce_walk_rate | default(0) }}"
+    }
+
+def marked_json_expression(register: str, output_filter: str = 'to_nice_json') -> str:
+    """Jinja expression for the JSON printed between the result markers in a registered stdout."""
+    return (f"{{{{ {register}.stdout.split('{RESULT_BEGIN_MARKER}')[-1]"
+            f".split('{RESULT_END_MARKER}')[0] | from_json | {output_filter} }}}}")
+
+def create_result_fact_task(result_path: str, when: Optional[str] = None) -> dict:
+    """Task recording where a host's result was saved on the control node (see RESULT_FACT)."""
+    task = {
+        'name': 'Record retrieved result',
+        'set_fact': {RESULT_FACT: result_path}
+    }
+    if when:
+        task['when'] = when
+    return task
+
+def validate_connection_profile(connection_profile: str) -> None:
+    """Raise ValueError for unknown SSH connection profiles."""
+    if connection_profile not in SSH_CONNECTION_PROFILES:
+        raise ValueError(f"Unknown connection profile '{connection_profile}'. "
+                         f"Use one of: {', '.join(SSH_CONNECTION_PROFILES)}.")
+
+def create_os_playbook(os_type: str, strategy: str = 'linear',
+                       serial: Optional[Union[int, str, list]] = None,
+                       streamlined: bool = False, collect_only: bool = False) -> list:
     """Create the Ansible playbook for specific OS type."""
     group_name = f"{os_type.lower()}_hosts"
     script_name = get_script_filename(os_type)
     
-    if os_type == 'Windows':
-        return create_windows_playbook(group_name, script_name)
+    if collect_only and os_type not in ('Windows', 'else'):
+        return create_collection_playbook(group_name, strategy, serial)
+    elif os_type == 'Windows':
+        return create_windows_playbook(group_name, script_name, strategy, serial)
     elif os_type == 'else':
         return create_else_playbook(group_name)
+    elif streamlined:
+        return create_unix_streamlined_playbook(group_name, script_name, strategy, serial)
     else:
-        return create_unix_playbook(group_name, script_name)
+        return create_unix_playbook(group_name, script_name, strategy, serial)
+
+def validate_strategy(strategy: str) -> None:
+    """Raise ValueError for strategies the scan playbooks do not support."""
+    if strategy not in ('linear', 'free'):
+        raise ValueError(f"Unsupported strategy '{strategy}'. Use 'linear' or 'free'.")
+
+def apply_play_options(playbook: list, strategy: str = 'linear',
+                       serial: Optional[Union[int, str, list]] = None) -> list:
+    """Set strategy/serial on every play of a playbook (defaults leave the play untouched)."""
+    for play in playbook:
+        if strategy != 'linear':
+            play['strategy'] = strategy
+        if serial is not None:
+            play['serial'] = serial
+    return playbook
+
+def runner_fork_kwargs(forks: Optional[int]) -> dict:
+    """Build the ansible_runner.run keyword arguments for the fork count."""
+    return {'forks': int(forks)} if forks else {}
 
 def get_script_filename(os_type: str) -> str:
     """Get script filename for the OS type."""
@@ -220,7 +613,8 @@ def get_script_filename(os_type: str) -> str:
     }
     return script_names.get(os_type, 'else_cce.sh')
 
-def create_unix_playbook(group_name: str, script_name: str) -> list:
+def create_unix_playbook(group_name: str, script_name: str, strategy: str = 'linear',
+                         serial: Optional[Union[int, str, list]] = None) -> list:
     """Create playbook for Unix-like systems (Ubuntu, CentOS)."""
     # Extract OS type from group_name (e.g., "ubuntu_hosts" -> "Ubuntu")
     os_type = group_name.replace('_hosts', '')
@@ -267,6 +661,8 @@ def create_unix_playbook(group_name: str, script_name: str) -> list:
                 'args': {
                     'chdir': '/tmp'
                 },
+                'environment': low_impact_environment(),
+                'timeout': SCAN_TASK_TIMEOUT,
                 'register': 'script_result'
             },
             {
@@ -277,6 +673,14 @@ def create_unix_playbook(group_name: str, script_name: str) -> list:
                 },
                 'register': 'json_files'
             },
+            {
+                'name': 'Find evidence archive',
+                'find': {
+                    'paths': ['/tmp'],
+                    'patterns': ['{{ host_os_type }}_*.evidence.tar.gz']
+                },
+                'register': 'evidence_files'
+            },
             {
                 'name': 'Fetch JSON files to control node tmp directory',
                 'fetch': {
@@ -306,6 +710,16 @@ def create_unix_playbook(group_name: str, script_name: str) -> list:
                 'loop': "{{ json_files.files }}",
                 'become': False
             },
+            {
+                'name': 'Fetch evidence archive to control node tmp directory as HOST_IDEN',
+                'fetch': {
+                    'src': "{{ item.path }}",
+                    'dest': "{{ tmp_dir }}/{{ host_identifier }}.evidence.tar.gz",
+                    'flat': True
+                },
+                'loop': "{{ evidence_files.files }}"
+            },
+            create_result_fact_task("{{ tmp_dir }}/{{ host_identifier }}.json", when='json_files.matched > 0'),
             {
                 'name': 'Remove script from host',
                 'file': {
@@ -320,13 +734,169 @@ def create_unix_playbook(group_name: str, script_name: str) -> list:
                     'state': 'absent'
                 },
                 'loop': "{{ json_files.files }}"
+            },
+            {
+                'name': 'Remove evidence archive from host',
+                'file': {
+                    'path': "{{ item.path }}",
+                    'state': 'absent'
+                },
+                'loop': "{{ evidence_files.files }}"
             }
         ]
     }]
     
-    return playbook
+    return apply_play_options(playbook, strategy, serial)
+
+def create_unix_streamlined_playbook(group_name: str, script_name: str, strategy: str = 'linear',
+                                    serial: Optional[Union[int, str, list]] = None) -> list:
+    """
+    Create a single round-trip playbook for Unix-like systems.
+    
+    The 'script' module uploads, runs and removes the script in one task; the
+    script is called with --stdout so it prints its JSON result instead of
+    writing /tmp/{os}_*.json. The JSON is then written on the control node
+    directly as tmp/{HOST_IDEN}.json, with no find/fetch/rename/delete passes.
+    """
+    # Extract OS type from group_name (e.g., "ubuntu_hosts" -> "Ubuntu")
+    os_type = group_name.replace('_hosts', '')
+    if os_type == 'ubuntu':
+        os_type = 'Ubuntu'
+    elif os_type == 'centos':
+        os_type = 'CentOS'
+    
+    script_path = get_script_path(os_type)
+    
+    playbook = [{
+        'name': f'Execute {script_name} on {group_name} (streamlined)',
+        'hosts': group_name,
+        'become': True,
+        'gather_facts': False,
+        'vars': {
+            'script_name': script_name,
+            'script_path': script_path,
+            'local_dir': os.getcwd(),
+            'tmp_dir': os.path.join(os.getcwd(), 'tmp')
+        },
+        'tasks': [
+            {
+                'name': 'Create tmp directory on control node',
+                'local_action': {
+                    'module': 'file',
+                    'path': "{{ tmp_dir }}",
+                    'state': 'directory'
+                },
+                'become': False,
+                'run_once': True
+            },
+            {
+                'name': f'Execute {script_name} and capture JSON output',
+                'script': {
+                    'cmd': "{{ script_path }} --stdout",
+                    'chdir': '/tmp'
+                },
+                'environment': dict(low_impact_environment(), CCE_EVIDENCE_ARCHIVE=UNIX_EVIDENCE_ARCHIVE),
+                'timeout': SCAN_TASK_TIMEOUT,
+                'register': 'script_result'
+            },
+            {
+                'name': 'Write JSON result from script output to control node tmp directory',
+                'local_action': {
+                    'module': 'copy',
+                    'content': marked_json_expression('script_result'),
+                    'dest': "{{ tmp_dir }}/{{ host_identifier }}.json"
+                },
+                'become': False
+            },
+            {
+                'name': 'Fetch evidence archive to control node tmp directory as HOST_IDEN',
+                'fetch': {
+                    'src': UNIX_EVIDENCE_ARCHIVE,
+                    'dest': "{{ tmp_dir }}/{{ host_identifier }}.evidence.tar.gz",
+                    'flat': True,
+                    'fail_on_missing': False
+                }
+            },
+            {
+                'name': 'Remove evidence archive from host',
+                'file': {
+                    'path': UNIX_EVIDENCE_ARCHIVE,
+                    'state': 'absent'
+                }
+            },
+            create_result_fact_task("{{ tmp_dir }}/{{ host_identifier }}.json")
+        ]
+    }]
+    
+    return apply_play_options(playbook, strategy, serial)
+
+def create_collection_playbook(group_name: str, strategy: str = 'linear',
+                               serial: Optional[Union[int, str, list]] = None) -> list:
+    """
+    Create a collection-only playbook for Unix-like systems.
+    
+    Script/collect.sh is run with the sources listed in the rule registry
+    (see check_engine.CheckRegistry.sources) and prints a content-addressed
+    snapshot, which is written to tmp/snapshots/{HOST_IDEN}.json on the
+    control node. No check runs on the host; check_engine.rescore_snapshots
+    evaluates the snapshots centrally, so rule changes need no new sweep.
+    
+    Contents already in the control node's blob store (tmp/snapshots/blobs)
+    are passed as --known sha256 prefixes and are not transferred again, so
+    golden-image config files cross the network once for the whole fleet.
+    """
+    snapshot_dir = os.path.join(os.getcwd(), 'tmp', 'snapshots')
+    sources = ' '.join(shlex.quote(source) for source in get_registry().sources())
+    known = known_blob_prefixes(get_blob_dir(snapshot_dir))
+    if known:
+        sources = f"--known {','.join(known)} {sources}"
+    
+    playbook = [{
+        'name': f'Collect config snapshot on {group_name}',
+        'hosts': group_name,
+        'become': True,
+        'gather_facts': False,
+        'vars': {
+            'collector_path': get_collector_path(),
+            'snapshot_dir': snapshot_dir
+        },
+        'tasks': [
+            {
+                'name': 'Create snapshot directory on control node',
+                'local_action': {
+                    'module': 'file',
+                    'path': "{{ snapshot_dir }}",
+                    'state': 'directory'
+                },
+                'become': False,
+                'run_once': True
+            },
+            {
+                'name': 'Collect config snapshot',
+                'script': {
+                    'cmd': f"{{{{ collector_path }}}} {sources}",
+                    'chdir': '/tmp'
+                },
+                'timeout': COLLECT_TASK_TIMEOUT,
+                'register': 'snapshot_result'
+            },
+            {
+                'name': 'Write config snapshot to control node snapshot directory',
+                'local_action': {
+                    'module': 'copy',
+                    'content': marked_json_expression('snapshot_result', 'to_json'),
+                    'dest': "{{ snapshot_dir }}/{{ host_identifier }}.json"
+                },
+                'become': False
+            },
+            create_result_fact_task("{{ snapshot_dir }}/{{ host_identifier }}.json")
+        ]
+    }]
+    
+    return apply_play_options(playbook, strategy, serial)
 
-def create_windows_playbook(group_name: str, script_name: str) -> list:
+def create_windows_playbook(group_name: str, script_name: str, strategy: str = 'linear',
+                            serial: Optional[Union[int, str, list]] = None) -> list:
     """Create playbook for Windows systems."""
     script_path = get_script_path('Windows')
     
@@ -364,6 +934,7 @@ def create_windows_playbook(group_name: str, script_name: str) -> list:
                 'args': {
                     'chdir': 'C:\\temp'
                 },
+                'timeout': SCAN_TASK_TIMEOUT,
                 'register': 'script_result'
             },
             {
@@ -374,6 +945,14 @@ def create_windows_playbook(group_name: str, script_name: str) -> list:
                 },
                 'register': 'json_files'
             },
+            {
+                'name': 'Find evidence archive',
+                'win_find': {
+                    'paths': ['C:\\temp'],
+                    'patterns': ['{{ host_os_type }}_*.evidence.tar.gz']
+                },
+                'register': 'evidence_files'
+            },
             {
                 'name': 'Fetch JSON files to control node with original names',
                 'fetch': {
@@ -403,6 +982,16 @@ def create_windows_playbook(group_name: str, script_name: str) -> list:
                 'loop': "{{ json_files.files }}",
                 'become': False
             },
+            {
+                'name': 'Fetch evidence archive to control node as HOST_IDEN',
+                'fetch': {
+                    'src': "{{ item.path }}",
+                    'dest': "{{ local_dir }}/{{ host_identifier }}.evidence.tar.gz",
+                    'flat': True
+                },
+                'loop': "{{ evidence_files.files }}"
+            },
+            create_result_fact_task("{{ local_dir }}/{{ host_identifier }}.json", when='json_files.matched > 0'),
             {
                 'name': 'Remove script from host',
                 'win_file': {
@@ -417,11 +1006,19 @@ def create_windows_playbook(group_name: str, script_name: str) -> list:
                     'state': 'absent'
                 },
                 'loop': "{{ json_files.files }}"
+            },
+            {
+                'name': 'Remove evidence archive from host',
+                'win_file': {
+                    'path': "{{ item.path }}",
+                    'state': 'absent'
+                },
+                'loop': "{{ evidence_files.files }}"
             }
         ]
     }]
     
-    return playbook
+    return apply_play_options(playbook, strategy, serial)
 
 def create_else_playbook(group_name: str) -> list:
     """Create a no-op playbook for 'else' OS type."""
@@ -448,21 +1045,39 @@ def create_extravars(host_list: List[Dict[str, str]]) -> dict:
         'current_time': datetime.now().strftime("%Y%m%d_%H%M%S")
     }
 
-def check_ansible_connectivity(host_list: List[Dict[str, str]]) -> Dict[str, Dict[str, any]]:
+def check_ansible_connectivity(host_list: List[Dict[str, str]],
+                               forks: Optional[int] = None,
+                               strategy: str = 'linear',
+                               serial: Optional[Union[int, str, list]] = None,
+                               record_timing: bool = False,
+                               on_host_update: Optional[Callable[[str, Dict[str, any]], None]] = None,
+                               connection_profile: str = 'default',
+                               tcp_preprobe: bool = False) -> Dict[str, Dict[str, any]]:
     """
     Check if hosts are reachable and manageable by Ansible.
     Now also validates HOST_OS field.
+    
+    forks, strategy, serial, record_timing, on_host_update, connection_profile
+    and tcp_preprobe behave as in run_ansible_playbook_on_hosts. Probing with
+    the 'performance' profile leaves the SSH master connections open for the
+    following scan.
     """
+    validate_strategy(strategy)
+    validate_connection_profile(connection_profile)
+    
+    results = {}
+    if tcp_preprobe:
+        # Dead hosts are reported from the TCP probe and never reach ansible_runner
+        host_list, results = filter_tcp_reachable_hosts(host_list)
     
     # Group hosts by OS for connectivity testing
     os_groups = group_hosts_by_os(host_list)
-    results = {}
     
     for os_type, hosts in os_groups.items():
         print(f"\nTesting connectivity for {os_type} hosts...")
         
         # Create inventory for this OS group
-        inventory = create_os_inventory(hosts, os_type)
+        inventory = create_os_inventory(hosts, os_type, connection_profile)
         group_name = f"{os_type.lower()}_hosts"
         
         # Simple connectivity test playbook
@@ -470,131 +1085,567 @@ def check_ansible_connectivity(host_list: List[Dict[str, str]]) -> Dict[str, Dic
             ping_playbook = create_windows_connectivity_playbook(group_name)
         else:
             ping_playbook = create_unix_connectivity_playbook(group_name)
+        apply_play_options(ping_playbook, strategy, serial)
+        tracker = HostEventTracker(os_type, hosts, on_update=on_host_update)
         
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                result = ansible_runner.run(
+                ansible_runner.run(
                     private_data_dir=temp_dir,
                     inventory=inventory,
                     playbook=ping_playbook,
                     quiet=True,
-                    verbosity=0
+                    verbosity=0,
+                    event_handler=tracker.handle,
+                    **runner_fork_kwargs(forks)
                 )
                 
-                # Process results for each host in this OS group
-                for i, host in enumerate(hosts):
-                    host_name = f"{os_type.lower()}_host_{i}"
-                    host_iden = host['HOST_IDEN']
-                    
-                    results[host_iden] = {
-                        'reachable': False,
-                        'ssh_accessible': False,
-                        'sudo_accessible': False,
-                        'hostname': None,
-                        'os': os_type,
-                        'os_full': host.get('HOST_OS_FULL', 'N/A'),
-                        'detected_os': None,
-                        'error': None,
-                        'host_addr': host['HOST_ADDR']  # Keep addr for display
-                    }
-                    
-                    # Check events for this specific host
-                    for event in result.events:
-                        event_data = event.get('event_data', {})
-                        if event_data.get('host') == host_name:
-                            
-                            if event.get('event') == 'runner_on_ok':
-                                task_name = event_data.get('task', '')
-                                res = event_data.get('res', {})
-                                
-                                if 'Test connection' in task_name:
-                                    results[host_iden]['reachable'] = True
-                                    results[host_iden]['ssh_accessible'] = True
-                                    
-                                elif 'Test sudo access' in task_name or 'Test admin access' in task_name:
-                                    results[host_iden]['sudo_accessible'] = True
-                                    
-                                elif 'Gather basic system info' in task_name:
-                                    facts = res.get('ansible_facts', {})
-                                    results[host_iden]['hostname'] = facts.get('ansible_hostname')
-                                    results[host_iden]['detected_os'] = facts.get('ansible_distribution') or facts.get('ansible_os_family')
-                            
-                            elif event.get('event') in ['runner_on_failed', 'runner_on_unreachable']:
-                                results[host_iden]['error'] = event_data.get('res', {}).get('msg', 'Connection failed')
+                if record_timing:
+                    save_host_timings(f"{os_type}_connectivity", tracker.host_timings())
+                
+                results.update(tracker.connectivity)
                 
             except Exception as e:
                 # If the entire run failed, mark all hosts in this group as unreachable
-                for host in hosts:
-                    host_iden = host['HOST_IDEN']
-                    results[host_iden] = {
-                        'reachable': False,
-                        'ssh_accessible': False,
-                        'sudo_accessible': False,
-                        'hostname': None,
-                        'os': os_type,
-                        'os_full': host.get('HOST_OS_FULL', 'N/A'),
-                        'detected_os': None,
-                        'error': f'Ansible execution failed: {str(e)}',
-                        'host_addr': host['HOST_ADDR']
-                    }
+                results.update(create_failed_connectivity_results(os_type, hosts, f'Ansible execution failed: {str(e)}'))
     
     return results
 
+async def _tcp_connect(host: Dict[str, str], semaphore: asyncio.Semaphore, timeout: float) -> Optional[str]:
+    """Open and close a TCP connection to HOST_ADDR:HOST_PORT. Returns an error message or None."""
+    addr, port = host['HOST_ADDR'], int(host['HOST_PORT'])
+    async with semaphore:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(addr, port), timeout)
+        except asyncio.TimeoutError:
+            return f'Unreachable: TCP connect to {addr}:{port} timed out after {timeout}s'
+        except OSError as e:
+            return f'Unreachable: port {port} closed or filtered on {addr} ({e})'
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return None
+
+async def _tcp_connect_all(hosts: List[Dict[str, str]], concurrency: int, timeout: float) -> List[Optional[str]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(_tcp_connect(host, semaphore, timeout) for host in hosts))
+
+def probe_hosts_tcp(host_list: List[Dict[str, str]], concurrency: int = 256,
+                    timeout: float = 3.0) -> Dict[str, Dict[str, any]]:
+    """
+    Lightweight reachability pre-probe using asyncio TCP connects to HOST_PORT.
+    
+    No ansible_runner process is started, so thousands of hosts can be checked
+    in a few seconds. Results use the check_ansible_connectivity shape (usable
+    with print_connectivity_report); 'reachable' only means the port accepted
+    a connection. SSH and privilege access are never tested here, so
+    'ssh_accessible' and 'sudo_accessible' are None (unknown), and hosts whose
+    port did not accept a connection are reported as unreachable.
+    
+    Args:
+        host_list: Hosts with HOST_IDEN, HOST_ADDR, HOST_PORT, HOST_OS
+        concurrency: Maximum number of connection attempts in flight
+        timeout: Seconds to wait for each connection
+    """
+    hosts = [host for group in group_hosts_by_os(host_list).values() for host in group]
+    errors = asyncio.run(_tcp_connect_all(hosts, concurrency, timeout))
+    
+    results = {}
+    for host, error in zip(hosts, errors):
+        result = create_connectivity_result(host['HOST_OS_TYPE'], host, error)
+        result['reachable'] = error is None
+        result['ssh_accessible'] = None
+        result['sudo_accessible'] = None
+        results[host['HOST_IDEN']] = result
+    return results
+
+def filter_tcp_reachable_hosts(host_list: List[Dict[str, str]], **probe_options) -> Tuple[List[Dict[str, str]], Dict[str, Dict[str, any]]]:
+    """
+    Split hosts with probe_hosts_tcp before running Ansible.
+    
+    Returns:
+        Tuple of (hosts that accepted a TCP connection, connectivity results of the dead hosts)
+    """
+    probe_results = probe_hosts_tcp(host_list, **probe_options)
+    reachable = [host for host in host_list if probe_results[host['HOST_IDEN']]['reachable']]
+    dead_results = {iden: result for iden, result in probe_results.items() if not result['reachable']}
+    
+    print(f"TCP pre-probe: {len(reachable)}/{len(host_list)} hosts reachable")
+    return reachable, dead_results
+
+def create_connectivity_result(os_type: str, host: Dict[str, str], error: Optional[str] = None) -> Dict[str, any]:
+    """Create the initial (unreachable) connectivity result entry for a host."""
+    return {
+        'reachable': False,
+        'ssh_accessible': False,
+        'sudo_accessible': False,
+        'hostname': None,
+        'os': os_type,
+        'os_full': host.get('HOST_OS_FULL', 'N/A'),
+        'detected_os': None,
+        'error': error,
+        'host_addr': host['HOST_ADDR']  # Keep addr for display
+    }
+
+def create_failed_connectivity_results(os_type: str, hosts: List[Dict[str, str]], error: str) -> Dict[str, Dict[str, any]]:
+    """Mark every host of an OS group as unreachable with the given error."""
+    return {host['HOST_IDEN']: create_connectivity_result(os_type, host, error) for host in hosts}
+
+class HostEventTracker:
+    """
+    Incremental per-host state for one ansible_runner run of an OS group.
+    
+    Passed to ansible_runner.run as event_handler, so every event is applied
+    in O(1) as it arrives (hosts are looked up by their generated inventory
+    name) and events do not need to be buffered. The state is readable while
+    the run is still in progress; on_update(host_iden, state) is called after
+    every change.
+    
+    Attributes:
+        connectivity: Connectivity results keyed by HOST_IDEN
+                      (same shape as check_ansible_connectivity)
+        failed: HOST_IDENs with a failed or unreachable task
+        fetched: Inventory host names whose JSON result was fetched
+                 (the playbook's final task set RESULT_FACT for them)
+        completed: HOST_IDENs whose JSON result was fetched
+        errors: (inventory host name, message) for every failed task
+    """
+    
+    def __init__(self, os_type: str, hosts: List[Dict[str, str]],
+                 on_update: Optional[Callable[[str, Dict[str, any]], None]] = None,
+                 keep_events: bool = False):
+        self.os_type = os_type
+        self.on_update = on_update
+        self.keep_events = keep_events
+        self.host_map = {f"{os_type.lower()}_host_{i}": host for i, host in enumerate(hosts)}
+        self.connectivity = {host['HOST_IDEN']: create_connectivity_result(os_type, host) for host in hosts}
+        self.failed = set()
+        self.fetched = []
+        self.completed = set()
+        self.errors = []
+        self._timings = {}
+    
+    def handle(self, event: Dict[str, any]) -> bool:
+        """Apply one ansible_runner event. Returns whether runner should keep the event."""
+        event_data = event.get('event_data', {})
+        host_name = event_data.get('host')
+        host = self.host_map.get(host_name)
+        if host is None:
+            return self.keep_events
+        
+        host_iden = host['HOST_IDEN']
+        result = self.connectivity[host_iden]
+        event_type = event.get('event')
+        task_name = event_data.get('task', '')
+        res = event_data.get('res', {})
+        
+        if event_type == 'runner_on_ok':
+            if 'Test connection' in task_name:
+                result['reachable'] = True
+                result['ssh_accessible'] = True
+                
+            elif 'Test sudo access' in task_name or 'Test admin access' in task_name:
+                result['sudo_accessible'] = True
+                
+            elif 'Gather basic system info' in task_name:
+                facts = res.get('ansible_facts', {})
+                result['hostname'] = facts.get('ansible_hostname')
+                result['detected_os'] = facts.get('ansible_distribution') or facts.get('ansible_os_family')
+            
+            elif RESULT_FACT in res.get('ansible_facts', {}):
+                self.fetched.append(host_name)
+                self.completed.add(host_iden)
+        
+        elif event_type in ['runner_on_failed', 'runner_on_unreachable']:
+            result['error'] = res.get('msg', 'Connection failed')
+            self.failed.add(host_iden)
+            self.errors.append((host_name, res.get('msg', res.get('stderr', 'Unknown error'))))
+        
+        if event_data.get('duration') is not None:
+            self._record_timing(host, event_data)
+        
+        if self.on_update is not None:
+            self.on_update(host_iden, result)
+        
+        return self.keep_events
+    
+    def _record_timing(self, host: Dict[str, str], event_data: Dict[str, any]) -> None:
+        duration = event_data['duration']
+        entry = self._timings.setdefault(str(host['HOST_IDEN']), {
+            'host_addr': host['HOST_ADDR'],
+            'tasks': 0,
+            'task_seconds': 0.0,
+            'slowest_task': None,
+            'slowest_seconds': 0.0,
+            'start': None,
+            'end': None
+        })
+        entry['tasks'] += 1
+        entry['task_seconds'] += duration
+        if duration > entry['slowest_seconds']:
+            entry['slowest_seconds'] = duration
+            entry['slowest_task'] = event_data.get('task')
+        start, end = event_data.get('start'), event_data.get('end')
+        if start and (entry['start'] is None or start < entry['start']):
+            entry['start'] = start
+        if end and (entry['end'] is None or end > entry['end']):
+            entry['end'] = end
+    
+    def host_timings(self) -> Dict[str, Dict[str, any]]:
+        """
+        Per-host timing keyed by HOST_IDEN: task count, total/slowest task time
+        and the wall-clock span between the first task start and the last task end.
+        """
+        timings = {}
+        for host_iden, entry in self._timings.items():
+            entry = dict(entry)
+            entry['task_seconds'] = round(entry['task_seconds'], 3)
+            entry['slowest_seconds'] = round(entry['slowest_seconds'], 3)
+            if entry['start'] and entry['end']:
+                span = datetime.fromisoformat(entry['end']) - datetime.fromisoformat(entry['start'])
+                entry['wall_seconds'] = round(span.total_seconds(), 3)
+            timings[host_iden] = entry
+        return timings
+
+class ConnectivityCache:
+    """
+    Persistent connectivity result cache keyed by HOST_IDEN.
+    
+    Only healthy hosts (reachable with privilege access) are cached, so a
+    host that was down is always probed again. Entries expire after ttl
+    seconds, or immediately when a scan against the host fails.
+    """
+    
+    CACHED_FIELDS = ('reachable', 'sudo_accessible', 'hostname', 'detected_os')
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = 300):
+        self.path = path or os.path.join(os.getcwd(), 'tmp', 'connectivity_cache.json')
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = {}
+        
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable connectivity cache {self.path}: {e}")
+    
+    def get(self, host_iden) -> Optional[Dict[str, any]]:
+        """Return the cached fields for a host, or None if missing or expired."""
+        key = str(host_iden)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry['checked_at'] > self.ttl:
+                del self._entries[key]
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            return {field: entry.get(field) for field in self.CACHED_FIELDS}
+    
+    def put(self, host_iden, result: Dict[str, any]) -> None:
+        """Cache a connectivity result if the host is healthy."""
+        if not (result.get('reachable') and result.get('sudo_accessible')):
+            self.invalidate(host_iden)
+            return
+        
+        entry = {field: result.get(field) for field in self.CACHED_FIELDS}
+        entry['checked_at'] = time.time()
+        with self._lock:
+            self._entries[str(host_iden)] = entry
+    
+    def store_results(self, connectivity_results: Dict[str, Dict[str, any]]) -> None:
+        """Cache every result of a check_ansible_connectivity-style dict."""
+        for host_iden, result in connectivity_results.items():
+            self.put(host_iden, result)
+    
+    def invalidate(self, host_iden) -> None:
+        """Expire a host early (e.g. after a failed scan)."""
+        with self._lock:
+            self._entries.pop(str(host_iden), None)
+    
+    def save(self) -> None:
+        """Persist the cache to disk."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+    
+    def stats(self) -> Dict[str, any]:
+        """Return hit/miss counters and the current number of entries."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'entries': len(self._entries)
+            }
+
+def check_ansible_connectivity_cached(host_list: List[Dict[str, str]], cache: ConnectivityCache,
+                                      **options) -> Dict[str, Dict[str, any]]:
+    """
+    Same as check_ansible_connectivity, but hosts with a fresh cache entry are
+    not probed again. Fresh probe results are written back to the cache.
+    
+    options are passed through to check_ansible_connectivity.
+    """
+    results = {}
+    to_probe = []
+    
+    for os_type, hosts in group_hosts_by_os(host_list).items():
+        for host in hosts:
+            cached = cache.get(host['HOST_IDEN'])
+            if cached is None:
+                to_probe.append(host)
+                continue
+            
+            result = create_connectivity_result(os_type, host)
+            result.update(cached)
+            result['ssh_accessible'] = result['reachable']
+            results[host['HOST_IDEN']] = result
+    
+    if to_probe:
+        probed = check_ansible_connectivity(to_probe, **options)
+        cache.store_results(probed)
+        cache.save()
+        results.update(probed)
+    
+    stats = cache.stats()
+    print(f"Connectivity cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
+    return results
+
+def get_run_mode(collect_only: bool = False) -> str:
+    """Checkpoint key of a run: 'collect' for snapshot collection, 'scan' otherwise."""
+    return 'collect' if collect_only else 'scan'
+
+def get_result_path(host_iden, os_type: Optional[str] = None, collect_only: bool = False) -> str:
+    """
+    Path of a host's result on the control node for its OS type and run mode.
+    
+    Scan results are tmp/{HOST_IDEN}.json, except for Windows, whose playbook
+    fetches into the working directory ({HOST_IDEN}.json). The evidence
+    archive of a scan is stored next to it as {HOST_IDEN}.evidence.tar.gz.
+    Collection-only runs write config snapshots to tmp/snapshots/{HOST_IDEN}.json.
+    """
+    if collect_only:
+        return os.path.join(os.getcwd(), 'tmp', 'snapshots', f"{host_iden}.json")
+    if os_type == 'Windows':
+        return os.path.join(os.getcwd(), f"{host_iden}.json")
+    return os.path.join(os.getcwd(), 'tmp', f"{host_iden}.json")
+
+class ScanCheckpoint:
+    """
+    Checkpoint of completed hosts for batch-mode scans.
+    
+    Completed hosts are kept per run mode (see get_run_mode), so scan and
+    collection-only batches can share one checkpoint file. A host counts as
+    done if it is recorded for the mode and its result file for that OS and
+    mode (see get_result_path) is younger than max_age seconds.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_age: float = 24 * 3600):
+        self.path = path or os.path.join(os.getcwd(), 'tmp', 'scan_checkpoint.json')
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._completed = {}
+        
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._completed = data.get('modes', {})
+                # Older checkpoints only recorded scans
+                if 'completed' in data:
+                    self._completed.setdefault('scan', data['completed'])
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable scan checkpoint {self.path}: {e}")
+    
+    def is_done(self, host_iden, os_type: Optional[str] = None, collect_only: bool = False) -> bool:
+        """Return True if the host completed in this mode and its result file is still fresh."""
+        with self._lock:
+            if str(host_iden) not in self._completed.get(get_run_mode(collect_only), {}):
+                return False
+        
+        result_path = get_result_path(host_iden, os_type, collect_only)
+        return (os.path.exists(result_path) and
+                time.time() - os.path.getmtime(result_path) <= self.max_age)
+    
+    def mark_done(self, host_idens, collect_only: bool = False) -> None:
+        """Record hosts as completed in the given mode."""
+        now = time.time()
+        with self._lock:
+            completed = self._completed.setdefault(get_run_mode(collect_only), {})
+            for host_iden in host_idens:
+                completed[str(host_iden)] = now
+    
+    def save(self) -> None:
+        """Persist the checkpoint to disk."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'modes': self._completed}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+def load_result_summary(host_iden, os_type: Optional[str] = None) -> Optional[Dict[str, any]]:
+    """
+    Read the existing result JSON of a host (located with get_result_path).
+    
+    Returns {'testedtime': datetime, 'vulnerable': [itemcode, ...]} or None
+    if there is no readable result. testedtime falls back to the file mtime.
+    """
+    result_path = get_result_path(host_iden, os_type)
+    if not os.path.exists(result_path):
+        return None
+    
+    try:
+        with open(result_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    try:
+        tested_time = datetime.strptime(data.get('testedtime', ''), "%Y-%m-%d %H:%M:%S")
+    except (TypeError, ValueError):
+        tested_time = datetime.fromtimestamp(os.path.getmtime(result_path))
+    
+    vulnerable = [
+        item.get('itemcode', 'N/A') for item in data.get('result', [])
+        if item.get('result') in (1, '취약')
+    ]
+    return {'testedtime': tested_time, 'vulnerable': vulnerable}
+
+def select_hosts_for_rescan(host_list: List[Dict[str, str]], older_than: Optional[float] = None,
+                            vulnerable_only: bool = False) -> List[Dict[str, str]]:
+    """
+    Select the hosts an incremental scan has to visit.
+    
+    Hosts without a readable result are always selected. Otherwise a host is
+    selected if its testedtime is older than older_than seconds (when given)
+    and, with vulnerable_only, only if the previous result had 취약 items.
+    """
+    selected = []
+    now = datetime.now()
+    
+    for host in host_list:
+        summary = load_result_summary(host['HOST_IDEN'], get_host_os_type(host))
+        if summary is None:
+            selected.append(host)
+            continue
+        
+        if older_than is not None and (now - summary['testedtime']).total_seconds() <= older_than:
+            continue
+        if vulnerable_only and not summary['vulnerable']:
+            continue
+        selected.append(host)
+    
+    print(f"Incremental scan: {len(selected)}/{len(host_list)} hosts selected for rescan")
+    return selected
+
+def save_host_timings(label: str, timings: Dict[str, Dict[str, any]]) -> str:
+    """Write per-host timing for one ansible_runner run to tmp/timing/{label}_{time}.json."""
+    timing_dir = os.path.join(os.getcwd(), 'tmp', 'timing')
+    os.makedirs(timing_dir, exist_ok=True)
+    timing_path = os.path.join(timing_dir, f"{label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(timing_path, 'w', encoding='utf-8') as f:
+        json.dump(timings, f, ensure_ascii=False, indent=2)
+    
+    print(f"  Host timing for {label} saved to {timing_path}")
+    return timing_path
+
 def create_unix_connectivity_playbook(group_name: str) -> list:
     """Create connectivity test playbook for Unix systems."""
     return [{
         'name': 'Test Unix connectivity',
         'hosts': group_name,
         'gather_facts': False,
-        'tasks': [
-            {
-                'name': 'Test connection',
-                'ping': {},
-                'register': 'ping_result'
-            },
-            {
-                'name': 'Test sudo access',
-                'command': 'whoami',
-                'become': True,
-                'register': 'sudo_result'
-            },
-            {
-                'name': 'Gather basic system info',
-                'setup': {
-                    'filter': ['ansible_hostname', 'ansible_distribution', 'ansible_default_ipv4']
-                },
-                'register': 'system_info'
-            }
-        ]
+        'tasks': create_unix_connectivity_tasks()
     }]
 
+def create_unix_connectivity_tasks() -> list:
+    """Connectivity probe tasks for Unix systems (ping, sudo, basic facts)."""
+    return [
+        {
+            'name': 'Test connection',
+            'ping': {},
+            'become': False,
+            'register': 'ping_result'
+        },
+        {
+            'name': 'Test sudo access',
+            'command': 'whoami',
+            'become': True,
+            'register': 'sudo_result'
+        },
+        {
+            'name': 'Gather basic system info',
+            'setup': {
+                'filter': ['ansible_hostname', 'ansible_distribution', 'ansible_default_ipv4']
+            },
+            'register': 'system_info'
+        }
+    ]
+
 def create_windows_connectivity_playbook(group_name: str) -> list:
     """Create connectivity test playbook for Windows systems."""
     return [{
         'name': 'Test Windows connectivity',
         'hosts': group_name,
         'gather_facts': False,
-        'tasks': [
-            {
-                'name': 'Test connection',
-                'win_ping': {},
-                'register': 'ping_result'
-            },
-            {
-                'name': 'Test admin access',
-                'win_whoami': {},
-                'register': 'whoami_result'
-            },
-            {
-                'name': 'Gather basic system info',
-                'setup': {
-                    'filter': ['ansible_hostname', 'ansible_os_family', 'ansible_ip_addresses']
-                },
-                'register': 'system_info'
-            }
-        ]
+        'tasks': create_windows_connectivity_tasks()
     }]
 
+def create_windows_connectivity_tasks() -> list:
+    """Connectivity probe tasks for Windows systems (ping, admin access, basic facts)."""
+    return [
+        {
+            'name': 'Test connection',
+            'win_ping': {},
+            'register': 'ping_result'
+        },
+        {
+            'name': 'Test admin access',
+            'win_whoami': {},
+            'register': 'whoami_result'
+        },
+        {
+            'name': 'Gather basic system info',
+            'setup': {
+                'filter': ['ansible_hostname', 'ansible_os_family', 'ansible_ip_addresses']
+            },
+            'register': 'system_info'
+        }
+    ]
+
+def add_connectivity_probe(playbook: list, os_type: str) -> list:
+    """
+    Prepend the connectivity probe tasks to the first play of a scan playbook.
+    
+    Hosts failing the ping or privilege check are dropped from the play by
+    Ansible, and the probe's own fact task replaces the full gather_facts step.
+    """
+    if os_type == 'Windows':
+        probe_tasks = create_windows_connectivity_tasks()
+    else:
+        probe_tasks = create_unix_connectivity_tasks()
+    
+    play = playbook[0]
+    play['gather_facts'] = False
+    play['tasks'] = probe_tasks + play.get('tasks', [])
+    return playbook
+
 def print_connectivity_report(connectivity_results: Dict[str, Dict[str, any]]) -> None:
     """Print a formatted connectivity report with OS information."""
     print("\n" + "="*70)
@@ -621,7 +1672,9 @@ def print_connectivity_report(connectivity_results: Dict[str, Dict[str, any]]) -
                 total_reachable += 1
                 print("  ✓ Connection: SUCCESS")
                 
-                if result['sudo_accessible']:
+                if result['sudo_accessible'] is None:
+                    print("  ? Privilege Access: NOT TESTED")
+                elif result['sudo_accessible']:
                     print("  ✓ Privilege Access: SUCCESS")
                 else:
                     print("  ✗ Privilege Access: FAILED")
@@ -640,7 +1693,10 @@ def print_connectivity_report(connectivity_results: Dict[str, Dict[str, any]]) -
                         
             else:
                 print("  ✗ Connection: FAILED")
-                print("  ✗ Privilege Access: N/A")
+                if result['sudo_accessible'] is None:
+                    print("  ? Privilege Access: NOT TESTED")
+                else:
+                    print("  ✗ Privilege Access: N/A")
                 if result['error']:
                     print(f"  Error: {result['error']}")
     
@@ -660,15 +1716,29 @@ def print_connectivity_report(connectivity_results: Dict[str, Dict[str, any]]) -
     
     print("="*70)
 
-def get_manageable_hosts(host_list: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    """Filter host list to return only hosts that are manageable by Ansible."""
-    connectivity_results = check_ansible_connectivity(host_list)
-    manageable_hosts = []
+def get_manageable_hosts(host_list: List[Dict[str, str]],
+                         connectivity_results: Optional[Dict[str, Dict[str, any]]] = None,
+                         cache: Optional[ConnectivityCache] = None) -> List[Dict[str, str]]:
+    """
+    Filter host list to return only hosts that are manageable by Ansible.
     
+    Pass connectivity_results from an earlier check_ansible_connectivity call
+    to reuse it instead of probing every host again, or a ConnectivityCache
+    to skip probing hosts that were recently found healthy.
+
+    Hosts missing from connectivity_results (e.g. dropped by a TCP pre-probe
+    or never reached in a single-pass run) are treated as unreachable.
+    """
+    if connectivity_results is None:
+        if cache is not None:
+            connectivity_results = check_ansible_connectivity_cached(host_list, cache)
+        else:
+            connectivity_results = check_ansible_connectivity(host_list)
+    manageable_hosts = []
+
     for host in host_list:
-        host_iden = host['HOST_IDEN']
-        if (connectivity_results[host_iden]['reachable'] and 
-            connectivity_results[host_iden]['sudo_accessible']):
+        result = connectivity_results.get(host['HOST_IDEN'], {})
+        if result.get('reachable') and result.get('sudo_accessible'):
             manageable_hosts.append(host)
     
     return manageable_hosts
@@ -683,6 +1753,12 @@ def create_sample_scripts():
 HOST_IP=$(hostname -I | awk '{print $1}')
 JSON_FILE="/tmp/Ubuntu_${HOST_IP}.json"
 
+# --stdout: print the JSON between markers instead of writing it (streamlined playbook)
+if [ "$1" = "--stdout" ]; then
+    JSON_FILE=/dev/stdout
+    echo "@@CCE_JSON_BEGIN@@"
+fi
+
 # Collect system information
 cat > "$JSON_FILE" << EOF
 {
@@ -699,8 +1775,9 @@ cat > "$JSON_FILE" << EOF
     "load_average": "$(uptime | awk -F'load average:' '{print $2}')"
 }
 EOF
+[ "$JSON_FILE" = /dev/stdout ] && echo "@@CCE_JSON_END@@"
 
-echo "Ubuntu system information collected in $JSON_FILE"
+echo "Ubuntu system information collected in $JSON_FILE" >&2
 '''
     
     # CentOS script
@@ -710,6 +1787,12 @@ echo "Ubuntu system information collected in $JSON_FILE"
 HOST_IP=$(hostname -I | awk '{print $1}')
 JSON_FILE="/tmp/CentOS_${HOST_IP}.json"
 
+# --stdout: print the JSON between markers instead of writing it (streamlined playbook)
+if [ "$1" = "--stdout" ]; then
+    JSON_FILE=/dev/stdout
+    echo "@@CCE_JSON_BEGIN@@"
+fi
+
 # Collect system information
 cat > "$JSON_FILE" << EOF
 {
@@ -726,8 +1809,9 @@ cat > "$JSON_FILE" << EOF
     "load_average": "$(uptime | awk -F'load average:' '{print $2}')"
 }
 EOF
+[ "$JSON_FILE" = /dev/stdout ] && echo "@@CCE_JSON_END@@"
 
-echo "CentOS system information collected in $JSON_FILE"
+echo "CentOS system information collected in $JSON_FILE" >&2
 '''
     
     # Windows script
@@ -763,10 +1847,10 @@ exit 0
     
     # Write scripts to current directory
     scripts = {
-        'script/Ubuntu/Ubuntu_cce.sh': ubuntu_script,
-        'script/CentOS/CentOS_cce.sh': centos_script,
-        'script/Windows/Windows_cce.bat': windows_script,
-        'script/else/else_cce.sh': else_script
+        'Script/Ubuntu/Ubuntu_cce.sh': ubuntu_script,
+        'Script/CentOS/CentOS_cce.sh': centos_script,
+        'Script/Windows/Windows_cce.bat': windows_script,
+        'Script/else/else_cce.sh': else_script
     }
     
     for script_path, script_content in scripts.items():
@@ -810,7 +1894,8 @@ if __name__ == "__main__":
             'HOST_USER': 'centos',
             'HOST_PORT': '2021',
             'HOST_SUPW': '20250630!',
-            'HOST_OS': 'CentOS 8.5'
+            'HOST_OS': 'CentOS 8.5',
+            'HOST_IMPORTANCE': '상'  # production host: scanned in low-impact mode
         },
         {
             'HOST_IDEN': 3,
@@ -830,17 +1915,17 @@ if __name__ == "__main__":
         }
     ]
     
-    # First, check connectivity to all hosts
-    print("\nChecking Ansible connectivity...")
-    connectivity_results = check_ansible_connectivity(hosts)
+    # Probe and scan in a single pass; unreachable hosts are dropped inline
+    print("\nChecking Ansible connectivity and scanning hosts...")
+    success, connectivity_results = run_single_pass_scan(hosts, concurrent=True,
+                                                         connection_profile='performance',
+                                                         streamlined=True)
     print_connectivity_report(connectivity_results)
     
-    # Get only manageable hosts
-    manageable_hosts = get_manageable_hosts(hosts)
+    manageable_hosts = get_manageable_hosts(hosts, connectivity_results)
     
     if manageable_hosts:
-        print(f"\nProceeding with {len(manageable_hosts)} manageable hosts...")
-        success = run_ansible_playbook_on_hosts(manageable_hosts)
+        print(f"\nScanned {len(manageable_hosts)} manageable hosts.")
         
         if success:
             print("\nJSON files should now be in your tmp directory!")
@@ -0,0 +1,513 @@
+import os
+import re
+import sys
+import json
+import yaml
+import glob
+import hashlib
+import fnmatch
+from datetime import datetime
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Dict, Optional, Tuple
+
+# Declarative check registry: rules live in Script/rules/*.yaml (see the header
+# of Script/rules/linux.yaml for the rule format). Every regex is compiled once
+# per registry and evaluated against a host's config snapshot, a mapping of
+# source name (absolute file path, or cmd:<name> for command output) to text.
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Script', 'rules', 'linux.yaml')
+
+IMPORTANCE_CODES = {'상': 3, '중': 2, '하': 1}
+RESULT_CODES = {'양호': 0, '취약': 1}
+
+COMPARE_OPS = {
+    'eq': lambda value, expected: value == expected,
+    'ne': lambda value, expected: value != expected,
+    'lt': lambda value, expected: value < expected,
+    'le': lambda value, expected: value <= expected,
+    'gt': lambda value, expected: value > expected,
+    'ge': lambda value, expected: value >= expected,
+    'in': lambda value, expected: value in expected,
+    'between': lambda value, expected: expected[0] <= value <= expected[1],
+}
+
+def _as_list(value) -> list:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+def compile_rule(rule: Dict[str, any]) -> Dict[str, any]:
+    """Precompile one rule: regex flags, source patterns and the comparison."""
+    for combine in ('all', 'any'):
+        if combine in rule:
+            # Nested group: combines its own rules like a check does
+            return {'group': combine, 'rules': [compile_rule(r) for r in rule[combine]]}
+
+    ignorecase = bool(rule.get('ignorecase', False))
+    expect = rule.get('expect', 'present')
+
+    if isinstance(expect, dict):
+        if len(expect) != 1 or next(iter(expect)) not in COMPARE_OPS:
+            raise ValueError(f"Invalid expect {expect!r} in rule for {rule.get('file')}")
+        op, expected = next(iter(expect.items()))
+    elif expect in ('present', 'absent'):
+        op, expected = expect, None
+    else:
+        raise ValueError(f"Invalid expect {expect!r} in rule for {rule.get('file')}")
+
+    count = rule.get('count')
+    if count not in (None, 'distinct'):
+        raise ValueError(f"Invalid count {count!r} in rule for {rule.get('file')}")
+    if op not in ('present', 'absent') and (count or op not in ('eq', 'ne', 'in')):
+        # Numeric comparisons (match counts are always numeric)
+        expected = [float(v) for v in expected] if isinstance(expected, list) else float(expected)
+    elif ignorecase and expected is not None:
+        expected = [str(v).lower() for v in expected] if isinstance(expected, list) else str(expected).lower()
+
+    pick = rule.get('pick', 'last')
+    if pick not in ('first', 'last', 'only'):
+        raise ValueError(f"Invalid pick {pick!r} in rule for {rule.get('file')}")
+
+    files = _as_list(rule['file'])
+    missing = rule.get('missing', '취약')
+    return {
+        'files': files,
+        'globs': [f for f in files if any(c in f for c in '*?[')],
+        'regex': re.compile(rule['regex'], re.MULTILINE | (re.IGNORECASE if ignorecase else 0)),
+        'op': op,
+        'expected': expected,
+        'ignorecase': ignorecase,
+        'pick': pick,
+        'count': count,
+        'comments': bool(rule.get('comments', False)),
+        'missing': missing,
+        'nofile': rule.get('nofile', '양호' if op == 'absent' else missing),
+    }
+
+def compile_check(check: Dict[str, any]) -> Dict[str, any]:
+    """Precompile a check definition and all of its rules."""
+    combine = check.get('combine', 'all')
+    if combine not in ('all', 'any'):
+        raise ValueError(f"Invalid combine {combine!r} for {check.get('code')}")
+
+    return {
+        'code': check['code'],
+        'category': check.get('category', ''),
+        'title': check.get('title', ''),
+        'importance': check.get('importance', '하'),
+        'combine': combine,
+        'rules': [compile_rule(rule) for rule in check.get('rules', [])],
+        'details': {
+            '양호': check.get('good', ''),
+            '취약': check.get('bad', ''),
+            'other': check.get('other', '수동 점검이 필요한 항목입니다.'),
+        },
+    }
+
+def _leaf_rules(rules: List[Dict[str, any]]):
+    """Yield the file rules of a rule list, descending into nested groups."""
+    for rule in rules:
+        if 'group' in rule:
+            yield from _leaf_rules(rule['rules'])
+        else:
+            yield rule
+
+def _strip_comments(text: str) -> str:
+    return '\n'.join(line for line in text.split('\n') if not line.lstrip().startswith('#'))
+
+def _matched_line(text: str, match) -> str:
+    start = text.rfind('\n', 0, match.start()) + 1
+    end = text.find('\n', match.end())
+    return text[start:] if end == -1 else text[start:end]
+
+def _combine_statuses(statuses: List[str], combine: str) -> str:
+    if combine == 'any' and '양호' in statuses:
+        return '양호'
+    if '취약' in statuses:
+        return '취약'
+    others = [s for s in statuses if s != '양호']
+    return others[0] if others else '양호'
+
+class CheckRegistry:
+    """
+    Compiled check registry loaded from a rules YAML file.
+
+    Regexes are compiled once when the registry is built; evaluate() only runs
+    them against the snapshot text, so the same registry can score any number
+    of host snapshots.
+    """
+
+    def __init__(self, path: str = DEFAULT_RULES_PATH):
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            definition = yaml.safe_load(f) or {}
+        self.checks = [compile_check(check) for check in definition.get('checks', [])]
+        # Verdicts keyed by (itemcode, (source, sha256) of every input), shared by all hosts
+        self._verdicts = {}
+
+    def codes(self) -> List[str]:
+        """Item codes covered by the registry, in registry order."""
+        return [check['code'] for check in self.checks]
+
+    def sources(self) -> List[str]:
+        """File patterns and cmd:<name> sources a host snapshot must contain."""
+        sources = []
+        for check in self.checks:
+            for rule in _leaf_rules(check['rules']):
+                sources.extend(f for f in rule['files'] if f not in sources)
+        return sources
+
+    def _resolve_sources(self, rule: Dict[str, any], snapshot: Dict[str, str]) -> List[str]:
+        sources = []
+        for pattern in rule['files']:
+            if pattern in rule['globs']:
+                sources.extend(sorted(fnmatch.filter(snapshot.keys(), pattern)))
+            elif pattern in snapshot:
+                sources.append(pattern)
+        return sources
+
+    def evaluate_rule(self, rule: Dict[str, any], snapshot: Dict[str, str],
+                      text_cache: Dict[Tuple[str, bool], str]) -> Tuple[str, List[str]]:
+        """Evaluate one compiled rule or rule group. Returns (status, evidence lines)."""
+        if 'group' in rule:
+            statuses, evidence = [], []
+            for member in rule['rules']:
+                status, lines = self.evaluate_rule(member, snapshot, text_cache)
+                statuses.append(status)
+                evidence.extend(lines)
+            return _combine_statuses(statuses, rule['group']), evidence
+
+        sources = self._resolve_sources(rule, snapshot)
+        if not sources:
+            return rule['nofile'], [f"{', '.join(rule['files'])}: 파일 없음"]
+
+        matches = []
+        for source in sources:
+            key = (source, rule['comments'])
+            if key not in text_cache:
+                text = snapshot[source]
+                text_cache[key] = text if rule['comments'] else _strip_comments(text)
+            text = text_cache[key]
+            matches.extend((source, text, m) for m in rule['regex'].finditer(text))
+
+        evidence = [f"{source}: {_matched_line(text, m).strip()}" for source, text, m in matches]
+        if not evidence:
+            evidence = [f"{', '.join(sources)}: 설정 없음"]
+
+        if rule['op'] == 'present':
+            return ('양호' if matches else '취약'), evidence
+        if rule['op'] == 'absent':
+            return ('취약' if matches else '양호'), evidence
+        if rule['count'] == 'distinct':
+            value = len({m.group(1) if m.groups() else m.group(0) for _, _, m in matches})
+            return ('양호' if COMPARE_OPS[rule['op']](value, rule['expected']) else '취약'), evidence
+        if not matches:
+            return rule['missing'], evidence
+        if rule['pick'] == 'only' and len(matches) > 1:
+            # Several candidate values: the shell checks cannot compare them either
+            return '취약', evidence
+
+        _, _, match = matches[0] if rule['pick'] == 'first' else matches[-1]
+        value = match.group(1) if match.groups() else match.group(0)
+        try:
+            if rule['op'] in ('eq', 'ne', 'in'):
+                value = value.lower() if rule['ignorecase'] else value
+            else:
+                value = float(value)
+            passed = COMPARE_OPS[rule['op']](value, rule['expected'])
+        except (TypeError, ValueError):
+            passed = False
+        return ('양호' if passed else '취약'), evidence
+
+    def evaluate_check(self, check: Dict[str, any], snapshot: Dict[str, str],
+                       text_cache: Optional[Dict[Tuple[str, bool], str]] = None) -> Dict[str, any]:
+        """Evaluate one compiled check and build its result item (dashboard schema)."""
+        if text_cache is None:
+            text_cache = {}
+
+        statuses, evidence = [], []
+        for rule in check['rules']:
+            status, lines = self.evaluate_rule(rule, snapshot, text_cache)
+            statuses.append(status)
+            evidence.extend(lines)
+
+        status = _combine_statuses(statuses, check['combine'])
+        evidence_text = '\n'.join(evidence)
+        return {
+            'itemcode': check['code'],
+            'title': check['title'],
+            'importance': IMPORTANCE_CODES.get(check['importance'], 1),
+            'result': RESULT_CODES.get(status, 2),
+            'resultdetail': check['details'].get(status, check['details']['other']),
+            'category': check['category'],
+            'status': status,
+            'evidence': evidence_text,
+            'evidencebytes': len(evidence_text.encode('utf-8')),
+        }
+
+    def evaluate(self, snapshot: Dict[str, str]) -> List[Dict[str, any]]:
+        """Evaluate every check against a host snapshot."""
+        # Comment-stripped source text is shared by all rules of this snapshot
+        text_cache = {}
+        return [self.evaluate_check(check, snapshot, text_cache) for check in self.checks]
+
+    def evaluate_hashed(self, hashes: Dict[str, str], read_blob: Callable[[str], Optional[str]]) -> List[Dict[str, any]]:
+        """
+        Evaluate every check against a content-addressed snapshot (source -> sha256).
+
+        A check's verdict depends only on the contents of its input sources, so it
+        is memoised by their hashes: hosts sharing the same config files reuse the
+        verdict and their blobs are read (via read_blob) only on the first miss.
+        """
+        items = []
+        for check in self.checks:
+            sources = sorted({source for rule in _leaf_rules(check['rules'])
+                              for source in self._resolve_sources(rule, hashes)})
+            key = (check['code'], tuple((source, hashes[source]) for source in sources))
+            item = self._verdicts.get(key)
+            if item is None:
+                snapshot = {}
+                for source in sources:
+                    text = read_blob(hashes[source])
+                    if text is not None:
+                        snapshot[source] = text
+                item = self._verdicts[key] = self.evaluate_check(check, snapshot)
+            items.append(dict(item))
+        return items
+
+@lru_cache(maxsize=None)
+def _load_registry(path: str, mtime: float) -> CheckRegistry:
+    return CheckRegistry(path)
+
+def get_registry(path: str = DEFAULT_RULES_PATH) -> CheckRegistry:
+    """Return the compiled registry for path, recompiling only when the file changes."""
+    path = os.path.abspath(path)
+    return _load_registry(path, os.path.getmtime(path))
+
+def load_snapshot_dir(root: str) -> Dict[str, str]:
+    """
+    Load a snapshot directory tree (e.g. linux.sh's CCE_SNAPSHOT, a copy of the
+    host files under their original paths) into a source -> text mapping.
+    """
+    snapshot = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            source = '/' + os.path.relpath(path, root).replace(os.sep, '/')
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    snapshot[source] = f.read()
+            except OSError:
+                continue
+    return snapshot
+
+def get_blob_dir(snapshot_dir: str) -> str:
+    """Directory holding snapshot contents by sha256, shared by all hosts."""
+    return os.path.join(snapshot_dir, 'blobs')
+
+@lru_cache(maxsize=4096)
+def read_blob(blob_dir: str, sha: str) -> Optional[str]:
+    """Read one stored content by its sha256 (None if it was never collected)."""
+    try:
+        with open(os.path.join(blob_dir, sha), 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def known_blob_prefixes(blob_dir: str) -> List[str]:
+    """sha256 prefixes (16 hex digits) of stored contents, passed to Script/collect.sh --known."""
+    if not os.path.isdir(blob_dir):
+        return []
+    return sorted({name[:16] for name in os.listdir(blob_dir) if len(name) == 64})
+
+def ingest_snapshot(path: str, blob_dir: str) -> str:
+    """
+    Move the inline contents of a collected snapshot into the blob store.
+
+    Each distinct content is stored once under its sha256, and the snapshot
+    file is rewritten as a manifest (sources -> sha256) without 'blobs'.
+    Contents whose bytes do not match their sha256 (e.g. files that are not
+    UTF-8 text) are not stored, so a blob is always its address.
+    Returns a signature of the manifest; hosts with identical configs share it.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    blobs = data.pop('blobs', None)
+    if blobs:
+        os.makedirs(blob_dir, exist_ok=True)
+        for sha, text in blobs.items():
+            blob_path = os.path.join(blob_dir, sha)
+            if not os.path.exists(blob_path):
+                content = text.encode('utf-8', errors='replace')
+                if hashlib.sha256(content).hexdigest() != sha:
+                    print(f"Skipping blob {sha[:16]} from {os.path.basename(path)}: content does not match its sha256")
+                    continue
+                tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, blob_path)
+    if blobs is not None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    manifest = json.dumps(sorted(data.get('sources', {}).items()))
+    return hashlib.sha256(manifest.encode('utf-8')).hexdigest()
+
+def load_snapshot_file(path: str) -> Tuple[Dict[str, any], Dict[str, str]]:
+    """
+    Load a collected snapshot manifest (Script/collect.sh output after ingest_snapshot).
+
+    Returns (host info, source -> sha256).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    host = {key: data.get(key, '') for key in ('targetip', 'osinfo', 'collectedtime')}
+    return host, data.get('sources', {})
+
+def merge_result_items(document: Dict[str, any], items: List[Dict[str, any]],
+                       keep_host_verdicts: bool = False) -> Dict[str, any]:
+    """
+    Merge re-evaluated items into document, keeping item order.
+
+    The registry verdict replaces every item whose itemcode it covers, so
+    changes to the central rules reach results the host scored itself;
+    items the registry does not cover are kept and new ones are appended.
+    With keep_host_verdicts, items the host scored are kept as well and only
+    those produced by an earlier re-evaluation (marked 'rescored') are
+    replaced.
+    """
+    by_code = {item['itemcode']: item for item in items}
+    merged = []
+    for item in document.get('result', []):
+        code = item.get('itemcode')
+        if item.get('rescored') or not keep_host_verdicts:
+            merged.append(by_code.pop(code, item))
+        else:
+            by_code.pop(code, None)
+            merged.append(item)
+    merged.extend(item for item in items if item['itemcode'] in by_code)
+    document['result'] = merged
+    return document
+
+def rescore_snapshot(snapshot_path: str, result_dir: str, rules_path: str = DEFAULT_RULES_PATH,
+                     blob_dir: Optional[str] = None, keep_host_verdicts: bool = False) -> str:
+    """
+    Evaluate one host snapshot and write {result_dir}/{name}.json.
+
+    In an existing result (e.g. from a full on-host scan) the registry
+    verdicts replace the items the registry covers, and other items are kept;
+    keep_host_verdicts keeps the host's own verdicts too (see
+    merge_result_items).
+    """
+    registry = get_registry(rules_path)
+    blob_dir = blob_dir or get_blob_dir(os.path.dirname(snapshot_path))
+    host, hashes = load_snapshot_file(snapshot_path)
+    items = registry.evaluate_hashed(hashes, partial(read_blob, blob_dir))
+    for item in items:
+        item['rescored'] = True
+
+    result_path = os.path.join(result_dir, os.path.basename(snapshot_path))
+    document = None
+    if os.path.exists(result_path):
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            document = None
+
+    if document is None:
+        document = build_result_document(items, host['targetip'], host['osinfo'], host['collectedtime'])
+    else:
+        merge_result_items(document, items, keep_host_verdicts)
+        # The on-host scan time stays while any of its verdicts are kept
+        if all(item.get('rescored') for item in document['result']):
+            document['testedtime'] = host['collectedtime'] or document.get('testedtime')
+
+    tmp_path = f"{result_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False)
+    os.replace(tmp_path, result_path)
+    return result_path
+
+def rescore_snapshots(snapshot_dir: Optional[str] = None, result_dir: Optional[str] = None,
+                      rules_path: str = DEFAULT_RULES_PATH, workers: Optional[int] = None,
+                      keep_host_verdicts: bool = False) -> int:
+    """
+    Re-evaluate every collected snapshot on the control node across CPU cores.
+
+    Snapshots are read from tmp/snapshots/{HOST_IDEN}.json (see
+    ansible_script.run_ansible_playbook_on_hosts(collect_only=True)) and
+    results are written to tmp/{HOST_IDEN}.json. Inline contents are first
+    moved to the shared blob store, and hosts are ordered by config signature
+    so identical configs land on the same worker, where the verdict is
+    computed once and reused (see CheckRegistry.evaluate_hashed).
+    keep_host_verdicts is passed to rescore_snapshot.
+
+    Returns:
+        int: Number of hosts re-evaluated
+    """
+    snapshot_dir = snapshot_dir or os.path.join(os.getcwd(), 'tmp', 'snapshots')
+    result_dir = result_dir or os.path.join(os.getcwd(), 'tmp')
+    snapshot_paths = glob.glob(os.path.join(snapshot_dir, '*.json'))
+    if not snapshot_paths:
+        print(f"No snapshots found in {snapshot_dir}")
+        return 0
+
+    os.makedirs(result_dir, exist_ok=True)
+    rules_path = os.path.abspath(rules_path)
+    blob_dir = get_blob_dir(snapshot_dir)
+    # Fail fast on an invalid rules file before starting workers
+    get_registry(rules_path)
+
+    start = datetime.now()
+    signatures = {path: ingest_snapshot(path, blob_dir) for path in snapshot_paths}
+    snapshot_paths.sort(key=lambda path: (signatures[path], path))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(snapshot_paths) == 1:
+        for path in snapshot_paths:
+            rescore_snapshot(path, result_dir, rules_path, blob_dir, keep_host_verdicts)
+    else:
+        count = len(snapshot_paths)
+        chunksize = max(1, count // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(rescore_snapshot, snapshot_paths, [result_dir] * count,
+                              [rules_path] * count, [blob_dir] * count, [keep_host_verdicts] * count,
+                              chunksize=chunksize))
+
+    elapsed = (datetime.now() - start).total_seconds()
+    print(f"Re-evaluated {len(snapshot_paths)} host snapshots ({len(set(signatures.values()))} distinct configs) "
+          f"in {elapsed:.2f}s ({workers} workers)")
+    return len(snapshot_paths)
+
+def build_result_document(items: List[Dict[str, any]], targetip: str = '', osinfo: str = '',
+                          testedtime: Optional[str] = None) -> Dict[str, any]:
+    """Wrap result items into the dashboard JSON document."""
+    return {
+        'targetip': targetip,
+        'testedtime': testedtime or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'osinfo': osinfo,
+        'result': items,
+    }
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(f"usage: {sys.argv[0]} SNAPSHOT_DIR [RULES_YAML]   evaluate one snapshot directory tree")
+        print(f"       {sys.argv[0]} --rescore [--keep-host-verdicts] [RULES_YAML]")
+        print("           re-evaluate tmp/snapshots/*.json into tmp/ (--keep-host-verdicts: keep on-host verdicts)")
+        sys.exit(1)
+
+    if sys.argv[1] == '--rescore':
+        args = sys.argv[2:]
+        keep_host_verdicts = '--keep-host-verdicts' in args
+        args = [arg for arg in args if arg != '--keep-host-verdicts']
+        rescore_snapshots(rules_path=args[0] if args else DEFAULT_RULES_PATH,
+                          keep_host_verdicts=keep_host_verdicts)
+    else:
+        registry = get_registry(sys.argv[2] if len(sys.argv) > 2 else DEFAULT_RULES_PATH)
+        items = registry.evaluate(load_snapshot_dir(sys.argv[1]))
+        print(json.dumps(build_result_document(items), ensure_ascii=False, indent=2))
@@ -0,0 +1,35 @@
+"""
+Record the macro-expanded report templates used by test_matches_macro_golden.
+
+Needs Excel and xlwings. Copies the template once per system count, runs
+Module1.C_P / Module2.C_P2 on the copy (as build_report does with
+CCE_REPORT_MACRO=1) and stores it as tests/golden/macro_<n>_systems.xlsm.
+
+    python tests/golden/record_macro.py [template.xlsm]
+"""
+import os
+import shutil
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from Parsing.parsingMain import TEMPLATE_FILE
+from Parsing.runMecro import run_macro
+
+GOLDEN_DIR = os.path.dirname(os.path.abspath(__file__))
+SYSTEM_COUNTS = (1, 3)
+
+
+def main():
+    template = sys.argv[1] if len(sys.argv) > 1 else TEMPLATE_FILE
+    for systems in SYSTEM_COUNTS:
+        target = os.path.join(GOLDEN_DIR, f'macro_{systems}_systems.xlsm')
+        shutil.copyfile(template, target)
+        # 매크로 인자는 추가 시스템 수 (build_report 와 동일하게 시스템 수 - 1)
+        run_macro(os.path.abspath(target), systems - 1)
+        print(f"기록 완료: {target}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Connectivity bookkeeping of ansible_script.run_os_group_playbook.
+
+ansible_runner is replaced by a fake that replays events through the
+tracker, so no host is contacted.
+"""
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HOSTS = [
+    {'HOST_IDEN': f'host{i}', 'HOST_ADDR': f'10.0.0.{i}', 'HOST_USER': 'cce', 'HOST_PORT': '22',
+     'HOST_SUPW': 'pw', 'HOST_OS': 'CentOS 8', 'HOST_OS_TYPE': 'CentOS', 'HOST_OS_FULL': 'CentOS 8'}
+    for i in range(1, 4)
+]
+
+
+@pytest.fixture
+def ansible_script(monkeypatch):
+    # ansible_runner 는 테스트에서만 가짜 모듈로 대체 (host2 의 점검 작업만 실패)
+    def run(event_handler, **kwargs):
+        for i, host in enumerate(HOSTS):
+            name = f'centos_host_{i}'
+            if host['HOST_IDEN'] == 'host2':
+                event_handler({'event': 'runner_on_failed',
+                               'event_data': {'host': name, 'task': 'Run scan', 'res': {'msg': 'scan failed'}}})
+            else:
+                event_handler({'event': 'runner_on_ok',
+                               'event_data': {'host': name, 'task': 'Fetch result',
+                                              'res': {'ansible_facts': {module.RESULT_FACT: {}}}}})
+        return types.SimpleNamespace(status='failed')
+
+    monkeypatch.setitem(sys.modules, 'ansible_runner', types.SimpleNamespace(run=run))
+    monkeypatch.delitem(sys.modules, 'ansible_script', raising=False)
+    monkeypatch.chdir(ROOT)
+    import ansible_script as module
+    return module
+
+
+def test_scan_without_probe_keeps_connectivity(ansible_script):
+    connectivity_results = {}
+    for host in HOSTS:
+        result = ansible_script.create_connectivity_result('CentOS', host)
+        result.update(reachable=True, ssh_accessible=True, sudo_accessible=True)
+        connectivity_results[host['HOST_IDEN']] = result
+
+    completed = set()
+    ansible_script.run_os_group_playbook('CentOS', HOSTS, quiet=True, probe=False,
+                                         connectivity_results=connectivity_results,
+                                         completed_hosts=completed)
+
+    assert completed == {'host1', 'host3'}
+    assert connectivity_results['host2']['error'] == 'scan failed'
+    manageable = ansible_script.get_manageable_hosts(HOSTS, connectivity_results)
+    assert [host['HOST_IDEN'] for host in manageable] == ['host1', 'host3']
@@ -0,0 +1,38 @@
+from check_engine import merge_result_items
+
+
+def make_document():
+    return {'result': [
+        {'itemcode': 'U-01', 'status': '취약', 'result': 1},
+        {'itemcode': 'U-02', 'status': '양호', 'result': 0, 'rescored': True},
+        {'itemcode': 'U-10', 'status': '양호', 'result': 0},
+    ]}
+
+
+ITEMS = [
+    {'itemcode': 'U-01', 'status': '양호', 'result': 0, 'rescored': True},
+    {'itemcode': 'U-02', 'status': '취약', 'result': 1, 'rescored': True},
+    {'itemcode': 'U-03', 'status': '양호', 'result': 0, 'rescored': True},
+]
+
+
+def test_merge_registry_overrides_covered_items():
+    document = merge_result_items(make_document(), ITEMS)
+
+    assert [(item['itemcode'], item['status']) for item in document['result']] == [
+        ('U-01', '양호'),  # scored by the host, covered by the registry: replaced
+        ('U-02', '취약'),  # earlier re-evaluation: replaced
+        ('U-10', '양호'),  # not covered by the registry: kept
+        ('U-03', '양호'),  # not scored yet: appended
+    ]
+
+
+def test_merge_keeps_host_verdicts_on_request():
+    document = merge_result_items(make_document(), ITEMS, keep_host_verdicts=True)
+
+    assert [(item['itemcode'], item['status']) for item in document['result']] == [
+        ('U-01', '취약'),  # scored by the host: kept
+        ('U-02', '취약'),  # earlier re-evaluation: replaced
+        ('U-10', '양호'),
+        ('U-03', '양호'),
+    ]
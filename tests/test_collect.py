@@ -0,0 +1,36 @@
+"""Blobs collected by Script/collect.sh must hash to the sha256 they are stored under."""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from check_engine import ingest_snapshot
+
+COLLECTOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Script', 'collect.sh')
+
+pytestmark = pytest.mark.skipif(shutil.which('bash') is None or shutil.which('sha256sum') is None,
+                                reason='bash and sha256sum are required')
+
+
+def test_stored_blob_rehashes_to_its_sha(tmp_path):
+    config = tmp_path / 'sshd_config'
+    # 끝의 줄바꿈, CRLF, 탭, 제어 문자, 한글이 모두 그대로 보관되어야 함
+    original = 'PermitRootLogin no\r\n# 설정\tX11Forwarding\x01 yes\n\n\n'.encode('utf-8')
+    config.write_bytes(original)
+
+    out = subprocess.run(['bash', COLLECTOR, str(config)], capture_output=True, text=True, check=True).stdout
+    body = out.split('@@CCE_JSON_BEGIN@@\n', 1)[1].split('@@CCE_JSON_END@@', 1)[0]
+    snapshot = tmp_path / 'host.json'
+    snapshot.write_text(body, encoding='utf-8')
+
+    blob_dir = tmp_path / 'blobs'
+    ingest_snapshot(str(snapshot), str(blob_dir))
+
+    sha = json.loads(snapshot.read_text(encoding='utf-8'))['sources'][str(config)]
+    assert sha == hashlib.sha256(original).hexdigest()
+    stored = (blob_dir / sha).read_bytes()
+    assert hashlib.sha256(stored).hexdigest() == sha
+    assert stored == original
@@ -0,0 +1,118 @@
+"""
+Golden tests for Parsing/expandTemplate.expand_template.
+
+The report template (.xlsm) and the VBA of Module1.C_P / Module2.C_P2 are not
+in the repository, so the golden file tests/golden/expand_template_3_systems.json
+is NOT macro output: it records the cells expand_template produces for the
+fixture template below (per-system regions taken from make_excel_report's
+write offsets) and guards that layout against regressions.
+
+test_matches_macro_golden compares expand_template on the real template
+(Parsing/취약점 진단 상세 보고서_0603.xlsm) with the workbooks the macros
+produced from it, tests/golden/macro_1_systems.xlsm and macro_3_systems.xlsm.
+Record those on a machine with Excel and xlwings:
+    python tests/golden/record_macro.py
+It is skipped while the template or the recordings are missing; until it
+passes, build_report keeps the macro path behind CCE_REPORT_MACRO=1.
+"""
+import json
+import os
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from Parsing.expandTemplate import expand_template
+from Parsing.parsingMain import TEMPLATE_FILE
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'golden')
+GOLDEN = os.path.join(GOLDEN_DIR, 'expand_template_3_systems.json')
+MACRO_GOLDEN = os.path.join(GOLDEN_DIR, 'macro_{}_systems.xlsm')
+
+
+def make_template():
+    # 시스템 1대분 영역만 있는 템플릿 (각 시트의 영역 밖 셀은 복제되지 않아야 함)
+    excel = Workbook()
+    excel.remove(excel.active)
+
+    sec_level = excel.create_sheet('보안 수준 통계')
+    sec_level['B7'] = '시스템명'
+    for row in range(9, 14):
+        sec_level.row_dimensions[row].height = 18
+        sec_level[f'E{row}'] = f'=C{row}'
+        sec_level[f'F{row}'] = '=$C$9'
+        sec_level[f'Q{row}'] = f'=SUM(K{row}:P{row})'
+    sec_level['A9'] = 1
+    sec_level['A9'].font = Font(bold=True)
+    sec_level.merge_cells('A9:A13')
+
+    inspect_target = excel.create_sheet('점검 대상(자산정보)')
+    inspect_target['B4'] = '번호'
+    inspect_target['F5'] = '=ROW()-4'
+    inspect_target['G5'] = '운영'
+    inspect_target['G5'].font = Font(bold=True)
+    inspect_target.row_dimensions[5].height = 20
+
+    summary = excel.create_sheet('요약 통계')
+    summary['P27'] = '시스템'
+    summary['P28'] = '-'
+    summary['Q28'] = '=P28'
+    summary['R28'] = '영역 밖'
+
+    stats = excel.create_sheet('항목별 통계')
+    stats['L4'] = '시스템'
+    for row in range(5, 41):
+        stats[f'L{row}'] = f'=IF(K{row}="양호",1,0)'
+    stats['L41'] = '영역 밖'
+    stats.column_dimensions['L'].width = 12
+    return excel
+
+
+def snapshot(excel):
+    # 비교 대상: 값(수식), 굵게 여부, 병합 셀, 행 높이, 열 너비
+    result = {}
+    for sheet in excel.worksheets:
+        cells = {}
+        for row in sheet.iter_rows():
+            for cell in row:
+                if cell.value is not None:
+                    cells[cell.coordinate] = [cell.value, bool(cell.font and cell.font.b)]
+        result[sheet.title] = {
+            'cells': cells,
+            'merged': sorted(str(merged) for merged in sheet.merged_cells.ranges),
+            'heights': {str(row): dim.height for row, dim in sorted(sheet.row_dimensions.items())
+                        if dim.height is not None},
+            'widths': {col: dim.width for col, dim in sorted(sheet.column_dimensions.items())
+                       if dim.customWidth},
+        }
+    return result
+
+
+def test_matches_golden():
+    excel = make_template()
+    expand_template(excel, 2)
+
+    with open(GOLDEN, encoding='utf-8') as f:
+        assert snapshot(excel) == json.load(f)
+
+
+def sheet_cells(sheet):
+    # 값이 있는 셀의 값(수식은 수식 문자열 그대로)
+    return {cell.coordinate: cell.value for row in sheet.iter_rows() for cell in row if cell.value is not None}
+
+
+@pytest.mark.parametrize('systems', [1, 3])
+def test_matches_macro_golden(systems):
+    golden = MACRO_GOLDEN.format(systems)
+    if not (os.path.exists(TEMPLATE_FILE) and os.path.exists(golden)):
+        pytest.skip(f'template or macro recording missing ({os.path.basename(golden)}), '
+                    'see tests/golden/record_macro.py')
+    excel = load_workbook(TEMPLATE_FILE)
+    expand_template(excel, systems - 1)
+    macro = load_workbook(golden)
+
+    assert excel.sheetnames == macro.sheetnames
+    for name in macro.sheetnames:
+        ours, theirs = excel[name], macro[name]
+        assert sorted(map(str, ours.merged_cells.ranges)) == sorted(map(str, theirs.merged_cells.ranges)), name
+        assert sheet_cells(ours) == sheet_cells(theirs), name
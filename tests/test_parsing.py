@@ -0,0 +1,60 @@
+"""Report generation from JSON results must render items like the CSV path (Parsing/parsingMain.py)."""
+import json
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from Parsing import parsingMain
+
+SHEETS = ('시스템 별 점검 결과', '항목별 통계', '보안 수준 통계', '점검 대상(자산정보)', '요약 통계')
+
+ITEMS = [
+    # (진단코드, JSON 항목, CSV 점검결과)
+    ('U-01', {'status': '양호', 'result': 0}, '양호'),
+    ('U-02', {'status': 'N/A', 'result': 2}, 'N/A'),
+    ('U-03', {'result': 2}, 'N/A'),
+    ('U-04', {'status': '취약', 'result': 1}, '취약'),
+    ('U-05', {'status': '인터뷰', 'result': 2}, '인터뷰'),
+]
+
+
+def make_template():
+    excel = Workbook()
+    excel.remove(excel.active)
+    for name in SHEETS:
+        excel.create_sheet(name)
+    return excel
+
+
+@pytest.fixture
+def report_dir(tmp_path, monkeypatch):
+    # 템플릿(.xlsm)은 저장소에 없으므로 필요한 시트만 있는 워크북으로 대체
+    monkeypatch.setattr(parsingMain, 'load_template', lambda excel_file: make_template())
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'result').mkdir()
+    return tmp_path
+
+
+def rendered(result_file):
+    excel = load_workbook(result_file)
+    system = excel['시스템별 점검 결과_host']
+    stats = excel['항목별 통계']
+    return [(system.cell(row=26 + i, column=10).value, system.cell(row=26 + i, column=11).value,
+             stats.cell(row=5 + i, column=12).value) for i in range(len(ITEMS))]
+
+
+def test_json_na_items_match_csv(report_dir):
+    document = {'targetip': '10.0.0.1', 'osinfo': 'CentOS', 'result': [
+        dict(item, itemcode=code, evidence='', resultdetail='') for code, item, _ in ITEMS]}
+    (report_dir / 'result' / 'host.json').write_text(json.dumps(document, ensure_ascii=False), encoding='utf-8')
+    json_cells = rendered(parsingMain.process_json_files())
+
+    (report_dir / 'result' / 'host.json').unlink()
+    rows = ['구분,진단코드,진단항목,취약도,점검결과,시스템 실제 결과값,상세설명 및 조치방안']
+    rows += [f'계정관리,{code},항목,상,{status},,' for code, _, status in ITEMS]
+    rows.append('10.0.0.1,CentOS,host,,,,')
+    (report_dir / 'result' / 'host.csv').write_text('\n'.join(rows) + '\n', encoding='utf-8')
+    csv_cells = rendered(parsingMain.process_csv_files())
+
+    assert json_cells[1] == json_cells[2] == ('N/A', '[ 시스템 현황 ]', 'N/A')
+    assert json_cells == csv_cells[:len(ITEMS)]
@@ -0,0 +1,120 @@
+"""
+U-02/U-03 verdict parity between the rule registry (Script/rules/linux.yaml),
+the reference shell checks (Script/linux/U-0x.sh) and the CentOS engine
+(Script/CentOS/CentOS_cce.sh), all run against the same fixture config.
+"""
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from check_engine import CheckRegistry, load_snapshot_dir
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINUX_DIR = os.path.join(ROOT, 'Script', 'linux')
+CENTOS_ENGINE = os.path.join(ROOT, 'Script', 'CentOS', 'CentOS_cce.sh')
+
+pytestmark = pytest.mark.skipif(shutil.which('bash') is None, reason='bash is required')
+
+FAILLOCK_5 = ("auth required pam_faillock.so preauth silent deny=5 unlock_time=600\n"
+              "auth [default=die] pam_faillock.so authfail deny=5 unlock_time=600\n")
+
+# (name, {path: content}, expected U-02, expected U-03)
+FIXTURES = [
+    ('two-credits-minlen-10',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1 dcredit=-1\n" + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5,
+      '/etc/security/pwquality.conf': "minlen=10\n"},
+     '양호', '양호'),
+    ('two-credits-minlen-9',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so ucredit=-1 ocredit=-1\n" + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5,
+      '/etc/security/pwquality.conf': "minlen=9\n"},
+     '취약', '양호'),
+    ('three-credits-minlen-8-deny-0',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1 ucredit=-1 dcredit=-1\n"
+                                + FAILLOCK_5.replace('deny=5', 'deny=0'),
+      '/etc/pam.d/password-auth': FAILLOCK_5,
+      '/etc/security/pwquality.conf': "# minlen = 9\nminlen=8\n"},
+     '양호', '양호'),
+    ('four-credits-minlen-7-authfail-6',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1 ucredit=-1 dcredit=-1 ocredit=-1\n"
+                                + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5.replace('authfail deny=5', 'authfail deny=6'),
+      '/etc/security/pwquality.conf': "minlen=7\n"},
+     '취약', '취약'),
+    ('one-credit-no-password-auth',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1\n" + FAILLOCK_5,
+      '/etc/security/pwquality.conf': "minlen=12\n"},
+     '취약', '취약'),
+    ('commented-settings',
+     {'/etc/pam.d/system-auth': "# lcredit ucredit dcredit\n# " + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5,
+      '/etc/security/pwquality.conf': "#minlen=8\n"},
+     '양호', '취약'),
+    ('duplicate-values',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1 ucredit=-1 dcredit=-1\n"
+                                + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5 + FAILLOCK_5.splitlines()[0] + "\n",
+      '/etc/security/pwquality.conf': "minlen=8\nminlen=12\n"},
+     '취약', '취약'),
+    ('no-minlen',
+     {'/etc/pam.d/system-auth': "password requisite pam_pwquality.so lcredit=-1 ucredit=-1 dcredit=-1\n"
+                                + FAILLOCK_5,
+      '/etc/pam.d/password-auth': FAILLOCK_5,
+      '/etc/security/pwquality.conf': "# minlen = 8\n"},
+     '취약', '양호'),
+]
+
+
+def write_snapshot(root, files):
+    for path, content in files.items():
+        target = os.path.join(root, path.lstrip('/'))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+def registry_verdicts(snapshot_dir):
+    items = CheckRegistry().evaluate(load_snapshot_dir(snapshot_dir))
+    return {item['itemcode']: item['status'] for item in items if item['itemcode'] in ('U-02', 'U-03')}
+
+
+def linux_verdicts(snapshot_dir):
+    verdicts = {}
+    for code in ('U-02', 'U-03'):
+        # cce_report 를 결과 출력만 하도록 대체 (U-0x.sh 는 이미 정의되어 있으면 report.sh 를 읽지 않음)
+        script = f'cce_report() {{ printf "%s\\n" "$5"; }}; source "{LINUX_DIR}/{code}.sh"'
+        out = subprocess.run(['bash', '-c', script], env=dict(os.environ, CCE_SNAPSHOT=snapshot_dir, LC_ALL='C.UTF-8'),
+                             capture_output=True, text=True, check=True).stdout
+        verdicts[code] = out.strip()
+    return verdicts
+
+
+def centos_verdicts(snapshot_dir):
+    # CentOS_cce.sh 는 실행 시 호스트 전체를 점검하므로 U-02/U-03 점검 함수만 읽어 스냅샷에 대해 실행
+    script = r'''
+declare -A CONF
+for f in /etc/pam.d/system-auth /etc/pam.d/password-auth /etc/security/pwquality.conf; do
+    [ -f "$CCE_SNAPSHOT$f" ] && CONF[$f]=$(<"$CCE_SNAPSHOT$f")
+done
+source <(sed -n '/^conf_grep() {/,/^}/p; /^check_U_0[23]() {/,/^}/p' "$ENGINE")
+check_U_02; echo "$STATUS"
+check_U_03; echo "$STATUS"
+'''
+    out = subprocess.run(['bash', '-c', script],
+                         env=dict(os.environ, CCE_SNAPSHOT=snapshot_dir, ENGINE=CENTOS_ENGINE, LC_ALL='C'),
+                         capture_output=True, text=True, check=True).stdout
+    return dict(zip(('U-02', 'U-03'), out.split()))
+
+
+@pytest.mark.parametrize('name, files, u02, u03', FIXTURES, ids=[f[0] for f in FIXTURES])
+def test_verdicts_match_shell_checks(tmp_path, name, files, u02, u03):
+    snapshot_dir = str(tmp_path)
+    write_snapshot(snapshot_dir, files)
+    expected = {'U-02': u02, 'U-03': u03}
+
+    assert linux_verdicts(snapshot_dir) == expected
+    assert registry_verdicts(snapshot_dir) == expected
+    assert centos_verdicts(snapshot_dir) == expected